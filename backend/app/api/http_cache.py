@@ -0,0 +1,53 @@
+"""
+Quantum Chess Ultimate - HTTP Response Caching
+
+Version-keyed caching for read-only game endpoints. Each game carries a
+mutation counter, so cached payloads and ETags stay valid exactly until
+the next move or measurement — no wall-clock expiry involved.
+"""
+
+from typing import Any, Callable, Optional
+
+import orjson
+from fastapi import Request, Response
+
+
+def game_etag(game) -> str:
+    """Strong ETag for the current version of a game."""
+    return f'"{game.game_id}-{game.version}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def _encode(content: Any) -> bytes:
+    if isinstance(content, bytes):
+        return content
+    return orjson.dumps(content, option=orjson.OPT_SERIALIZE_NUMPY)
+
+
+def cached_json_response(request: Request, game, build: Callable[[], Any],
+                         cache_key: Optional[str] = None) -> Response:
+    """
+    Serve a read-only game payload.
+
+    Answers 304 Not Modified when the client already holds the current
+    version. Otherwise `build` produces the body (encoded JSON bytes or a
+    JSON-serializable object); with a cache_key the encoded body is kept on
+    the game until its next mutation.
+    """
+    etag = game_etag(game)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+
+    if cache_key is None:
+        content = _encode(build())
+    else:
+        content = game.cached_payload(cache_key, lambda: _encode(build()))
+    return Response(content=content, media_type="application/json", headers=headers)
@@ -4,12 +4,17 @@ Quantum Chess Ultimate - Analysis API Routes
 REST endpoints for position analysis and probability calculations.
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request
+from typing import Optional
 
-from app.core.evaluator import PositionEvaluator
+from app.api.http_cache import cached_json_response
+from app.models.move import SquaresRequest
 
 router = APIRouter(prefix="/api/analysis", tags=["Analysis"])
 
+# Largest page of move history served per request
+MAX_HISTORY_PAGE = 500
+
 _game_manager = None
 
 
@@ -32,23 +37,12 @@ async def analyze_position(game_id: str):
     if not game:
         raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
 
-    white_eval = PositionEvaluator.evaluate(
-        board=game.engine.board,
-        superposition_squares=game.engine.superposition_squares,
-        entanglement_pairs=game.engine.entanglement_pairs,
-        color="white",
-    )
-    black_eval = PositionEvaluator.evaluate(
-        board=game.engine.board,
-        superposition_squares=game.engine.superposition_squares,
-        entanglement_pairs=game.engine.entanglement_pairs,
-        color="black",
-    )
+    evals = gm.evaluate_position(game_id)
 
     return {
         "game_id": game_id,
-        "white": white_eval,
-        "black": black_eval,
+        "white": evals["white"],
+        "black": evals["black"],
         "move_count": game.move_count,
         "superposition_count": len(game.engine.superposition_squares),
         "entanglement_count": len(game.engine.entanglement_pairs),
@@ -56,44 +50,79 @@ async def analyze_position(game_id: str):
 
 
 @router.get("/{game_id}/history")
-async def get_move_history(game_id: str):
-    """Get the move history for a game."""
+async def get_move_history(
+    game_id: str,
+    request: Request,
+    offset: int = Query(default=0, ge=0),
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_HISTORY_PAGE),
+):
+    """Get the move history for a game, optionally one page of it."""
     gm = get_gm()
     game = gm.get_game(game_id)
     if not game:
         raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
 
-    return {
+    # Clamp to the history so every request for the same slice shares one
+    # cached payload, however far past the end the client pages
+    count = len(game.history)
+    offset = min(offset, count)
+    stop = count if limit is None else min(offset + limit, count)
+    return cached_json_response(request, game, lambda: {
         "game_id": game_id,
         "move_count": game.move_count,
-        "moves": game.move_history,
+        "moves": game.history.as_dicts(offset, stop),
         "captured_pieces": game.captured_pieces,
-    }
+    }, cache_key=f"history:{offset}:{stop}")
 
 
 @router.get("/{game_id}/probability/{square}")
-async def get_square_probability(game_id: str, square: str):
+async def get_square_probability(game_id: str, square: str, request: Request):
     """Get probability distribution for a specific square."""
     gm = get_gm()
     game = gm.get_game(game_id)
     if not game:
         raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
 
+    # Not stored per version: the payload is one board lookup, but the
+    # ETag still lets pollers get a 304
+    return cached_json_response(
+        request, game,
+        lambda: {"game_id": game_id, **_square_probability(game, square)},
+    )
+
+
+@router.post("/{game_id}/probability/batch")
+async def get_square_probabilities(game_id: str, request: SquaresRequest):
+    """Get probability information for several squares in one request."""
+    gm = get_gm()
+    game = gm.get_game(game_id)
+    if not game:
+        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+
+    return {
+        "game_id": game_id,
+        "squares": {
+            square: _square_probability(game, square)
+            for square in request.squares
+        },
+    }
+
+
+def _square_probability(game, square: str) -> dict:
+    """Probability payload for a single square."""
     piece = game.engine.board.get(square)
     if piece is None:
         return {
-            "game_id": game_id,
             "square": square,
             "occupied": False,
             "probability": 0.0,
         }
 
     return {
-        "game_id": game_id,
         "square": square,
         "occupied": True,
         "piece_type": piece["type"],
         "color": piece["color"],
-        "in_superposition": piece.get("in_superposition", False),
-        "probability": piece.get("probability", 1.0),
+        "in_superposition": piece["in_superposition"],
+        "probability": piece["probability"],
     }
@@ -7,14 +7,22 @@ REST endpoints for game management:
 - List active games
 """
 
-from fastapi import APIRouter, HTTPException
+import orjson
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse, Response
+from pydantic import TypeAdapter
 from typing import Optional
 
-from app.models.game import GameConfig, GameState, GameCreateResponse
-from app.models.move import Move, MoveResult, LegalMovesResponse
+from app.api.http_cache import cached_json_response
+from app.models.game import GameConfig, GameState, GameCreateResponse, GameSummary
+from app.models.move import Move, MoveResult, LegalMovesResponse, SquaresRequest
 
 router = APIRouter(prefix="/api/game", tags=["Game"])
 
+# Encodes the listing in one pydantic-core call, without the per-model
+# jsonable_encoder walk FastAPI applies to returned models
+_summaries_json = TypeAdapter(list[GameSummary]).dump_json
+
 # Game manager is injected from main.py via app.state
 _game_manager = None
 
@@ -34,18 +42,24 @@ def get_gm():
 async def create_game(config: Optional[GameConfig] = None):
     """Create a new quantum chess game."""
     gm = get_gm()
-    state = gm.create_game(config)
-    return GameCreateResponse(game_id=state.game_id, state=state)
+    game = gm.new_game(config)
+    # Wrap the game's cached state JSON (which the first GET then reuses)
+    # rather than building a GameState model for FastAPI to encode
+    return Response(
+        b'{"game_id":' + orjson.dumps(game.game_id) + b',"state":'
+        + game.get_state_json() + b"}",
+        media_type="application/json",
+    )
 
 
 @router.get("/{game_id}", response_model=GameState)
-async def get_game(game_id: str):
+async def get_game(game_id: str, request: Request):
     """Get current game state."""
     gm = get_gm()
-    state = gm.get_state(game_id)
-    if not state:
+    game = gm.get_game(game_id)
+    if not game:
         raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
-    return state
+    return cached_json_response(request, game, game.get_state_json)
 
 
 @router.post("/{game_id}/move", response_model=MoveResult)
@@ -55,7 +69,9 @@ async def make_move(game_id: str, move: Move):
     result = gm.make_move(game_id, move)
     if result is None:
         raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
-    return result
+    # orjson encodes the MoveOutcome dataclass natively; response_model
+    # only documents the shape
+    return ORJSONResponse(result)
 
 
 @router.get("/{game_id}/legal-moves/{square}", response_model=LegalMovesResponse)
@@ -65,17 +81,29 @@ async def get_legal_moves(game_id: str, square: str):
     moves = gm.get_legal_moves(game_id, square)
     if moves is None:
         raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
-    return LegalMovesResponse(square=square, legal_moves=moves)
+    return ORJSONResponse({"square": square, "legal_moves": moves, "quantum_moves": []})
+
+
+@router.post("/{game_id}/legal-moves/batch")
+async def get_legal_moves_batch(game_id: str, request: SquaresRequest):
+    """Get legal moves for several squares in one request."""
+    gm = get_gm()
+    moves = gm.get_legal_moves_batch(game_id, request.squares)
+    if moves is None:
+        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+    return {"game_id": game_id, "legal_moves": moves}
 
 
 @router.get("/{game_id}/all-legal-moves")
 async def get_all_legal_moves(game_id: str):
     """Get all legal moves for the current player."""
     gm = get_gm()
+    # Generated in one pass over a single position; a streamed response
+    # would read the live engine across awaits while moves land
     moves = gm.get_all_legal_moves(game_id)
     if moves is None:
         raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
-    return {"game_id": game_id, "moves": moves}
+    return ORJSONResponse({"game_id": game_id, "moves": moves})
 
 
 @router.delete("/{game_id}")
@@ -88,8 +116,8 @@ async def delete_game(game_id: str):
     return {"message": f"Game {game_id} deleted"}
 
 
-@router.get("/", response_model=list)
+@router.get("/", response_model=list[GameSummary])
 async def list_games():
     """List all active games."""
     gm = get_gm()
-    return gm.list_games()
+    return Response(_summaries_json(gm.list_games()), media_type="application/json")
@@ -8,7 +8,8 @@ REST endpoints for quantum operations:
 - Find best moves
 """
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import ORJSONResponse, Response
 from pydantic import BaseModel
 from typing import Optional
 
@@ -16,6 +17,7 @@ from app.models.quantum import (
     QuantumMeasurement, CircuitInfo, SuperpositionState,
     QuantumEvaluation,
 )
+from app.api.http_cache import cached_json_response
 from app.core.evaluator import PositionEvaluator
 from app.services.circuit_optimizer import CircuitOptimizer
 
@@ -51,10 +53,12 @@ async def evaluate_position(game_id: str):
         board=game.engine.board,
         superposition_squares=game.engine.superposition_squares,
         entanglement_pairs=game.engine.entanglement_pairs,
+        positional=game.engine.positional_score,
+        arrays=game.engine.arrays,
         color=game.turn.value,
     )
 
-    return QuantumEvaluation(
+    evaluation = QuantumEvaluation(
         game_id=game_id,
         classical_score=eval_result["classical_score"],
         quantum_score=eval_result["quantum_score"],
@@ -63,13 +67,15 @@ async def evaluate_position(game_id: str):
         evaluation_depth=game.engine.search_depth,
         samples_taken=game.engine.shots,
     )
+    # Already validated; skip FastAPI's revalidate-and-encode pass
+    return Response(evaluation.model_dump_json(), media_type="application/json")
 
 
 @router.get("/{game_id}/best-move")
 async def get_best_move(game_id: str):
     """Find the best move using quantum minimax."""
     gm = get_gm()
-    result = gm.find_best_move(game_id)
+    result = await gm.find_best_move_shared(game_id)
     if result is None:
         raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
     return {"game_id": game_id, **result}
@@ -83,37 +89,43 @@ async def measure(game_id: str, request: MeasureRequest):
         result = gm.measure_square(game_id, request.square)
         if result is None:
             raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
-        return {"game_id": game_id, "measured": {request.square: result}}
+        return ORJSONResponse({"game_id": game_id, "measured": {request.square: result}})
     else:
         results = gm.measure_all(game_id)
         if results is None:
             raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
-        return {"game_id": game_id, "measured": results}
+        # Encoded once by orjson, without FastAPI's jsonable_encoder pass
+        return ORJSONResponse({"game_id": game_id, "measured": results})
 
 
 @router.get("/{game_id}/circuit")
-async def get_circuit_info(game_id: str):
+async def get_circuit_info(game_id: str, request: Request):
     """Get quantum circuit information for a game."""
     gm = get_gm()
     game = gm.get_game(game_id)
     if not game:
         raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
 
-    circuit_info = game.engine.get_circuit_info()
-    analysis = CircuitOptimizer.analyze_circuit(
-        circuit_info["superposition_count"],
-        circuit_info["entanglement_count"],
-    )
-    return {"game_id": game_id, **analysis}
+    def build():
+        circuit_info = game.engine.get_circuit_info()
+        analysis = CircuitOptimizer.analyze_circuit(
+            circuit_info["superposition_count"],
+            circuit_info["entanglement_count"],
+        )
+        return {"game_id": game_id, **analysis}
+
+    return cached_json_response(request, game, build, cache_key="circuit")
 
 
 @router.get("/{game_id}/superposition")
-async def get_superposition_states(game_id: str):
+async def get_superposition_states(game_id: str, request: Request):
     """Get all superposition states in a game."""
     gm = get_gm()
     game = gm.get_game(game_id)
     if not game:
         raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
 
-    states = game.engine.get_superposition_states()
-    return {"game_id": game_id, "superposition_states": states}
+    return cached_json_response(request, game, lambda: {
+        "game_id": game_id,
+        "superposition_states": game.engine.get_superposition_states(),
+    }, cache_key="superposition")
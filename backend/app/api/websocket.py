@@ -4,60 +4,85 @@ Quantum Chess Ultimate - WebSocket Handler
 Manages real-time WebSocket connections for live game updates.
 """
 
-import json
+import asyncio
+import dataclasses
 import logging
+
+import orjson
 from fastapi import WebSocket, WebSocketDisconnect
 
 logger = logging.getLogger(__name__)
 
 
+def _state_update_message(state_json: bytes) -> bytes:
+    """Wrap pre-encoded GameState JSON in a state_update message."""
+    return b'{"type":"state_update","data":' + state_json + b"}"
+
+
 class ConnectionManager:
     """Manages WebSocket connections per game."""
 
     def __init__(self):
-        self.active_connections: dict[str, list[WebSocket]] = {}
+        self.active_connections: dict[str, set[WebSocket]] = {}
 
     async def connect(self, game_id: str, websocket: WebSocket):
         """Accept and register a WebSocket connection for a game."""
         await websocket.accept()
-        if game_id not in self.active_connections:
-            self.active_connections[game_id] = []
-        self.active_connections[game_id].append(websocket)
-        logger.info(f"WebSocket connected for game {game_id}")
+        self.active_connections.setdefault(game_id, set()).add(websocket)
+        logger.info("WebSocket connected for game %s", game_id)
 
     def disconnect(self, game_id: str, websocket: WebSocket):
         """Remove a WebSocket connection."""
-        if game_id in self.active_connections:
-            self.active_connections[game_id].remove(websocket)
-            if not self.active_connections[game_id]:
+        connections = self.active_connections.get(game_id)
+        if connections is not None:
+            connections.discard(websocket)
+            if not connections:
                 del self.active_connections[game_id]
-        logger.info(f"WebSocket disconnected for game {game_id}")
+        logger.info("WebSocket disconnected for game %s", game_id)
 
     async def broadcast(self, game_id: str, message: dict):
         """Broadcast a message to all connections for a game."""
         if game_id not in self.active_connections:
             return
+        await self.broadcast_bytes(game_id, orjson.dumps(message))
+
+    async def broadcast_bytes(self, game_id: str, payload: bytes):
+        """Broadcast an already JSON-encoded message to a game."""
+        if game_id not in self.active_connections:
+            return
+
+        # Decode once for all recipients; sent as a text frame like send_json
+        text = payload.decode()
 
-        dead_connections = []
-        for connection in self.active_connections[game_id]:
-            try:
-                await connection.send_json(message)
-            except Exception:
-                dead_connections.append(connection)
+        # Send concurrently so one slow peer does not delay the others
+        connections = list(self.active_connections[game_id])
+        results = await asyncio.gather(
+            *(connection.send_text(text) for connection in connections),
+            return_exceptions=True,
+        )
 
-        for conn in dead_connections:
-            self.active_connections[game_id].remove(conn)
+        dead_connections = {
+            conn for conn, result in zip(connections, results)
+            if isinstance(result, Exception)
+        }
+        if dead_connections:
+            # The game's set may have changed while the sends were in flight
+            remaining = self.active_connections.get(game_id)
+            if remaining is not None:
+                remaining -= dead_connections
+                if not remaining:
+                    del self.active_connections[game_id]
 
     async def send_personal(self, websocket: WebSocket, message: dict):
         """Send a message to a specific connection."""
         try:
-            await websocket.send_json(message)
+            await websocket.send_text(orjson.dumps(message).decode())
         except Exception as e:
-            logger.error(f"Failed to send personal message: {e}")
+            logger.error("Failed to send personal message: %s", e)
 
     def get_connection_count(self, game_id: str) -> int:
         """Get number of active connections for a game."""
-        return len(self.active_connections.get(game_id, []))
+        return len(self.active_connections.get(game_id, ()))
 
     def get_total_connections(self) -> int:
         """Get total active connections across all games."""
@@ -90,17 +115,16 @@ async def handle_websocket_message(
         if result:
             response = {
                 "type": "move_result",
-                "data": result.model_dump(),
+                "data": dataclasses.asdict(result),
             }
             await ws_manager.broadcast(game_id, response)
 
             # Also send updated state
-            state = game_manager.get_state(game_id)
-            if state:
-                await ws_manager.broadcast(game_id, {
-                    "type": "state_update",
-                    "data": state.model_dump(mode="json"),
-                })
+            state_json = game_manager.get_state_json(game_id)
+            if state_json:
+                await ws_manager.broadcast_bytes(
+                    game_id, _state_update_message(state_json)
+                )
 
     elif msg_type == "measure":
         square = data.get("square")
@@ -121,6 +145,8 @@ async def handle_websocket_message(
                 board=game.engine.board,
                 superposition_squares=game.engine.superposition_squares,
                 entanglement_pairs=game.engine.entanglement_pairs,
+                positional=game.engine.positional_score,
+                arrays=game.engine.arrays,
                 color=game.turn.value,
             )
             await ws_manager.broadcast(game_id, {
@@ -137,12 +163,11 @@ async def handle_websocket_message(
         })
 
     elif msg_type == "state":
-        state = game_manager.get_state(game_id)
-        if state:
-            await ws_manager.broadcast(game_id, {
-                "type": "state_update",
-                "data": state.model_dump(mode="json"),
-            })
+        state_json = game_manager.get_state_json(game_id)
+        if state_json:
+            await ws_manager.broadcast_bytes(
+                game_id, _state_update_message(state_json)
+            )
 
     else:
-        logger.warning(f"Unknown WebSocket message type: {msg_type}")
+        logger.warning("Unknown WebSocket message type: %s", msg_type)
@@ -5,7 +5,7 @@ Uses pydantic-settings for environment variable management.
 
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
-from functools import lru_cache
+from functools import cached_property, lru_cache
 import sys
 
 
@@ -44,8 +44,9 @@ class Settings(BaseSettings):
     # Logging
     LOG_LEVEL: str = "info"
 
-    @property
+    @cached_property
     def cors_origins_list(self) -> list[str]:
+        """Parsed CORS_ORIGINS, computed once per Settings instance."""
         return [origin.strip() for origin in self.CORS_ORIGINS.split(",")]
 
     model_config = {
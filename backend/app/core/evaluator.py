@@ -6,6 +6,10 @@ with quantum state analysis.
 """
 
 import logging
+from functools import lru_cache
+from typing import NamedTuple, Sequence
+
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -73,6 +77,135 @@ PIECE_BASE_VALUES = {
     "king": 20000,
 }
 
+# ─── Vectorized Lookup Tables ─────────────────────────────────────────────────
+# Boards are evaluated as a structure of arrays (one entry per square), and
+# every score component is a NumPy reduction over those arrays.
+
+PIECE_ID = {piece_type: i for i, piece_type in enumerate(PIECE_BASE_VALUES)}
+COLOR_ID = {"white": 0, "black": 1}
+EMPTY_COLOR = 2
+
+SQUARE_INDEX = {
+    f"{file}{rank}": (rank - 1) * 8 + col
+    for col, file in enumerate("abcdefgh")
+    for rank in range(1, 9)
+}
+ALL_SQUARES = np.arange(64)
+
+BASE = np.array(list(PIECE_BASE_VALUES.values()), dtype=np.float64)
+SIGN = np.array([1.0, -1.0, 0.0])  # indexed by color id; empty squares are 0
+
+
+def _build_psqt() -> np.ndarray:
+    """
+    Stack the piece-square tables into a (color, piece, square) array.
+
+    The tables are written from white's perspective with rank 8 first, so
+    white's entries are flipped vertically and black's are used as-is.
+    Pieces without a table (rook, queen) and empty squares contribute zero.
+    """
+    psqt = np.zeros((len(SIGN), len(PIECE_ID), 64), dtype=np.float32)
+    for piece_type, table in PIECE_TABLES.items():
+        grid = np.array(table, dtype=np.float32)
+        psqt[COLOR_ID["white"], PIECE_ID[piece_type]] = grid[::-1].ravel()
+        psqt[COLOR_ID["black"], PIECE_ID[piece_type]] = grid.ravel()
+    return psqt
+
+
+PSQT = _build_psqt()
+
+# Color sign and scale folded in ahead of time, so material and positional
+# scores are a single gather and reduction each: (color, piece) and
+# (color, piece, square), positive favouring white.
+SIGNED_BASE = SIGN[:, None] * BASE
+SIGNED_PSQT = PSQT.astype(np.float64) * SIGN[:, None, None] * 10
+
+# The same positional values flattened into one dict keyed by
+# (color, piece type, square), for callers that update the positional score
+# one piece at a time.
+SIGNED_PSQ = {
+    (color, piece_type, square): float(SIGNED_PSQT[c, p, i])
+    for color, c in COLOR_ID.items()
+    for piece_type, p in PIECE_ID.items()
+    for square, i in SQUARE_INDEX.items()
+}
+
+
+class BoardArrays(NamedTuple):
+    """
+    Structure-of-arrays view of a board, indexed by square (a1 = 0, h8 = 63).
+
+    piece_type holds PIECE_ID values (0 for empty), color holds COLOR_ID
+    values (EMPTY_COLOR for empty) and probability the piece's existence
+    probability.
+    """
+    piece_type: np.ndarray
+    color: np.ndarray
+    probability: np.ndarray
+
+    @classmethod
+    def empty(cls) -> "BoardArrays":
+        return cls(
+            np.zeros(64, dtype=np.int8),
+            np.full(64, EMPTY_COLOR, dtype=np.int8),
+            np.ones(64, dtype=np.float64),
+        )
+
+    @classmethod
+    def from_board(cls, board: dict) -> "BoardArrays":
+        """Build the arrays from a square -> piece dict."""
+        arrays = cls.empty()
+        n = len(board)
+        pieces = board.values()
+        squares = np.fromiter(
+            (SQUARE_INDEX[sq] for sq in board), dtype=np.intp, count=n
+        )
+        arrays.piece_type[squares] = np.fromiter(
+            (PIECE_ID.get(p["type"], 0) for p in pieces), dtype=np.int8, count=n
+        )
+        arrays.color[squares] = np.fromiter(
+            (COLOR_ID[p["color"]] for p in pieces), dtype=np.int8, count=n
+        )
+        arrays.probability[squares] = np.fromiter(
+            (p.get("probability", 1.0) for p in pieces), dtype=np.float64, count=n
+        )
+        return arrays
+
+    @classmethod
+    def from_key(cls, key: tuple[bytes, bytes, bytes]) -> "BoardArrays":
+        """Inverse of key(); the returned arrays are read-only."""
+        types, colors, probs = key
+        return cls(
+            np.frombuffer(types, dtype=np.int8),
+            np.frombuffer(colors, dtype=np.int8),
+            np.frombuffer(probs, dtype=np.float64),
+        )
+
+    def key(self) -> tuple[bytes, bytes, bytes]:
+        """Hashable fingerprint of the board contents."""
+        return (
+            self.piece_type.tobytes(),
+            self.color.tobytes(),
+            self.probability.tobytes(),
+        )
+
+    def set_square(self, square: str, piece: dict | None):
+        """Write a single square from its piece dict (None for empty)."""
+        i = SQUARE_INDEX[square]
+        if piece is None:
+            self.piece_type[i] = 0
+            self.color[i] = EMPTY_COLOR
+            self.probability[i] = 1.0
+        else:
+            self.piece_type[i] = PIECE_ID.get(piece["type"], 0)
+            self.color[i] = COLOR_ID[piece["color"]]
+            self.probability[i] = piece.get("probability", 1.0)
+
+    def copy(self) -> "BoardArrays":
+        return BoardArrays(
+            self.piece_type.copy(), self.color.copy(), self.probability.copy()
+        )
+
 
 class PositionEvaluator:
     """
@@ -82,19 +215,102 @@ class PositionEvaluator:
 
     @staticmethod
     def evaluate(board: dict, superposition_squares: set,
-                 entanglement_pairs: list, color: str = "white") -> dict:
+                 entanglement_pairs: list, color: str = "white",
+                 positional: float | None = None,
+                 arrays: BoardArrays | None = None) -> dict:
         """
         Full position evaluation.
 
         Returns a dict with classical_score, quantum_score,
         combined_score, and component breakdown.
+
+        Results are memoized on a fingerprint of the inputs, so repeated
+        calls for an unchanged position are a cache lookup. Callers that
+        already hold the board as BoardArrays, or track the positional score
+        incrementally (see EnhancedQuantumChessEngine), may pass those in to
+        skip the corresponding work. `board` is only read when `arrays` is
+        not given.
+        """
+        components = PositionEvaluator._components(
+            board, superposition_squares, entanglement_pairs, positional, arrays
+        )
+        return PositionEvaluator._format(components, color)
+
+    @staticmethod
+    def evaluate_both(board: dict, superposition_squares: set,
+                      entanglement_pairs: list,
+                      positional: float | None = None,
+                      arrays: BoardArrays | None = None) -> dict:
+        """
+        Evaluate the position for both colors at once.
+
+        Black's scores are the negation of white's, so the components are
+        computed a single time. Returns {"white": ..., "black": ...}.
         """
-        material = PositionEvaluator._material_score(board)
-        positional = PositionEvaluator._positional_score(board)
-        mobility = PositionEvaluator._mobility_score(board)
+        components = PositionEvaluator._components(
+            board, superposition_squares, entanglement_pairs, positional, arrays
+        )
+        return {
+            "white": PositionEvaluator._format(components, "white"),
+            "black": PositionEvaluator._format(components, "black"),
+        }
+
+    @staticmethod
+    def piece_square_value(piece_type: str, color: str, square: str) -> float:
+        """
+        Signed positional contribution of one piece, in the same units as
+        the positional component (positive favours white).
+        """
+        return SIGNED_PSQ.get((color, piece_type, square), 0.0)
+
+    @staticmethod
+    def _components(board: dict, superposition_squares: set,
+                    entanglement_pairs: list,
+                    positional: float | None = None,
+                    arrays: BoardArrays | None = None) -> tuple[float, float, float, float]:
+        """(material, positional, mobility, quantum) from white's perspective."""
+        if arrays is None:
+            arrays = BoardArrays.from_board(board)
+        components = _components_cached(
+            arrays.key(),
+            superposition_bitboard(superposition_squares),
+            tuple(sorted(tuple(pair) for pair in entanglement_pairs)),
+            positional is None,
+        )
+        if positional is not None:
+            material, _, mobility, quantum = components
+            return material, positional, mobility, quantum
+        return components
+
+    @staticmethod
+    def _compute_components(arrays: BoardArrays, superposition_bb: int,
+                            entanglement_pairs: Sequence[tuple[str, str]],
+                            with_positional: bool = True) -> tuple[float, float, float, float]:
+        """
+        Compute raw score components without consulting the cache.
+
+        superposition_bb holds the superposed squares as packed by
+        superposition_bitboard(). With with_positional=False the
+        piece-square scan is skipped and the positional component is
+        reported as 0.0.
+        """
+        sign = SIGN[arrays.color]
+
+        material = PositionEvaluator._material_score(arrays)
+        positional = 0.0
+        if with_positional:
+            positional = PositionEvaluator._positional_score(arrays)
+        mobility = PositionEvaluator._mobility_score(sign)
         quantum = PositionEvaluator._quantum_score(
-            board, superposition_squares, entanglement_pairs
+            arrays, sign, superposition_bb, entanglement_pairs
         )
+        return material, positional, mobility, quantum
+
+    @staticmethod
+    def _format(components: tuple[float, float, float, float],
+                color: str) -> dict:
+        """Build the evaluation dict for one color from raw components."""
+        material, positional, mobility, quantum = components
 
         classical_score = material + positional + mobility
         quantum_score = quantum
@@ -119,85 +335,82 @@ class PositionEvaluator:
         }
 
     @staticmethod
-    def _material_score(board: dict) -> float:
+    def _material_score(arrays: BoardArrays) -> float:
         """Calculate material balance."""
-        score = 0.0
-        for _, piece in board.items():
-            value = PIECE_BASE_VALUES.get(piece["type"], 0)
-            probability = piece.get("probability", 1.0)
-            adjusted = value * probability
-
-            if piece["color"] == "white":
-                score += adjusted
-            else:
-                score -= adjusted
-        return score
+        values = SIGNED_BASE[arrays.color, arrays.piece_type]
+        return float((values * arrays.probability).sum())
 
     @staticmethod
-    def _positional_score(board: dict) -> float:
+    def _positional_score(arrays: BoardArrays) -> float:
         """Calculate positional score using piece-square tables."""
-        score = 0.0
-        for square, piece in board.items():
-            table = PIECE_TABLES.get(piece["type"])
-            if table is None:
-                continue
-
-            col = ord(square[0]) - ord("a")
-            row = int(square[1]) - 1
-
-            if piece["color"] == "white":
-                value = table[7 - row][col]
-                score += value
-            else:
-                value = table[row][col]
-                score -= value
-
-        return score * 10  # Scale factor
+        return float(SIGNED_PSQT[arrays.color, arrays.piece_type, ALL_SQUARES].sum())
 
     @staticmethod
-    def _mobility_score(board: dict) -> float:
+    def _mobility_score(sign: np.ndarray) -> float:
         """
         Simplified mobility estimate.
         Full mobility requires engine's move generation.
         """
-        white_pieces = sum(1 for p in board.values() if p["color"] == "white")
-        black_pieces = sum(1 for p in board.values() if p["color"] == "black")
-        return (white_pieces - black_pieces) * 10
+        return float(sign.sum()) * 10
 
     @staticmethod
-    def _quantum_score(board: dict, superposition_squares: set,
-                       entanglement_pairs: list) -> float:
+    def _quantum_score(arrays: BoardArrays, sign: np.ndarray,
+                       superposition_bb: int,
+                       entanglement_pairs: Sequence[tuple[str, str]]) -> float:
         """
         Evaluate quantum state advantages.
 
         Superposition pieces provide tactical flexibility.
         Entanglement pairs provide coordination bonuses.
         """
-        score = 0.0
-
-        for square in superposition_squares:
-            piece = board.get(square, {})
-            if not piece:
-                continue
-            prob = piece.get("probability", 0.5)
-            # Uncertainty bonus — superposition provides optionality
-            uncertainty_bonus = 50 * (1 - abs(2 * prob - 1))
-
-            if piece.get("color") == "white":
-                score += uncertainty_bonus
-            else:
-                score -= uncertainty_bonus
-
-        # Entanglement coordination bonus
-        for sq1, sq2 in entanglement_pairs:
-            p1 = board.get(sq1, {})
-            p2 = board.get(sq2, {})
-            if p1.get("color") == p2.get("color"):
-                # Same-color entanglement is advantageous
-                bonus = 30
-                if p1.get("color") == "white":
-                    score += bonus
-                else:
-                    score -= bonus
+        # Most positions carry no quantum state at all
+        if not superposition_bb and not entanglement_pairs:
+            return 0.0
+
+        # Uncertainty bonus — superposition provides optionality
+        sp = np.array(bitboard_indices(superposition_bb), dtype=np.intp)
+        prob = arrays.probability[sp]
+        score = float((sign[sp] * 50 * (1 - np.abs(2 * prob - 1))).sum())
+
+        # Entanglement coordination bonus — same-color pairs are advantageous
+        n = len(entanglement_pairs)
+        sq1 = np.fromiter(
+            (SQUARE_INDEX[a] for a, _ in entanglement_pairs), dtype=np.intp, count=n
+        )
+        sq2 = np.fromiter(
+            (SQUARE_INDEX[b] for _, b in entanglement_pairs), dtype=np.intp, count=n
+        )
+        same_color = arrays.color[sq1] == arrays.color[sq2]
+        score += float((30 * sign[sq1] * same_color).sum())
 
         return score
+
+
+def superposition_bitboard(squares) -> int:
+    """Pack a collection of squares into a 64-bit int, bit i = square index i."""
+    bb = 0
+    for square in squares:
+        bb |= 1 << SQUARE_INDEX[square]
+    return bb
+
+
+def bitboard_indices(bb: int) -> list[int]:
+    """Square indices of the set bits in a bitboard, in ascending order."""
+    indices = []
+    while bb:
+        lsb = bb & -bb
+        indices.append(lsb.bit_length() - 1)
+        bb ^= lsb
+    return indices
+
+
+@lru_cache(maxsize=4096)
+def _components_cached(board_key: tuple[bytes, bytes, bytes],
+                       superposition_key: int,
+                       entanglement_key: tuple[tuple[str, str], ...],
+                       with_positional: bool = True) -> tuple[float, float, float, float]:
+    """LRU-cached score components keyed by BoardArrays.key()."""
+    return PositionEvaluator._compute_components(
+        BoardArrays.from_key(board_key), superposition_key, entanglement_key,
+        with_positional,
+    )
@@ -6,19 +6,90 @@ captured pieces, and coordinates between the quantum engine and
 the move validator.
 """
 
-from typing import Optional
+from typing import Callable, Optional
 from datetime import datetime
 import logging
+import random
+import time
 
-from app.core.quantum_engine import EnhancedQuantumChessEngine
+import orjson
+
+from app.core.move_validator import PROMOTION_MASK, SQUARE_TO_INDEX
+from app.core.quantum_engine import (
+    EnhancedQuantumChessEngine, ZOBRIST_BLACK_TO_MOVE,
+)
 from app.models.game import (
-    GameConfig, GameState, GameStatus, GameMode,
-    PieceColor, PieceInfo, PieceType,
+    GameConfig, GameState, GameStatus, GameMode, GameSummary,
+    PieceColor,
 )
-from app.models.move import Move, MoveResult
+from app.models.move import Move, MoveOutcome
 
 logger = logging.getLogger(__name__)
 
+# Side to move, indexed by "is it white's turn"
+_TURN = (PieceColor.BLACK, PieceColor.WHITE)
+_TURN_COLOR = ("black", "white")
+
+
+class MoveHistory:
+    """
+    Moves played in a game, stored column-wise: one list per field
+    rather than a dict per move. Dicts are only built for serialization,
+    and since moves are only ever appended each one is built once.
+    """
+
+    __slots__ = ("from_squares", "to_squares", "pieces", "colors",
+                 "captured", "quantum_events", "_dicts")
+
+    def __init__(self):
+        self.from_squares: list[str] = []
+        self.to_squares: list[str] = []
+        self.pieces: list[str] = []
+        self.colors: list[str] = []
+        self.captured: list[Optional[str]] = []
+        self.quantum_events: list[Optional[str]] = []
+        # as_dicts() output for the first len(_dicts) moves
+        self._dicts: list[dict] = []
+
+    def __len__(self) -> int:
+        return len(self.from_squares)
+
+    def append(self, from_sq: str, to_sq: str, piece: str, color: str,
+               captured: Optional[str], quantum_event: Optional[str]):
+        self.from_squares.append(from_sq)
+        self.to_squares.append(to_sq)
+        self.pieces.append(piece)
+        self.colors.append(color)
+        self.captured.append(captured)
+        self.quantum_events.append(quantum_event)
+
+    def as_dicts(self, start: int = 0, stop: Optional[int] = None) -> list[dict]:
+        """
+        One dict per move, in the shape the API has always returned,
+        for moves[start:stop]. The dicts are shared between calls and
+        must not be modified.
+        """
+        dicts = self._dicts
+        done = len(dicts)
+        if done < len(self.from_squares):
+            dicts.extend(
+                {
+                    "move_number": number,
+                    "from": from_sq,
+                    "to": to_sq,
+                    "piece": piece,
+                    "color": color,
+                    "captured": captured,
+                    "quantum_event": quantum_event,
+                }
+                for number, (from_sq, to_sq, piece, color, captured, quantum_event)
+                in enumerate(zip(self.from_squares[done:], self.to_squares[done:],
+                                 self.pieces[done:], self.colors[done:],
+                                 self.captured[done:], self.quantum_events[done:]),
+                             start=done + 1)
+            )
+        return dicts[start:stop]
+
 
 class GameStateManager:
     """
@@ -33,146 +104,218 @@ class GameStateManager:
             depth=config.search_depth,
             shots=100,
             superposition_prob=config.quantum_probability,
+            time_limit_ms=config.search_time_ms,
         )
         self.status: GameStatus = GameStatus.ACTIVE
         self.turn: PieceColor = PieceColor.WHITE
+        # Mirrors of self.turn for the move path: a bool to flip and the
+        # color string board pieces are compared against
+        self._white_to_move: bool = True
+        self._turn_color: str = _TURN_COLOR[True]
         self.move_count: int = 0
         self.measurement_count: int = 0
-        self.move_history: list[dict] = []
+        self.history = MoveHistory()
         self.captured_pieces: dict[str, list[str]] = {"white": [], "black": []}
         self.created_at: datetime = datetime.now()
-        self.updated_at: datetime = datetime.now()
+        # Wall-clock ns of the last change; turned into a datetime on demand
+        self._updated_ns: int = time.time_ns()
+        # Bumped on every mutation; read-only payloads are cached per version
+        self.version: int = 0
+        self._payload_cache: dict[str, bytes] = {}
+        self._state: Optional[GameState] = None
+        self._summary: Optional[GameSummary] = None
+        # Source of random quantum events; chance of one per quantum-mode move
+        self._rng = random.Random()
+        self._superposition_chance = config.quantum_probability * 0.3
 
         # Initialize board
         self.engine.initialize_board()
-        logger.info(f"Game {game_id} created with mode={config.mode}")
+        # Times each position_key has occurred after a move (or at the start)
+        self._repetitions: dict[int, int] = {self.position_key: 1}
+        # Modes without quantum events take the shorter _make_move_classical
+        self._quantum_moves: bool = config.mode in (GameMode.QUANTUM, GameMode.HYBRID)
+        logger.info("Game %s created with mode=%s", game_id, config.mode)
 
-    def make_move(self, move: Move) -> MoveResult:
+    def make_move(self, move: Move) -> MoveOutcome:
         """
         Execute a move on the board.
 
         In quantum mode, moves may create superpositions or trigger
-        measurements depending on the game state.
+        measurements depending on the game state. Games in other modes
+        go through _make_move_classical.
         """
+        if not self._quantum_moves:
+            return self._make_move_classical(move)
         from_sq = move.from_square
         to_sq = move.to_square
+        engine = self.engine
+        board = engine.board
+        superposition_squares = engine.superposition_squares
+        mode = self.config.mode
 
-        # Validate the piece exists and belongs to current player
-        piece_data = self.engine.board.get(from_sq)
+        piece_data = board.get(from_sq)
         if piece_data is None:
-            return MoveResult(
-                success=False, from_square=from_sq, to_square=to_sq,
-                piece_moved="", message="No piece at source square",
-            )
+            return self._empty_source(from_sq, to_sq)
+        rejected = self._reject_move(piece_data, from_sq, to_sq)
+        if rejected is not None:
+            return rejected
+        # Rejected moves leave the state, and so the cached payloads, as is
+        self._invalidate()
+
+        # Check for capture
+        captured = board.get(to_sq)
+        captured_type = captured["type"] if captured else None
 
-        if piece_data["color"] != self.turn.value:
-            return MoveResult(
+        # Quantum events
+        quantum_event = None
+        superposition_created = False
+        measurement_triggered = False
+
+        # If moving to a superposition square, trigger measurement
+        if to_sq in superposition_squares:
+            engine.measure_square(to_sq)
+            measurement_triggered = True
+            quantum_event = f"Measurement triggered at {to_sq}"
+            self.measurement_count += 1
+
+        # If from a superposition square, collapse it first
+        if from_sq in superposition_squares:
+            result = engine.measure_square(from_sq)
+            measurement_triggered = True
+            self.measurement_count += 1
+            # Check if the piece survived measurement
+            if from_sq not in board:
+                return MoveOutcome(
+                    success=True, from_square=from_sq, to_square=to_sq,
+                    piece_moved=piece_data["type"],
+                    quantum_event="Piece collapsed away during measurement!",
+                    measurement_triggered=True,
+                    message="Piece dissolved during quantum measurement",
+                )
+
+        # Random quantum superposition events
+        if (mode == GameMode.QUANTUM and
+                self._rng.random() < self._superposition_chance):
+            superposition_created = True
+            quantum_event = f"Quantum superposition created at {to_sq}"
+
+        return self._complete_move(
+            move, piece_data, captured_type,
+            quantum_event, superposition_created, measurement_triggered,
+        )
+
+    def _make_move_classical(self, move: Move) -> MoveOutcome:
+        """make_move for modes without quantum events."""
+        from_sq = move.from_square
+        to_sq = move.to_square
+        board = self.engine.board
+
+        piece_data = board.get(from_sq)
+        if piece_data is None:
+            return self._empty_source(from_sq, to_sq)
+        rejected = self._reject_move(piece_data, from_sq, to_sq)
+        if rejected is not None:
+            return rejected
+        self._invalidate()
+
+        captured = board.get(to_sq)
+        return self._complete_move(
+            move, piece_data, captured["type"] if captured else None,
+        )
+
+    @staticmethod
+    def _empty_source(from_sq: str, to_sq: str) -> MoveOutcome:
+        """Failed MoveOutcome for a move from an empty square."""
+        return MoveOutcome(
+            success=False, from_square=from_sq, to_square=to_sq,
+            piece_moved="", message="No piece at source square",
+        )
+
+    def _reject_move(self, piece_data: dict, from_sq: str,
+                     to_sq: str) -> Optional[MoveOutcome]:
+        """Failed MoveOutcome if the piece may not make the move, else None."""
+        # Validate the piece belongs to current player
+        if piece_data["color"] != self._turn_color:
+            return MoveOutcome(
                 success=False, from_square=from_sq, to_square=to_sq,
                 piece_moved=piece_data["type"],
-                message=f"It's {self.turn.value}'s turn",
+                message=f"It's {self._turn_color}'s turn",
             )
 
         # Check if the move is legal
-        legal_targets = self.engine.get_legal_moves_for_square(from_sq)
-        if to_sq not in legal_targets:
-            return MoveResult(
+        if not self.engine.is_legal_move(from_sq, to_sq):
+            return MoveOutcome(
                 success=False, from_square=from_sq, to_square=to_sq,
                 piece_moved=piece_data["type"],
                 message="Illegal move",
             )
-
-        # Check for capture
-        captured = self.engine.board.get(to_sq)
-        captured_type = captured["type"] if captured else None
-
-        # Quantum events
-        quantum_event = None
-        superposition_created = False
-        measurement_triggered = False
-
-        if self.config.mode in (GameMode.QUANTUM, GameMode.HYBRID):
-            # If moving to a superposition square, trigger measurement
-            if to_sq in self.engine.superposition_squares:
-                self.engine.measure_square(to_sq)
-                measurement_triggered = True
-                quantum_event = f"Measurement triggered at {to_sq}"
-                self.measurement_count += 1
-
-            # If from a superposition square, collapse it first
-            if from_sq in self.engine.superposition_squares:
-                result = self.engine.measure_square(from_sq)
-                measurement_triggered = True
-                self.measurement_count += 1
-                # Check if the piece survived measurement
-                if from_sq not in self.engine.board:
-                    return MoveResult(
-                        success=True, from_square=from_sq, to_square=to_sq,
-                        piece_moved=piece_data["type"],
-                        quantum_event="Piece collapsed away during measurement!",
-                        measurement_triggered=True,
-                        message="Piece dissolved during quantum measurement",
-                    )
-
-            # Random quantum superposition events
-            import random
-            if (self.config.mode == GameMode.QUANTUM and
-                    random.random() < self.config.quantum_probability * 0.3):
-                superposition_created = True
-                quantum_event = f"Quantum superposition created at {to_sq}"
+        return None
+
+    def _complete_move(self, move: Move, piece_data: dict,
+                       captured_type: Optional[str],
+                       quantum_event: Optional[str] = None,
+                       superposition_created: bool = False,
+                       measurement_triggered: bool = False) -> MoveOutcome:
+        """Play a validated move, pass the turn and report the outcome."""
+        from_sq = move.from_square
+        to_sq = move.to_square
+        engine = self.engine
 
         # Execute the move
         if captured_type:
-            self.captured_pieces[piece_data["color"]].append(captured_type)
+            self.captured_pieces[self._turn_color].append(captured_type)
 
-        self.engine._apply_move(from_sq, to_sq)
+        engine._apply_move(from_sq, to_sq)
 
-        # Handle pawn promotion
-        if piece_data["type"] == "pawn":
-            row = int(to_sq[1])
-            if (piece_data["color"] == "white" and row == 8) or \
-               (piece_data["color"] == "black" and row == 1):
-                promo = move.promotion or "queen"
-                self.engine.board[to_sq]["type"] = promo
+        # Handle pawn promotion. Pawns only move forward, so reaching either
+        # back rank means reaching the far one.
+        if (piece_data["type"] == "pawn" and
+                (1 << SQUARE_TO_INDEX[to_sq]) & PROMOTION_MASK):
+            promo = move.promotion or "queen"
+            engine.promote(to_sq, promo)
 
         # Apply superposition if triggered
         if superposition_created:
-            self.engine.create_superposition(to_sq)
+            engine.create_superposition(to_sq)
 
         # Record move
-        self.move_history.append({
-            "move_number": self.move_count + 1,
-            "from": from_sq,
-            "to": to_sq,
-            "piece": piece_data["type"],
-            "color": piece_data["color"],
-            "captured": captured_type,
-            "quantum_event": quantum_event,
-        })
+        self.history.append(
+            from_sq, to_sq, piece_data["type"], piece_data["color"],
+            captured_type, quantum_event,
+        )
 
         self.move_count += 1
-        self.updated_at = datetime.now()
+        self._updated_ns = time.time_ns()
 
         # Switch turns
-        self.turn = PieceColor.BLACK if self.turn == PieceColor.WHITE else PieceColor.WHITE
+        self._white_to_move = white = not self._white_to_move
+        self.turn = _TURN[white]
+        self._turn_color = opponent = _TURN_COLOR[white]
+
+        key = self.position_key
+        repetitions = self._repetitions[key] = self._repetitions.get(key, 0) + 1
 
         # Check game-ending conditions
-        is_check = self.engine._is_in_check(self.turn.value)
-        opponent_moves = self.engine.get_all_legal_moves(self.turn.value)
+        is_check = engine._is_in_check(opponent)
+        opponent_can_move = engine.has_any_legal_move(opponent)
 
         is_checkmate = False
         is_stalemate = False
 
-        if not opponent_moves:
+        if not opponent_can_move:
             if is_check:
                 is_checkmate = True
                 self.status = GameStatus.CHECKMATE
             else:
                 is_stalemate = True
                 self.status = GameStatus.STALEMATE
+        elif repetitions >= 3:
+            # Threefold repetition
+            self.status = GameStatus.DRAW
         elif is_check:
             self.status = GameStatus.CHECK
 
-        return MoveResult(
+        return MoveOutcome(
             success=True,
             from_square=from_sq,
             to_square=to_sq,
@@ -187,35 +330,127 @@ class GameStateManager:
             message="Move executed successfully",
         )
 
+    @property
+    def move_history(self) -> list[dict]:
+        """Move history as a list of per-move dicts."""
+        return self.history.as_dicts()
+
+    @property
+    def position_key(self) -> int:
+        """Zobrist key of the board together with the side to move."""
+        if self._white_to_move:
+            return self.engine.zobrist
+        return self.engine.zobrist ^ ZOBRIST_BLACK_TO_MOVE
+
+    @property
+    def is_threefold_repetition(self) -> bool:
+        """Whether the current position has now occurred three times."""
+        return self._repetitions.get(self.position_key, 0) >= 3
+
+    @property
+    def updated_at(self) -> datetime:
+        """Local time of the last move or measurement."""
+        seconds, ns = divmod(self._updated_ns, 1_000_000_000)
+        return datetime.fromtimestamp(seconds).replace(microsecond=ns // 1000)
+
     def get_state(self) -> GameState:
-        """Serialize current game state into a GameState model."""
-        position = {}
-        for square, piece in self.engine.board.items():
-            position[square] = PieceInfo(
-                type=PieceType(piece["type"]),
-                color=PieceColor(piece["color"]),
-                in_superposition=piece.get("in_superposition", False),
-                superposition_probability=piece.get("probability", 1.0),
+        """
+        Serialize current game state into a GameState model. The model is
+        reused until the next mutation and must not be modified by callers.
+        """
+        if self._state is None:
+            self._state = self._build_state()
+        return self._state
+
+    def _build_state(self) -> GameState:
+        engine = self.engine
+        # Validated from plain data, so pydantic-core builds the PieceInfo
+        # models straight from the engine's piece dicts in one pass
+        return GameState.model_validate({
+            "game_id": self.game_id,
+            "mode": self.config.mode,
+            "status": self.status,
+            "turn": self.turn,
+            "position": engine.board,
+            "move_count": self.move_count,
+            "measurement_count": self.measurement_count,
+            "quantum_probability": self.config.quantum_probability,
+            "superposition_squares": list(engine.superposition_squares),
+            # Already a list of (a, b) tuples; validation copies it
+            "entanglement_pairs": engine.entanglement_pairs,
+            "move_history": self.move_history,
+            "captured_pieces": self.captured_pieces,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        })
+
+    def get_summary(self) -> GameSummary:
+        """
+        Listing summary of the game, read straight from the manager rather
+        than a full state snapshot. Cached like get_state.
+        """
+        if self._summary is None:
+            self._summary = GameSummary(
+                game_id=self.game_id,
+                mode=self.config.mode,
+                status=self.status,
+                turn=self.turn,
+                move_count=self.move_count,
+                player_white=self.config.player_white,
+                player_black=self.config.player_black,
+                created_at=self.created_at,
             )
+        return self._summary
 
-        return GameState(
-            game_id=self.game_id,
-            mode=self.config.mode,
-            status=self.status,
-            turn=self.turn,
-            position=position,
-            move_count=self.move_count,
-            measurement_count=self.measurement_count,
-            quantum_probability=self.config.quantum_probability,
-            superposition_squares=list(self.engine.superposition_squares),
-            entanglement_pairs=[
-                (a, b) for a, b in self.engine.entanglement_pairs
-            ],
-            move_history=self.move_history,
-            captured_pieces=self.captured_pieces,
-            created_at=self.created_at,
-            updated_at=self.updated_at,
-        )
+    def get_state_json(self) -> bytes:
+        """
+        Current game state encoded as JSON, cached until the next
+        move or measurement.
+        """
+        return self.cached_payload("state", self._encode_state)
+
+    def _encode_state(self) -> bytes:
+        """
+        Encode the GameState fields straight from the game with orjson,
+        skipping the model. Must produce the same document as
+        get_state().model_dump_json().
+        """
+        engine = self.engine
+        config = self.config
+        return orjson.dumps({
+            "game_id": self.game_id,
+            "mode": config.mode,
+            "status": self.status,
+            "turn": self.turn,
+            "position": {
+                square: {
+                    "type": piece["type"],
+                    "color": piece["color"],
+                    "in_superposition": piece["in_superposition"],
+                    "superposition_probability": float(piece["probability"]),
+                }
+                for square, piece in engine.board.items()
+            },
+            "move_count": self.move_count,
+            "measurement_count": self.measurement_count,
+            "quantum_probability": config.quantum_probability,
+            "superposition_squares": list(engine.superposition_squares),
+            "entanglement_pairs": engine.entanglement_pairs,
+            "move_history": self.history.as_dicts(),
+            "captured_pieces": self.captured_pieces,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
+        })
+
+    def cached_payload(self, key: str, build: Callable[[], bytes]) -> bytes:
+        """
+        Return the encoded payload stored under key, building it on first
+        use. Entries are dropped whenever the game state changes.
+        """
+        payload = self._payload_cache.get(key)
+        if payload is None:
+            payload = self._payload_cache[key] = build()
+        return payload
 
     def get_legal_moves(self, square: str) -> list[str]:
         """Get legal moves for a piece at the given square."""
@@ -223,10 +458,12 @@ class GameStateManager:
 
     def get_all_legal_moves_for_current_player(self) -> dict[str, list[str]]:
         """Get all legal moves for the current player."""
+        color = self._turn_color
+        legal_moves_for_square = self.engine.get_legal_moves_for_square
         moves = {}
         for square, piece in self.engine.board.items():
-            if piece["color"] == self.turn.value:
-                targets = self.engine.get_legal_moves_for_square(square)
+            if piece["color"] == color:
+                targets = legal_moves_for_square(square)
                 if targets:
                     moves[square] = targets
         return moves
@@ -234,17 +471,26 @@ class GameStateManager:
     def measure_square(self, square: str) -> dict:
         """Measure a specific square."""
         result = self.engine.measure_square(square)
+        self._invalidate()
         self.measurement_count += 1
-        self.updated_at = datetime.now()
+        self._updated_ns = time.time_ns()
         return result
 
     def measure_all(self) -> dict[str, dict]:
         """Measure all superposition squares."""
         results = self.engine.measure_all()
+        self._invalidate()
         self.measurement_count += len(results)
-        self.updated_at = datetime.now()
+        self._updated_ns = time.time_ns()
         return results
 
     def find_best_move(self) -> dict:
         """Find best move using AI."""
-        return self.engine.find_best_move(self.turn.value)
+        return self.engine.find_best_move(self._turn_color)
+
+    def _invalidate(self):
+        """Record a mutation: bump the version and drop cached payloads."""
+        self.version += 1
+        self._payload_cache.clear()
+        self._state = None
+        self._summary = None
@@ -9,73 +9,117 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Square <-> coordinate lookup tables, so hot paths never parse strings.
+# Coordinates are (row, col) with a1 = (0, 0); indices run a1 = 0 .. h8 = 63.
+COORDS_TO_SQUARE = [
+    [f"{file}{row + 1}" for file in "abcdefgh"] for row in range(8)
+]
+SQUARE_TO_COORDS = {
+    square: (row, col)
+    for row, squares in enumerate(COORDS_TO_SQUARE)
+    for col, square in enumerate(squares)
+}
+SQUARE_TO_INDEX = {
+    square: row * 8 + col for square, (row, col) in SQUARE_TO_COORDS.items()
+}
+# Bitboard of ranks 1 and 8, indexed like SQUARE_TO_INDEX
+PROMOTION_MASK = 0xFF000000000000FF
+# 0 for dark squares (a1), 1 for light squares
+SQUARE_SHADE = {
+    square: (row + col) & 1 for square, (row, col) in SQUARE_TO_COORDS.items()
+}
+
+
+VALID_FILES = frozenset("abcdefgh")
+VALID_RANKS = frozenset("12345678")
+
+
+def is_valid_square(square: str) -> bool:
+    """Check if a square string is valid algebraic notation."""
+    return (
+        len(square) == 2
+        and square[0] in VALID_FILES
+        and square[1] in VALID_RANKS
+    )
+
+
+def validate_move_format(from_square: str, to_square: str) -> tuple[bool, str]:
+    """
+    Validate basic move format.
+    Returns (is_valid, error_message).
+    """
+    if not is_valid_square(from_square):
+        return False, f"Invalid source square: {from_square}"
+    if not is_valid_square(to_square):
+        return False, f"Invalid target square: {to_square}"
+    if from_square == to_square:
+        return False, "Source and target squares are the same"
+    return True, ""
+
+
+def is_valid_promotion(piece_type: str) -> bool:
+    """Check if a promotion piece type is valid."""
+    return piece_type in ("queen", "rook", "bishop", "knight")
+
+
+def square_to_coords(square: str) -> tuple[int, int]:
+    """Convert algebraic notation to (row, col) coordinates."""
+    coords = SQUARE_TO_COORDS.get(square)
+    if coords is not None:
+        return coords
+    col = ord(square[0]) - ord("a")
+    row = int(square[1]) - 1
+    return row, col
+
+
+def coords_to_square(row: int, col: int) -> str:
+    """Convert (row, col) coordinates to algebraic notation."""
+    if 0 <= row < 8 and 0 <= col < 8:
+        return COORDS_TO_SQUARE[row][col]
+    return f"{chr(col + ord('a'))}{row + 1}"
+
+
+def square_to_index(square: str) -> int:
+    """Convert algebraic notation to a 0..63 index (a1 = 0, h8 = 63)."""
+    return SQUARE_TO_INDEX[square]
+
+
+def is_same_color_square(sq1: str, sq2: str) -> bool:
+    """Check if two squares are the same color on the board."""
+    return SQUARE_SHADE[sq1] == SQUARE_SHADE[sq2]
+
+
+def manhattan_distance(sq1: str, sq2: str) -> int:
+    """Calculate Manhattan distance between two squares."""
+    r1, c1 = SQUARE_TO_COORDS[sq1]
+    r2, c2 = SQUARE_TO_COORDS[sq2]
+    return abs(r1 - r2) + abs(c1 - c2)
+
+
+def chebyshev_distance(sq1: str, sq2: str) -> int:
+    """Calculate Chebyshev distance (king distance) between squares."""
+    r1, c1 = SQUARE_TO_COORDS[sq1]
+    r2, c2 = SQUARE_TO_COORDS[sq2]
+    return max(abs(r1 - r2), abs(c1 - c2))
+
 
 class MoveValidator:
     """
-    Validates chess moves considering both classical rules
-    and quantum state constraints.
+    Namespace over the module-level validation helpers, kept for callers
+    that use MoveValidator.<helper>. New code should import the functions.
     """
 
-    VALID_FILES = set("abcdefgh")
-    VALID_RANKS = set("12345678")
-
-    @staticmethod
-    def is_valid_square(square: str) -> bool:
-        """Check if a square string is valid algebraic notation."""
-        return (
-            len(square) == 2
-            and square[0] in MoveValidator.VALID_FILES
-            and square[1] in MoveValidator.VALID_RANKS
-        )
-
-    @staticmethod
-    def validate_move_format(from_square: str, to_square: str) -> tuple[bool, str]:
-        """
-        Validate basic move format.
-        Returns (is_valid, error_message).
-        """
-        if not MoveValidator.is_valid_square(from_square):
-            return False, f"Invalid source square: {from_square}"
-        if not MoveValidator.is_valid_square(to_square):
-            return False, f"Invalid target square: {to_square}"
-        if from_square == to_square:
-            return False, "Source and target squares are the same"
-        return True, ""
-
-    @staticmethod
-    def is_valid_promotion(piece_type: str) -> bool:
-        """Check if a promotion piece type is valid."""
-        return piece_type in ("queen", "rook", "bishop", "knight")
-
-    @staticmethod
-    def square_to_coords(square: str) -> tuple[int, int]:
-        """Convert algebraic notation to (row, col) coordinates."""
-        col = ord(square[0]) - ord("a")
-        row = int(square[1]) - 1
-        return row, col
-
-    @staticmethod
-    def coords_to_square(row: int, col: int) -> str:
-        """Convert (row, col) coordinates to algebraic notation."""
-        return f"{chr(col + ord('a'))}{row + 1}"
-
-    @staticmethod
-    def is_same_color_square(sq1: str, sq2: str) -> bool:
-        """Check if two squares are the same color on the board."""
-        r1, c1 = MoveValidator.square_to_coords(sq1)
-        r2, c2 = MoveValidator.square_to_coords(sq2)
-        return (r1 + c1) % 2 == (r2 + c2) % 2
-
-    @staticmethod
-    def manhattan_distance(sq1: str, sq2: str) -> int:
-        """Calculate Manhattan distance between two squares."""
-        r1, c1 = MoveValidator.square_to_coords(sq1)
-        r2, c2 = MoveValidator.square_to_coords(sq2)
-        return abs(r1 - r2) + abs(c1 - c2)
-
-    @staticmethod
-    def chebyshev_distance(sq1: str, sq2: str) -> int:
-        """Calculate Chebyshev distance (king distance) between squares."""
-        r1, c1 = MoveValidator.square_to_coords(sq1)
-        r2, c2 = MoveValidator.square_to_coords(sq2)
-        return max(abs(r1 - r2), abs(c1 - c2))
+    __slots__ = ()
+
+    VALID_FILES = VALID_FILES
+    VALID_RANKS = VALID_RANKS
+
+    is_valid_square = staticmethod(is_valid_square)
+    validate_move_format = staticmethod(validate_move_format)
+    is_valid_promotion = staticmethod(is_valid_promotion)
+    square_to_coords = staticmethod(square_to_coords)
+    coords_to_square = staticmethod(coords_to_square)
+    square_to_index = staticmethod(square_to_index)
+    is_same_color_square = staticmethod(is_same_color_square)
+    manhattan_distance = staticmethod(manhattan_distance)
+    chebyshev_distance = staticmethod(chebyshev_distance)
@@ -13,8 +13,22 @@ set USE_QISKIT=True.
 """
 
 import numpy as np
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
+import copy
+import json
 import logging
+import math
+import random
+import time
+
+from app.core.evaluator import (
+    ALL_SQUARES, BoardArrays, COLOR_ID, EMPTY_COLOR, PIECE_ID, SQUARE_INDEX,
+    PositionEvaluator,
+)
+from app.core.move_validator import COORDS_TO_SQUARE, SQUARE_TO_COORDS
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +38,9 @@ logger = logging.getLogger(__name__)
 # matrix operations — identical quantum mechanics, just without circuit syntax.
 
 
+HADAMARD = np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2)
+
+
 class QuantumSimulator:
     """
     Lightweight quantum simulator using NumPy.
@@ -33,9 +50,27 @@ class QuantumSimulator:
     def __init__(self, num_qubits: int = 5):
         self.num_qubits = num_qubits
         self.dim = 2 ** num_qubits
+        # Cumulative distribution of the state, built by measure() on demand
+        self._cdf: Optional[np.ndarray] = None
         # Initialize to |00...0⟩ state
         self.state = np.zeros(self.dim, dtype=complex)
         self.state[0] = 1.0
+        # Reused by every gate, so applying one allocates no arrays
+        self._scratch = np.empty(self.dim, dtype=complex)
+        self._ry_gate = np.empty((2, 2))
+
+    @property
+    def state(self) -> np.ndarray:
+        """
+        State vector; index bit q holds qubit q. Replace it by assignment
+        rather than writing into it, so the cached distribution is dropped.
+        """
+        return self._state
+
+    @state.setter
+    def state(self, state: np.ndarray):
+        self._state = state
+        self._cdf = None
 
     def reset(self):
         """Reset to |00...0⟩ state."""
@@ -44,80 +79,69 @@ class QuantumSimulator:
 
     def ry(self, qubit: int, theta: float):
         """Apply RY rotation gate to a qubit."""
-        cos_half = np.cos(theta / 2)
-        sin_half = np.sin(theta / 2)
-        gate = np.array([[cos_half, -sin_half],
-                         [sin_half, cos_half]])
+        cos_half = math.cos(theta / 2)
+        sin_half = math.sin(theta / 2)
+        gate = self._ry_gate
+        gate[0, 0] = gate[1, 1] = cos_half
+        gate[0, 1] = -sin_half
+        gate[1, 0] = sin_half
         self._apply_single_gate(qubit, gate)
 
     def x(self, qubit: int):
         """Apply Pauli-X (NOT) gate."""
-        gate = np.array([[0, 1], [1, 0]], dtype=complex)
-        self._apply_single_gate(qubit, gate)
+        # X only exchanges the |0⟩ and |1⟩ halves of the qubit's axis
+        out = self._scratch.reshape(-1, 2, 1 << qubit)
+        np.copyto(out, self._qubit_view(qubit)[:, ::-1, :])
+        self._state[:] = self._scratch
+        self._cdf = None
 
     def h(self, qubit: int):
         """Apply Hadamard gate."""
-        gate = np.array([[1, 1], [1, -1]], dtype=complex) / np.sqrt(2)
-        self._apply_single_gate(qubit, gate)
+        self._apply_single_gate(qubit, HADAMARD)
 
     def cx(self, control: int, target: int):
         """Apply CNOT (controlled-X) gate."""
-        new_state = self.state.copy()
-        for i in range(self.dim):
-            if (i >> control) & 1:  # control qubit is |1⟩
-                # Flip the target qubit
-                j = i ^ (1 << target)
-                new_state[j] = self.state[i]
-                new_state[i] = self.state[j]
-        # Avoid double-swapping
-        self.state = new_state
+        # Swap the target=0 and target=1 amplitudes where control is |1⟩
+        self._swap_amplitudes({control: 1, target: 0}, {control: 1, target: 1})
 
     def cswap(self, control: int, target1: int, target2: int):
         """Apply controlled-SWAP (Fredkin) gate."""
-        new_state = self.state.copy()
-        for i in range(self.dim):
-            if (i >> control) & 1:  # control is |1⟩
-                bit1 = (i >> target1) & 1
-                bit2 = (i >> target2) & 1
-                if bit1 != bit2:
-                    j = i ^ (1 << target1) ^ (1 << target2)
-                    new_state[i], new_state[j] = self.state[j], self.state[i]
-        self.state = new_state
+        # Where control is |1⟩, exchange |10⟩ and |01⟩ on the two targets
+        self._swap_amplitudes(
+            {control: 1, target1: 1, target2: 0},
+            {control: 1, target1: 0, target2: 1},
+        )
 
     def measure(self, shots: int = 1) -> list[list[int]]:
         """
         Measure all qubits. Returns a list of measurement outcomes,
         each being a list of qubit values [q0, q1, ..., qn-1].
         """
-        probabilities = np.abs(self.state) ** 2
-        probabilities = probabilities / probabilities.sum()  # Normalize
-
-        results = []
-        indices = np.random.choice(self.dim, size=shots, p=probabilities)
-        for idx in indices:
-            bits = [(idx >> q) & 1 for q in range(self.num_qubits)]
-            results.append(bits)
-        return results
+        # Cumulative distribution, kept until a gate or collapse changes
+        # the state; sampled like np.random.choice with p=probabilities
+        cdf = self._cdf
+        if cdf is None:
+            cdf = np.cumsum(np.abs(self._state) ** 2)
+            cdf /= cdf[-1]  # Normalize
+            self._cdf = cdf
+        indices = cdf.searchsorted(np.random.random(shots), side="right")
+        # One row per shot, column q holding bit q of the sampled index
+        bits = (indices[:, None] >> np.arange(self.num_qubits)) & 1
+        return bits.tolist()
 
     def measure_qubit(self, qubit: int) -> int:
         """Measure a single qubit and collapse the state."""
-        prob_one = 0.0
-        for i in range(self.dim):
-            if (i >> qubit) & 1:
-                prob_one += np.abs(self.state[i]) ** 2
+        st = self._qubit_view(qubit)
+        prob_one = np.sum(np.abs(st[:, 1, :]) ** 2)
 
         outcome = 1 if np.random.random() < prob_one else 0
 
         # Collapse the state
-        new_state = np.zeros(self.dim, dtype=complex)
-        for i in range(self.dim):
-            if ((i >> qubit) & 1) == outcome:
-                new_state[i] = self.state[i]
-
-        norm = np.sqrt(np.sum(np.abs(new_state) ** 2))
+        st[:, 1 - outcome, :] = 0
+        norm = np.sqrt(np.sum(np.abs(st[:, outcome, :]) ** 2))
         if norm > 0:
-            new_state /= norm
-        self.state = new_state
+            self._state /= norm
+        self._cdf = None
 
         return outcome
 
@@ -127,17 +151,38 @@ class QuantumSimulator:
 
     def _apply_single_gate(self, qubit: int, gate: np.ndarray):
         """Apply a single-qubit gate to the state vector."""
-        new_state = np.zeros(self.dim, dtype=complex)
-        for i in range(self.dim):
-            bit = (i >> qubit) & 1
-            j = i ^ (1 << qubit) if bit == 0 else i
-            k = i if bit == 0 else i ^ (1 << qubit)
-            # i has bit=bit at position qubit
-            # j has bit=0, k has bit=1 at position qubit
-            if bit == 0:
-                new_state[i] += gate[0, 0] * self.state[i] + gate[0, 1] * self.state[i ^ (1 << qubit)]
-                new_state[i ^ (1 << qubit)] += gate[1, 0] * self.state[i] + gate[1, 1] * self.state[i ^ (1 << qubit)]
-        self.state = new_state
+        # gate @ (higher, qubit, lower) mixes each |0⟩/|1⟩ amplitude pair
+        out = self._scratch.reshape(-1, 2, 1 << qubit)
+        np.matmul(gate, self._qubit_view(qubit), out=out)
+        self._state[:] = self._scratch
+        self._cdf = None
+
+    def _swap_amplitudes(self, bits1: dict[int, int], bits2: dict[int, int]) -> None:
+        """
+        Exchange, in place, the amplitudes whose qubits match bits1 with
+        those matching bits2 (dicts of qubit -> value over the same qubits).
+        """
+        n = self.num_qubits
+        tensor = self._state.reshape((2,) * n)
+        self._cdf = None
+        # Axis 0 is the most significant qubit
+        index1: list[int | slice] = [slice(None)] * n
+        index2: list[int | slice] = [slice(None)] * n
+        for qubit, bit in bits1.items():
+            index1[n - 1 - qubit] = bit
+        for qubit, bit in bits2.items():
+            index2[n - 1 - qubit] = bit
+        key1, key2 = tuple(index1), tuple(index2)
+        held = tensor[key1].copy()
+        tensor[key1] = tensor[key2]
+        tensor[key2] = held
+
+    def _qubit_view(self, qubit: int) -> np.ndarray:
+        """
+        View of the state as (higher qubits, qubit, lower qubits), so
+        [:, 0, :] and [:, 1, :] are the amplitudes with the qubit at 0 / 1.
+        """
+        return self._state.reshape(-1, 2, 1 << qubit)
 
 
 # ─── Piece Encoding ──────────────────────────────────────────────────────────
@@ -165,6 +210,151 @@ PIECE_VALUES = {
 }
 
 
+def _build_positional_bonus() -> dict[tuple[str, str, str], float]:
+    """
+    Tabulate EnhancedQuantumChessEngine's positional bonus for every
+    (piece type, color, square), so evaluation needs no per-piece math.
+    Pawn advancement counts rows from each color's own back rank.
+    """
+    bonus = {}
+    for row in range(8):
+        for col in range(8):
+            square = f"{chr(col + ord('a'))}{row + 1}"
+            center_dist = abs(row - 3.5) + abs(col - 3.5)
+            for piece_type in PIECE_VALUES:
+                for color, advancement in (("white", row), ("black", 7 - row)):
+                    # Center control bonus
+                    value = (7 - center_dist) * 0.05
+                    if piece_type == "pawn":
+                        value += advancement * 0.1
+                    elif piece_type == "knight":
+                        value += (7 - center_dist) * 0.1  # Knight centrality
+                    bonus[(piece_type, color, square)] = value
+    return bonus
+
+
+POSITIONAL_BONUS = _build_positional_bonus()
+
+# Scores are kept positive for white; multiply by this to sign a piece's value
+COLOR_SIGN = {"white": 1.0, "black": -1.0}
+
+# Full evaluate_position contribution of a classical (non-superposed) piece,
+# signed for white
+PIECE_SQUARE_EVAL = {
+    key: COLOR_SIGN[key[1]] * (PIECE_VALUES[key[0]] + bonus)
+    for key, bonus in POSITIONAL_BONUS.items()
+}
+
+
+def _build_classical_eval() -> np.ndarray:
+    """PIECE_SQUARE_EVAL as a [color id, piece id, square] array."""
+    table = np.zeros((EMPTY_COLOR + 1, len(PIECE_ID), 64))
+    for (piece_type, color, square), value in PIECE_SQUARE_EVAL.items():
+        table[COLOR_ID[color], PIECE_ID[piece_type], SQUARE_INDEX[square]] = value
+    return table
+
+
+CLASSICAL_EVAL = _build_classical_eval()
+
+
+# ─── Zobrist Hashing ─────────────────────────────────────────────────────────
+
+class _ZobristKeys(dict):
+    """
+    Random 64-bit key per (piece type, color, square). The standard pieces
+    are keyed up front so search threads only ever read; anything else
+    (e.g. an unusual promotion type) gets a key on first use.
+    """
+
+    def __init__(self, seed: int, keys):
+        super().__init__()
+        self._rng = random.Random(seed)
+        for key in keys:
+            self[key] = self._rng.getrandbits(64)
+
+    def __missing__(self, key: tuple[str, str, str]) -> int:
+        value = self[key] = self._rng.getrandbits(64)
+        return value
+
+
+ZOBRIST_KEYS = _ZobristKeys(0x5EED, POSITIONAL_BONUS)
+# XORed in when black is to move, for keys that include the side to move
+ZOBRIST_BLACK_TO_MOVE = random.Random(0x51DE).getrandbits(64)
+
+# Entries kept per engine in each position-keyed cache
+TRANSPOSITION_CACHE_SIZE = 4096
+
+# Transposition table bound flags for stored minimax scores
+TT_EXACT = 0
+TT_LOWER = 1  # search failed high: true score >= stored score
+TT_UPPER = 2  # search failed low: true score <= stored score
+
+
+# ─── Move Tables ─────────────────────────────────────────────────────────────
+
+def _step_targets(offsets: list[tuple[int, int]]) -> dict[str, tuple[str, ...]]:
+    """On-board squares one step away from each square, in offsets order."""
+    targets = {}
+    for square, (row, col) in SQUARE_TO_COORDS.items():
+        targets[square] = tuple(
+            COORDS_TO_SQUARE[row + dr][col + dc]
+            for dr, dc in offsets
+            if 0 <= row + dr < 8 and 0 <= col + dc < 8
+        )
+    return targets
+
+
+# Square name per BoardArrays index
+INDEX_TO_SQUARE = [square for rank in COORDS_TO_SQUARE for square in rank]
+
+# Knight and king targets depend only on the source square
+KNIGHT_TARGETS = _step_targets([(-2, -1), (-2, 1), (-1, -2), (-1, 2),
+                                (1, -2), (1, 2), (2, -1), (2, 1)])
+KING_TARGETS = _step_targets([(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+                              if dr or dc])
+# Squares a pawn of each color captures on; equally, the squares from which
+# an opposing pawn attacks a piece of that color
+PAWN_ATTACKS = {
+    "white": _step_targets([(1, -1), (1, 1)]),
+    "black": _step_targets([(-1, -1), (-1, 1)]),
+}
+
+
+def _ray_targets(directions: list[tuple[int, int]]) -> dict[str, tuple[tuple[str, ...], ...]]:
+    """Per square, the squares along each direction out to the board edge."""
+    rays = {}
+    for square, (row, col) in SQUARE_TO_COORDS.items():
+        square_rays = []
+        for dr, dc in directions:
+            ray = []
+            r, c = row + dr, col + dc
+            while 0 <= r < 8 and 0 <= c < 8:
+                ray.append(COORDS_TO_SQUARE[r][c])
+                r += dr
+                c += dc
+            square_rays.append(tuple(ray))
+        rays[square] = tuple(square_rays)
+    return rays
+
+
+# Sliding pieces walk these rays nearest-first until blocked
+ROOK_RAYS = _ray_targets([(1, 0), (-1, 0), (0, 1), (0, -1)])
+BISHOP_RAYS = _ray_targets([(1, 1), (1, -1), (-1, 1), (-1, -1)])
+QUEEN_RAYS = {square: ROOK_RAYS[square] + BISHOP_RAYS[square] for square in ROOK_RAYS}
+
+# Move tables by piece type, for generators that dispatch once per piece
+STEP_TARGETS = {"knight": KNIGHT_TARGETS, "king": KING_TARGETS}
+SLIDING_RAYS = {"bishop": BISHOP_RAYS, "rook": ROOK_RAYS, "queen": QUEEN_RAYS}
+
+# "from-to" move string -> (from, to), so the search never splits strings
+MOVE_SQUARES = {
+    f"{from_sq}-{to_sq}": (from_sq, to_sq)
+    for from_sq in SQUARE_TO_COORDS
+    for to_sq in SQUARE_TO_COORDS
+    if from_sq != to_sq
+}
+
+
 # ─── Enhanced Quantum Chess Engine ────────────────────────────────────────────
 
 class EnhancedQuantumChessEngine:
@@ -181,13 +371,22 @@ class EnhancedQuantumChessEngine:
     """
 
     def __init__(self, depth: int = 3, shots: int = 100,
-                 superposition_prob: float = 0.5):
+                 superposition_prob: float = 0.5,
+                 time_limit_ms: int | None = None,
+                 use_opening_book: bool = True):
         self.search_depth = depth
+        # Answer known opening positions from the book instead of searching
+        self.use_opening_book = use_opening_book
+        # Optional budget for find_best_move's iterative deepening
+        self.search_time_ms = time_limit_ms
         self.shots = shots
         self.superposition_prob = superposition_prob
 
-        # Classical board state (authoritative source)
+        # Classical board state (authoritative source). Every piece dict
+        # carries type, color, in_superposition and probability.
         self.board: dict[str, dict] = {}
+        # Structure-of-arrays mirror of the board, kept in sync by the mutators
+        self.arrays: BoardArrays = BoardArrays.empty()
 
         # Quantum state tracking
         self.superposition_squares: set[str] = set()
@@ -195,10 +394,25 @@ class EnhancedQuantumChessEngine:
         self.measurement_cache: dict[str, dict] = {}
         self.measurement_count: int = 0
 
-        # Initialize simulators for squares in superposition
-        self.square_simulators: dict[str, QuantumSimulator] = {}
+        # (piece bits, color bit, probability) for squares in superposition.
+        # Type and color are classical, so only presence is ever sampled.
+        self.square_states: dict[str, tuple[int, int, float]] = {}
 
-        logger.info(f"Quantum engine initialized: depth={depth}, shots={shots}")
+        # PositionEvaluator positional score and evaluate_position's score
+        # (positive for white), kept in sync by the mutators
+        self._positional_cache: float = 0.0
+        self._eval_score: float = 0.0
+
+        # Zobrist hash of piece placement, kept in sync by the mutators, and
+        # the move generation results cached under it
+        self.zobrist: int = 0
+        self._legal_moves_cache: OrderedDict[tuple[int, str], list[str]] = OrderedDict()
+        self._in_check_cache: OrderedDict[tuple[int, str], bool] = OrderedDict()
+        # Minimax transposition table: (depth, score, flag, best_move) per
+        # position, side to move, evaluating color and superposition state
+        self._transpositions: OrderedDict[tuple, tuple[int, float, int, str]] = OrderedDict()
+
+        logger.info("Quantum engine initialized: depth=%s, shots=%s", depth, shots)
 
     def initialize_board(self) -> dict[str, dict]:
         """Set up the initial chess position."""
@@ -206,7 +420,7 @@ class EnhancedQuantumChessEngine:
         self.superposition_squares = set()
         self.entanglement_pairs = []
         self.measurement_cache = {}
-        self.square_simulators = {}
+        self.square_states = {}
         self.measurement_count = 0
 
         # Back rank pieces
@@ -236,9 +450,35 @@ class EnhancedQuantumChessEngine:
                 "in_superposition": False, "probability": 1.0,
             }
 
+        self.arrays = BoardArrays.from_board(self.board)
+        self._refresh_positional_cache()
+        self._refresh_eval_score()
+        self._refresh_zobrist()
         logger.info("Board initialized with standard position")
         return self.board
 
+    @property
+    def positional_score(self) -> float:
+        """
+        Piece-square component of PositionEvaluator, maintained
+        incrementally as moves are applied. Board changes made outside the
+        engine's own methods are not tracked.
+        """
+        return self._positional_cache
+
+    def promote(self, square: str, piece_type: str):
+        """Change the type of the piece on a square (pawn promotion)."""
+        piece = self.board[square]
+        psq = PositionEvaluator.piece_square_value
+        self._positional_cache -= psq(piece["type"], piece["color"], square)
+        self._eval_score -= self._square_score(square, piece)
+        self.zobrist ^= ZOBRIST_KEYS[(piece["type"], piece["color"], square)]
+        piece["type"] = piece_type
+        self._positional_cache += psq(piece_type, piece["color"], square)
+        self._eval_score += self._square_score(square, piece)
+        self.zobrist ^= ZOBRIST_KEYS[(piece_type, piece["color"], square)]
+        self.arrays.set_square(square, piece)
+
     def create_superposition(self, square: str, prob: float | None = None) -> bool:
         """
         Put a piece into quantum superposition.
@@ -251,32 +491,21 @@ class EnhancedQuantumChessEngine:
 
         probability = prob if prob is not None else self.superposition_prob
 
-        # Create a quantum simulator for this square
-        sim = QuantumSimulator(num_qubits=5)
-
-        # Encode current piece state
+        # Encode current piece state; the presence qubit is the only one
+        # not in a basis state, so it is sampled directly at measurement
         piece = self.board[square]
         piece_bits = PIECE_ENCODING.get(piece["type"], 0)
+        color_bit = 1 if piece["color"] == "black" else 0
 
-        # Set piece type qubits
-        for bit_idx in range(3):
-            if (piece_bits >> bit_idx) & 1:
-                sim.x(bit_idx)
-
-        # Set color qubit
-        if piece["color"] == "black":
-            sim.x(3)
-
-        # Apply superposition via RY gate on qubit 4
-        theta = 2 * np.arccos(np.sqrt(probability))
-        sim.ry(4, theta)
-
-        self.square_simulators[square] = sim
+        self.square_states[square] = (piece_bits, color_bit, probability)
+        self._eval_score -= self._square_score(square, piece)
         self.superposition_squares.add(square)
-        self.board[square]["in_superposition"] = True
-        self.board[square]["probability"] = probability
+        piece["in_superposition"] = True
+        piece["probability"] = probability
+        self._eval_score += self._square_score(square, piece)
+        self.arrays.set_square(square, piece)
 
-        logger.info(f"Superposition created at {square} with p={probability:.2f}")
+        logger.info("Superposition created at %s with p=%.2f", square, probability)
         return True
 
     def create_entanglement(self, square1: str, square2: str) -> bool:
@@ -293,7 +522,7 @@ class EnhancedQuantumChessEngine:
             self.create_superposition(square2)
 
         self.entanglement_pairs.append((square1, square2))
-        logger.info(f"Entanglement created between {square1} and {square2}")
+        logger.info("Entanglement created between %s and %s", square1, square2)
         return True
 
     def measure_square(self, square: str) -> dict:
@@ -305,22 +534,57 @@ class EnhancedQuantumChessEngine:
             # Already classical — return as-is
             return self.board.get(square, {"type": "empty", "color": "white"})
 
-        sim = self.square_simulators.get(square)
-        if sim is None:
+        if not self._collapse_square(square, np.random.random()):
             return self.board.get(square, {"type": "empty", "color": "white"})
+        self._refresh_positional_cache()
+        self._refresh_eval_score()
+
+        # Handle entanglement collapse
+        self._collapse_entangled(square)
+        return self.board.get(square, {"type": "empty", "color": "white"})
+
+    def measure_all(self) -> dict[str, dict]:
+        """Measure all superposition squares, collapsing the entire board."""
+        squares_to_measure = list(self.superposition_squares)
+        # Entangled partners collapse independently of each other, so every
+        # square is sampled in one draw and the scores rebuilt once
+        draws = np.random.random(len(squares_to_measure))
+        for square, draw in zip(squares_to_measure, draws):
+            self._collapse_square(square, draw)
+        if squares_to_measure:
+            self._refresh_positional_cache()
+            self._refresh_eval_score()
+        for square in squares_to_measure:
+            self._collapse_entangled(square)
+        return {
+            square: self.board.get(square, {"type": "empty", "color": "white"})
+            for square in squares_to_measure
+        }
 
-        # Measure the superposition qubit
-        result = sim.measure(shots=1)[0]
+    def _collapse_square(self, square: str, draw: float) -> bool:
+        """
+        Collapse a superposed square given a uniform draw in [0, 1). Leaves
+        the positional and evaluation scores and entangled partners to the
+        caller. Returns False if the square has no quantum state.
+        """
+        state = self.square_states.get(square)
+        if state is None:
+            return False
 
-        # Extract piece info from measurement
-        piece_bits = result[0] | (result[1] << 1) | (result[2] << 2)
-        color = "black" if result[3] else "white"
-        is_present = result[4] == 0  # superposition qubit |0⟩ = piece present
+        # Measure the superposition qubit: |0⟩ (piece present) with probability
+        piece_bits, color_bit, probability = state
+        color = "black" if color_bit else "white"
+        is_present = draw < probability
 
         self.measurement_count += 1
 
+        previous = self.board.get(square)
+        if previous is not None:
+            self.zobrist ^= ZOBRIST_KEYS[(previous["type"], previous["color"], square)]
+
         if is_present:
             piece_type = PIECE_DECODING.get(piece_bits, "empty")
+            self.zobrist ^= ZOBRIST_KEYS[(piece_type, color, square)]
             self.board[square] = {
                 "type": piece_type, "color": color,
                 "in_superposition": False, "probability": 1.0,
@@ -332,21 +596,11 @@ class EnhancedQuantumChessEngine:
 
         # Clean up quantum state
         self.superposition_squares.discard(square)
-        self.square_simulators.pop(square, None)
-
-        # Handle entanglement collapse
-        self._collapse_entangled(square)
+        self.square_states.pop(square, None)
+        self.arrays.set_square(square, self.board.get(square))
 
-        logger.info(f"Measured {square}: present={is_present}")
-        return self.board.get(square, {"type": "empty", "color": "white"})
-
-    def measure_all(self) -> dict[str, dict]:
-        """Measure all superposition squares, collapsing the entire board."""
-        squares_to_measure = list(self.superposition_squares)
-        results = {}
-        for square in squares_to_measure:
-            results[square] = self.measure_square(square)
-        return results
+        logger.info("Measured %s: present=%s", square, is_present)
+        return True
 
     def evaluate_position(self, color: str = "white") -> float:
         """
@@ -354,30 +608,10 @@ class EnhancedQuantumChessEngine:
 
         For classical squares, uses standard piece values.
         For superposition squares, uses expected value (probability × value).
+        The score is kept up to date by the mutators, so this is O(1).
         """
-        score = 0.0
-
-        for square, piece in self.board.items():
-            piece_type = piece["type"]
-            piece_color = piece["color"]
-            value = PIECE_VALUES.get(piece_type, 0)
-
-            # Apply probability for superposition pieces
-            if piece.get("in_superposition", False):
-                value *= piece.get("probability", 1.0)
-                # Superposition bonus — tactical flexibility
-                value *= 1.2
-
-            # Positional bonuses
-            value += self._positional_bonus(square, piece_type, piece_color)
-
-            # Sign: positive for the evaluating color
-            if piece_color == color:
-                score += value
-            else:
-                score -= value
-
-        return score
+        score = self._eval_score
+        return score if color == "white" else -score
 
     def quantum_minimax(
         self, depth: int,
@@ -403,25 +637,39 @@ class EnhancedQuantumChessEngine:
                 return (float("-inf") if maximizing else float("inf")), None
             return 0.0, None  # Stalemate
 
+        # The Zobrist hash covers placement only; superposed pieces score by
+        # probability, so their state is part of the key
+        key = (self.zobrist, current_color, color, self._superposition_key())
+        entry = self._transpositions.get(key)
+        hash_move = None
+        if entry is not None:
+            entry_depth, entry_score, flag, hash_move = entry
+            if entry_depth >= depth:
+                if flag == TT_EXACT:
+                    return entry_score, hash_move
+                if flag == TT_LOWER:
+                    alpha = max(alpha, entry_score)
+                else:
+                    beta = min(beta, entry_score)
+                if beta <= alpha:
+                    return entry_score, hash_move
+        alpha_orig, beta_orig = alpha, beta
+        self._order_moves(moves, hash_move)
+
         best_move = None
         value = float("-inf") if maximizing else float("inf")
 
         for move_str in moves:
-            from_sq, to_sq = move_str.split("-")
+            from_sq, to_sq = MOVE_SQUARES[move_str]
 
-            # Save state
-            saved_state = self._save_state()
-
-            # Apply move
-            self._apply_move(from_sq, to_sq)
+            undo = self._apply_move(from_sq, to_sq)
 
             # Recurse
             eval_score, _ = self.quantum_minimax(
                 depth - 1, alpha, beta, not maximizing, color
             )
 
-            # Restore state
-            self._restore_state(saved_state)
+            self._undo_move(undo)
 
             if maximizing:
                 if eval_score > value:
@@ -437,30 +685,165 @@ class EnhancedQuantumChessEngine:
             if beta <= alpha:
                 break
 
+        if best_move is not None:
+            if value <= alpha_orig:
+                flag = TT_UPPER
+            elif value >= beta_orig:
+                flag = TT_LOWER
+            else:
+                flag = TT_EXACT
+            _cache_put(self._transpositions, key, (depth, value, flag, best_move))
         return value, best_move
 
-    def find_best_move(self, color: str = "white") -> dict:
-        """Find the best move using quantum minimax."""
-        score, best_move = self.quantum_minimax(
-            depth=self.search_depth,
-            maximizing=(color == "white"),
-            color=color,
-        )
+    def _superposition_key(self) -> tuple | None:
+        """Hashable summary of superposed pieces and their probabilities."""
+        if not self.superposition_squares:
+            return None
+        board = self.board
+        return tuple(sorted(
+            (square, board[square]["probability"])
+            for square in self.superposition_squares
+            if square in board
+        ))
+
+    def _order_moves(self, moves: list[str], hash_move: str | None = None):
+        """
+        Sort moves in place for alpha-beta: hash_move first, then captures,
+        most valuable victim first and cheapest attacker breaking ties
+        (MVV-LVA), then quiet moves in generation order.
+        """
+        board = self.board
+        values = PIECE_VALUES
+
+        def mvv_lva(move: str) -> int:
+            from_sq, to_sq = MOVE_SQUARES[move]
+            victim = board.get(to_sq)
+            if victim is None:
+                return 0
+            attacker = board[from_sq]
+            return (values.get(attacker["type"], 0)
+                    - 1000 * values.get(victim["type"], 0))
+
+        moves.sort(key=mvv_lva)
+        if hash_move is not None and hash_move in moves:
+            moves.remove(hash_move)
+            moves.insert(0, hash_move)
+
+    def search_copy(self) -> "EnhancedQuantumChessEngine":
+        """
+        Independent copy of the position and search settings, for searching
+        apart from this engine. Move generation caches and the transposition
+        table start empty rather than being copied.
+        """
+        clone = copy.copy(self)
+        clone.board = {square: dict(piece) for square, piece in self.board.items()}
+        clone.arrays = BoardArrays(*(array.copy() for array in self.arrays))
+        clone.superposition_squares = set(self.superposition_squares)
+        clone.entanglement_pairs = list(self.entanglement_pairs)
+        clone.measurement_cache = dict(self.measurement_cache)
+        clone.square_states = dict(self.square_states)
+        clone._legal_moves_cache = OrderedDict()
+        clone._in_check_cache = OrderedDict()
+        clone._transpositions = OrderedDict()
+        return clone
+
+    def find_best_move(self, color: str = "white",
+                       time_ms: int | None = None) -> dict:
+        """
+        Find the best move using quantum minimax with iterative deepening.
+
+        Searches depth 1, 2, ... up to search_depth; each iteration leaves
+        its best moves in the transposition table, where the next one tries
+        them first. With a time budget (time_ms, else the engine's
+        search_time_ms) no further iteration starts once it is spent, and
+        the deepest completed result is returned.
+
+        Classical positions found in the opening book return the book move
+        without searching, with depth 0 and from_book set.
+        """
+        if self.use_opening_book and not self.superposition_squares:
+            book_move = opening_book().get((self.zobrist, color))
+            if book_move is not None:
+                return {
+                    "best_move": book_move,
+                    "score": self.evaluate_position(color),
+                    "depth": 0,
+                    "from_book": True,
+                }
+
+        if time_ms is None:
+            time_ms = self.search_time_ms
+        deadline = None if time_ms is None else time.monotonic() + time_ms / 1000
+        score, best_move, depth = 0.0, None, 0
+        for depth in range(1, self.search_depth + 1):
+            # color moves at the root and scores are from its side
+            score, best_move = self.quantum_minimax(
+                depth=depth,
+                maximizing=True,
+                color=color,
+            )
+            if deadline is not None and time.monotonic() >= deadline:
+                break
         return {
             "best_move": best_move,
             "score": score,
-            "depth": self.search_depth,
+            "depth": depth,
         }
 
     def get_all_legal_moves(self, color: str) -> list[str]:
-        """Get all legal moves for a color. Returns list of 'from-to' strings."""
-        moves = []
-        for square, piece in self.board.items():
-            if piece["color"] == color:
-                piece_moves = self.get_legal_moves_for_square(square)
-                for target in piece_moves:
-                    moves.append(f"{square}-{target}")
-        return moves
+        """
+        Get all legal moves for a color. Returns list of 'from-to' strings.
+
+        Results are cached per (Zobrist hash, color), so positions that
+        recur during search skip move generation.
+        """
+        key = (self.zobrist, color)
+        cached = self._legal_moves_cache.get(key)
+        if cached is not None:
+            self._legal_moves_cache.move_to_end(key)
+            return list(cached)
+
+        # One pass over color's squares in index order, with the per-square
+        # generators inlined; the order does not depend on the board dict
+        board = self.board
+        moves: list[str] = []
+        append = moves.append
+        for index in np.flatnonzero(self.arrays.color == COLOR_ID[color]).tolist():
+            square = INDEX_TO_SQUARE[index]
+            piece_type = board[square]["type"]
+            rays = SLIDING_RAYS.get(piece_type)
+            if rays is not None:
+                for ray in rays[square]:
+                    for target in ray:
+                        occupant = board.get(target)
+                        if occupant is None:
+                            append(f"{square}-{target}")
+                            continue
+                        if occupant["color"] != color:
+                            append(f"{square}-{target}")
+                        break
+            elif piece_type == "pawn":
+                row, col = SQUARE_TO_COORDS[square]
+                for target in self._pawn_moves(row, col, color):
+                    append(f"{square}-{target}")
+            elif piece_type in STEP_TARGETS:
+                for target in STEP_TARGETS[piece_type][square]:
+                    occupant = board.get(target)
+                    if occupant is None or occupant["color"] != color:
+                        append(f"{square}-{target}")
+        _cache_put(self._legal_moves_cache, key, moves)
+        return list(moves)
+
+    def has_any_legal_move(self, color: str) -> bool:
+        """Whether color has at least one legal move; stops at the first."""
+        cached = self._legal_moves_cache.get((self.zobrist, color))
+        if cached is not None:
+            return bool(cached)
+        return any(
+            self.get_legal_moves_for_square(square)
+            for square, piece in self.board.items()
+            if piece["color"] == color
+        )
 
     def get_legal_moves_for_square(self, square: str) -> list[str]:
         """Get legal target squares for a piece at the given square."""
@@ -472,26 +855,82 @@ class EnhancedQuantumChessEngine:
         color = piece["color"]
 
         moves = []
-        row, col = self._square_to_rc(square)
 
         if piece_type == "pawn":
+            row, col = SQUARE_TO_COORDS[square]
             moves = self._pawn_moves(row, col, color)
         elif piece_type == "knight":
-            moves = self._knight_moves(row, col, color)
+            moves = self._step_moves(KNIGHT_TARGETS[square], color)
         elif piece_type == "bishop":
-            moves = self._sliding_moves(row, col, color, [(1, 1), (1, -1), (-1, 1), (-1, -1)])
+            moves = self._sliding_moves(BISHOP_RAYS[square], color)
         elif piece_type == "rook":
-            moves = self._sliding_moves(row, col, color, [(1, 0), (-1, 0), (0, 1), (0, -1)])
+            moves = self._sliding_moves(ROOK_RAYS[square], color)
         elif piece_type == "queen":
-            moves = self._sliding_moves(row, col, color, [
-                (1, 0), (-1, 0), (0, 1), (0, -1),
-                (1, 1), (1, -1), (-1, 1), (-1, -1),
-            ])
+            moves = self._sliding_moves(QUEEN_RAYS[square], color)
         elif piece_type == "king":
-            moves = self._king_moves(row, col, color)
+            moves = self._step_moves(KING_TARGETS[square], color)
 
         return moves
 
+    def is_legal_move(self, from_sq: str, to_sq: str) -> bool:
+        """
+        Check whether to_sq is among get_legal_moves_for_square(from_sq)
+        by testing that one target directly instead of generating them all.
+        """
+        piece = self.board.get(from_sq)
+        if piece is None or to_sq not in SQUARE_TO_COORDS:
+            return False
+
+        color = piece["color"]
+        target = self.board.get(to_sq)
+        if target is not None and target["color"] == color:
+            return False
+
+        row, col = SQUARE_TO_COORDS[from_sq]
+        to_row, to_col = SQUARE_TO_COORDS[to_sq]
+        dr, dc = to_row - row, to_col - col
+        piece_type = piece["type"]
+
+        if piece_type == "pawn":
+            direction = 1 if color == "white" else -1
+            if dc != 0:
+                # Diagonal captures only
+                return abs(dc) == 1 and dr == direction and target is not None
+            if target is not None:
+                return False
+            if dr == direction:
+                return True
+            # Forward two from starting position, over an empty square
+            start_row = 1 if color == "white" else 6
+            return (dr == 2 * direction and row == start_row
+                    and COORDS_TO_SQUARE[row + direction][col] not in self.board)
+
+        if piece_type == "knight":
+            return to_sq in KNIGHT_TARGETS[from_sq]
+
+        if piece_type == "king":
+            return to_sq in KING_TARGETS[from_sq]
+
+        if piece_type in ("bishop", "rook", "queen"):
+            straight = (dr == 0) != (dc == 0)
+            diagonal = dr != 0 and abs(dr) == abs(dc)
+            if not ((straight and piece_type != "bishop") or
+                    (diagonal and piece_type != "rook")):
+                return False
+            # Every square strictly between must be empty
+            step_r = (dr > 0) - (dr < 0)
+            step_c = (dc > 0) - (dc < 0)
+            r, c = row + step_r, col + step_c
+            board = self.board
+            while (r, c) != (to_row, to_col):
+                if COORDS_TO_SQUARE[r][c] in board:
+                    return False
+                r += step_r
+                c += step_c
+            return True
+
+        return False
+
     def get_superposition_states(self) -> dict[str, dict]:
         """Get information about all squares in superposition."""
         states = {}
@@ -518,163 +957,283 @@ class EnhancedQuantumChessEngine:
 
     def _square_to_rc(self, square: str) -> tuple[int, int]:
         """Convert algebraic notation to (row, col). a1 = (0, 0)."""
-        col = ord(square[0]) - ord("a")
-        row = int(square[1]) - 1
-        return row, col
+        return SQUARE_TO_COORDS[square]
 
     def _rc_to_square(self, row: int, col: int) -> str:
         """Convert (row, col) to algebraic notation."""
-        return f"{chr(col + ord('a'))}{row + 1}"
-
-    def _is_valid_rc(self, row: int, col: int) -> bool:
-        return 0 <= row < 8 and 0 <= col < 8
-
-    def _get_piece_at_rc(self, row: int, col: int) -> dict | None:
-        sq = self._rc_to_square(row, col)
-        return self.board.get(sq)
+        return COORDS_TO_SQUARE[row][col]
 
     def _pawn_moves(self, row: int, col: int, color: str) -> list[str]:
-        moves = []
+        board = self.board
+        moves: list[str] = []
         direction = 1 if color == "white" else -1
         start_row = 1 if color == "white" else 6
 
-        # Forward one
+        # Forward one (a pawn on its last rank has nowhere to go)
         nr = row + direction
-        if self._is_valid_rc(nr, col) and self._get_piece_at_rc(nr, col) is None:
-            moves.append(self._rc_to_square(nr, col))
+        if not 0 <= nr < 8:
+            return moves
+        squares = COORDS_TO_SQUARE[nr]
+        if squares[col] not in board:
+            moves.append(squares[col])
             # Forward two from starting position
-            nr2 = row + 2 * direction
-            if row == start_row and self._get_piece_at_rc(nr2, col) is None:
-                moves.append(self._rc_to_square(nr2, col))
+            if row == start_row:
+                square = COORDS_TO_SQUARE[row + 2 * direction][col]
+                if square not in board:
+                    moves.append(square)
 
         # Diagonal captures
-        for dc in [-1, 1]:
-            nc = col + dc
-            if self._is_valid_rc(nr, nc):
-                target = self._get_piece_at_rc(nr, nc)
+        for nc in (col - 1, col + 1):
+            if 0 <= nc < 8:
+                target = board.get(squares[nc])
                 if target is not None and target["color"] != color:
-                    moves.append(self._rc_to_square(nr, nc))
+                    moves.append(squares[nc])
 
         return moves
 
-    def _knight_moves(self, row: int, col: int, color: str) -> list[str]:
+    def _step_moves(self, targets: tuple[str, ...], color: str) -> list[str]:
+        """Targets from a KNIGHT_TARGETS/KING_TARGETS entry not held by color."""
+        board = self.board
         moves = []
-        offsets = [(-2, -1), (-2, 1), (-1, -2), (-1, 2),
-                   (1, -2), (1, 2), (2, -1), (2, 1)]
-        for dr, dc in offsets:
-            nr, nc = row + dr, col + dc
-            if self._is_valid_rc(nr, nc):
-                target = self._get_piece_at_rc(nr, nc)
-                if target is None or target["color"] != color:
-                    moves.append(self._rc_to_square(nr, nc))
+        for square in targets:
+            target = board.get(square)
+            if target is None or target["color"] != color:
+                moves.append(square)
         return moves
 
-    def _sliding_moves(self, row: int, col: int, color: str,
-                       directions: list[tuple[int, int]]) -> list[str]:
+    def _sliding_moves(self, rays: tuple[tuple[str, ...], ...],
+                       color: str) -> list[str]:
+        """Targets along ROOK_RAYS/BISHOP_RAYS/QUEEN_RAYS rays, up to a blocker."""
+        board = self.board
         moves = []
-        for dr, dc in directions:
-            nr, nc = row + dr, col + dc
-            while self._is_valid_rc(nr, nc):
-                target = self._get_piece_at_rc(nr, nc)
+        for ray in rays:
+            for square in ray:
+                target = board.get(square)
                 if target is None:
-                    moves.append(self._rc_to_square(nr, nc))
-                elif target["color"] != color:
-                    moves.append(self._rc_to_square(nr, nc))
-                    break
-                else:
-                    break
-                nr += dr
-                nc += dc
-        return moves
-
-    def _king_moves(self, row: int, col: int, color: str) -> list[str]:
-        moves = []
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                if dr == 0 and dc == 0:
+                    moves.append(square)
                     continue
-                nr, nc = row + dr, col + dc
-                if self._is_valid_rc(nr, nc):
-                    target = self._get_piece_at_rc(nr, nc)
-                    if target is None or target["color"] != color:
-                        moves.append(self._rc_to_square(nr, nc))
+                if target["color"] != color:
+                    moves.append(square)
+                break
         return moves
 
     def _is_in_check(self, color: str) -> bool:
         """Check if the given color's king is in check."""
-        # Find king
-        king_square = None
-        for square, piece in self.board.items():
-            if piece["type"] == "king" and piece["color"] == color:
-                king_square = square
-                break
-        if king_square is None:
+        key = (self.zobrist, color)
+        in_check = self._in_check_cache.get(key)
+        if in_check is None:
+            in_check = self._compute_in_check(color)
+            _cache_put(self._in_check_cache, key, in_check)
+        else:
+            self._in_check_cache.move_to_end(key)
+        return in_check
+
+    def _compute_in_check(self, color: str) -> bool:
+        """
+        Check detection without consulting the cache. The king is located
+        with a vectorised scan of the board arrays; attackers are found by
+        looking outward from the king square (knight, king and pawn tables,
+        then the first piece along each ray) rather than by trying every
+        opponent piece.
+        """
+        arrays = self.arrays
+        kings = np.flatnonzero(
+            (arrays.piece_type == PIECE_ID["king"]) & (arrays.color == COLOR_ID[color])
+        )
+        if not len(kings):
             return False
+        king_square = INDEX_TO_SQUARE[kings[0]]
 
-        # Check if any opponent piece can attack the king
-        opponent = "black" if color == "white" else "white"
-        for square, piece in self.board.items():
-            if piece["color"] == opponent:
-                targets = self.get_legal_moves_for_square(square)
-                if king_square in targets:
+        board = self.board
+
+        def attacked_from(squares, attacker_types) -> bool:
+            for square in squares:
+                piece = board.get(square)
+                if (piece is not None and piece["color"] != color
+                        and piece["type"] in attacker_types):
                     return True
+            return False
+
+        if (attacked_from(KNIGHT_TARGETS[king_square], ("knight",))
+                or attacked_from(PAWN_ATTACKS[color][king_square], ("pawn",))
+                or attacked_from(KING_TARGETS[king_square], ("king",))):
+            return True
+
+        # Sliders: only the nearest piece on each ray can give check
+        for rays, attacker_types in ((ROOK_RAYS, ("rook", "queen")),
+                                     (BISHOP_RAYS, ("bishop", "queen"))):
+            for ray in rays[king_square]:
+                for square in ray:
+                    piece = board.get(square)
+                    if piece is None:
+                        continue
+                    if piece["color"] != color and piece["type"] in attacker_types:
+                        return True
+                    break
         return False
 
-    def _apply_move(self, from_sq: str, to_sq: str):
-        """Apply a move on the board (mutates state)."""
-        if from_sq in self.board:
-            piece = self.board.pop(from_sq)
-            piece["in_superposition"] = False
-            piece["probability"] = 1.0
-            self.board[to_sq] = piece
-            self.superposition_squares.discard(from_sq)
-            self.superposition_squares.discard(to_sq)
-
-    def _save_state(self) -> dict:
-        """Save board state for undo during search."""
-        import copy
-        return {
-            "board": copy.deepcopy(self.board),
-            "superposition_squares": set(self.superposition_squares),
-            "entanglement_pairs": list(self.entanglement_pairs),
-        }
+    def _apply_move(self, from_sq: str, to_sq: str) -> Optional[tuple]:
+        """
+        Apply a move on the board (mutates state). Returns the record
+        _undo_move needs to take it back, or None if from_sq was empty.
+        """
+        if from_sq not in self.board:
+            return None
+        piece = self.board.pop(from_sq)
+        captured = self.board.get(to_sq)
+        undo = (
+            from_sq, to_sq, piece, captured,
+            piece["in_superposition"], piece["probability"],
+            from_sq in self.superposition_squares,
+            to_sq in self.superposition_squares,
+            self._positional_cache, self._eval_score, self.zobrist,
+        )
+        self._eval_score -= (self._square_score(from_sq, piece)
+                             + self._square_score(to_sq, captured))
+        psq = PositionEvaluator.piece_square_value
+        self._positional_cache += (
+            psq(piece["type"], piece["color"], to_sq)
+            - psq(piece["type"], piece["color"], from_sq)
+        )
+        self.zobrist ^= (
+            ZOBRIST_KEYS[(piece["type"], piece["color"], from_sq)]
+            ^ ZOBRIST_KEYS[(piece["type"], piece["color"], to_sq)]
+        )
+        if captured is not None:
+            self._positional_cache -= psq(
+                captured["type"], captured["color"], to_sq
+            )
+            self.zobrist ^= ZOBRIST_KEYS[
+                (captured["type"], captured["color"], to_sq)
+            ]
+        piece["in_superposition"] = False
+        piece["probability"] = 1.0
+        self.board[to_sq] = piece
+        self.arrays.set_square(from_sq, None)
+        self.arrays.set_square(to_sq, piece)
+        self.superposition_squares.discard(from_sq)
+        self.superposition_squares.discard(to_sq)
+        self._eval_score += self._square_score(to_sq, piece)
+        return undo
+
+    def _undo_move(self, undo: Optional[tuple]):
+        """
+        Take back a move using the record returned by _apply_move. Only
+        the two squares are restored; move generation reads squares in
+        index order, so the board's key order does not matter.
+        """
+        if undo is None:
+            return
+        (from_sq, to_sq, piece, captured, in_superposition, probability,
+         from_superposed, to_superposed, positional, score, zobrist) = undo
+        piece["in_superposition"] = in_superposition
+        piece["probability"] = probability
+        board = self.board
+        if captured is not None:
+            board[to_sq] = captured
+        else:
+            del board[to_sq]
+        board[from_sq] = piece
+        self.arrays.set_square(from_sq, piece)
+        self.arrays.set_square(to_sq, captured)
+        if from_superposed:
+            self.superposition_squares.add(from_sq)
+        if to_superposed:
+            self.superposition_squares.add(to_sq)
+        self._positional_cache = positional
+        self._eval_score = score
+        self.zobrist = zobrist
+
+    def _refresh_positional_cache(self):
+        """Recompute the positional score with a full board scan."""
+        psq = PositionEvaluator.piece_square_value
+        self._positional_cache = sum(
+            psq(piece["type"], piece["color"], square)
+            for square, piece in self.board.items()
+        )
 
-    def _restore_state(self, state: dict):
-        """Restore board state from saved snapshot."""
-        self.board = state["board"]
-        self.superposition_squares = state["superposition_squares"]
-        self.entanglement_pairs = state["entanglement_pairs"]
+    def _refresh_eval_score(self):
+        """Recompute evaluate_position's score (positive for white) in full."""
+        # Every piece as if classical, gathered from the board arrays
+        arrays = self.arrays
+        values = CLASSICAL_EVAL[arrays.color, arrays.piece_type, ALL_SQUARES]
+        for square in self.superposition_squares:
+            piece = self.board.get(square)
+            if piece is not None and piece["in_superposition"]:
+                values[SQUARE_INDEX[square]] = self._square_score(square, piece)
+        self._eval_score = float(values.sum())
+
+    def _square_score(self, square: str, piece: dict | None) -> float:
+        """One square's contribution to the evaluate_position score."""
+        if piece is None:
+            return 0.0
+        key = (piece["type"], piece["color"], square)
+        if piece["in_superposition"] and square in self.superposition_squares:
+            # Expected material with a bonus for tactical flexibility
+            return COLOR_SIGN[key[1]] * (
+                PIECE_VALUES.get(key[0], 0) * piece["probability"] * 1.2
+                + POSITIONAL_BONUS[key]
+            )
+        return PIECE_SQUARE_EVAL.get(key, 0.0)
+
+    def _refresh_zobrist(self):
+        """Recompute the Zobrist hash from the whole board."""
+        zobrist = 0
+        for square, piece in self.board.items():
+            zobrist ^= ZOBRIST_KEYS[(piece["type"], piece["color"], square)]
+        self.zobrist = zobrist
 
     def _collapse_entangled(self, square: str):
         """When a square is measured, collapse any entangled partner."""
-        pairs_to_remove = []
-        for pair in self.entanglement_pairs:
-            if square in pair:
-                partner = pair[1] if pair[0] == square else pair[0]
-                if partner in self.superposition_squares:
-                    self.measure_square(partner)
-                pairs_to_remove.append(pair)
-        for pair in pairs_to_remove:
-            self.entanglement_pairs.remove(pair)
+        pairs = [pair for pair in self.entanglement_pairs if square in pair]
+        if not pairs:
+            return
+        # Drop the pairs before measuring partners, which recurse into here
+        self.entanglement_pairs[:] = [
+            pair for pair in self.entanglement_pairs if square not in pair
+        ]
+        for pair in pairs:
+            partner = pair[1] if pair[0] == square else pair[0]
+            if partner in self.superposition_squares:
+                self.measure_square(partner)
 
     def _positional_bonus(self, square: str, piece_type: str,
                           color: str) -> float:
         """Calculate positional bonus for a piece."""
-        row, col = self._square_to_rc(square)
+        return POSITIONAL_BONUS[(piece_type, color, square)]
 
-        bonus = 0.0
 
-        # Center control bonus
-        center_dist = abs(row - 3.5) + abs(col - 3.5)
-        bonus += (7 - center_dist) * 0.05
+def _cache_put(cache: OrderedDict, key, value):
+    """Insert into an LRU-ordered cache, evicting the oldest entry when full."""
+    cache[key] = value
+    if len(cache) > TRANSPOSITION_CACHE_SIZE:
+        cache.popitem(last=False)
 
-        # Pawn advancement bonus
-        if piece_type == "pawn":
-            advancement = row if color == "white" else (7 - row)
-            bonus += advancement * 0.1
 
-        # Knight centrality bonus
-        if piece_type == "knight":
-            bonus += (7 - center_dist) * 0.1
+# ─── Opening Book ────────────────────────────────────────────────────────────
 
-        return bonus
+OPENING_BOOK_PATH = Path(__file__).with_name("opening_book.json")
+
+
+@lru_cache()
+def opening_book() -> dict[tuple[int, str], str]:
+    """
+    Book move per (Zobrist hash, side to move), loaded on first use.
+
+    The book file lists opening lines as move sequences; each is replayed
+    from the initial position, and every position along it maps to the
+    line's next move. Earlier lines take precedence where lines share a
+    position.
+    """
+    with OPENING_BOOK_PATH.open() as f:
+        lines = json.load(f)["lines"]
+    book: dict[tuple[int, str], str] = {}
+    engine = EnhancedQuantumChessEngine(use_opening_book=False)
+    for line in lines:
+        engine.initialize_board()
+        color = "white"
+        for move in line:
+            book.setdefault((engine.zobrist, color), move)
+            engine._apply_move(*MOVE_SQUARES[move])
+            color = "black" if color == "white" else "white"
+    return book
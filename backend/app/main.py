@@ -11,6 +11,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.config import get_settings
 from app.services.game_manager import GameManager
@@ -38,6 +39,8 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("🚀 Starting Quantum Chess Ultimate API")
     cache = CacheManager()
+    # Evicts position evaluations as their TTL runs out
+    cache.start_sweeper()
     game_manager = GameManager(cache=cache)
     ws_manager = ConnectionManager()
 
@@ -55,7 +58,8 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("🛑 Shutting down Quantum Chess Ultimate API")
-    await cache.clear()
+    await cache.stop_sweeper()
+    cache.clear()
     logger.info("✅ Cleanup complete")
 
 
@@ -66,6 +70,7 @@ app = FastAPI(
     description="Backend API for Quantum Chess with quantum computing integration",
     version=settings.APP_VERSION,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS
@@ -162,5 +167,5 @@ async def websocket_endpoint(websocket: WebSocket, game_id: str):
     except WebSocketDisconnect:
         ws_manager.disconnect(game_id, websocket)
     except Exception as e:
-        logger.error(f"WebSocket error for game {game_id}: {e}")
+        logger.error("WebSocket error for game %s: %s", game_id, e)
         ws_manager.disconnect(game_id, websocket)
@@ -3,7 +3,7 @@ Quantum Chess Ultimate - Game Models
 Pydantic models for game state, configuration, and responses.
 """
 
-from pydantic import BaseModel, Field
+from pydantic import AliasChoices, BaseModel, Field
 from typing import Optional
 from enum import Enum
 from datetime import datetime
@@ -48,7 +48,12 @@ class PieceInfo(BaseModel):
     type: PieceType
     color: PieceColor
     in_superposition: bool = False
-    superposition_probability: float = 1.0
+    # Also accepts the engine's "probability" key, so engine piece dicts
+    # validate as-is
+    superposition_probability: float = Field(
+        default=1.0,
+        validation_alias=AliasChoices("superposition_probability", "probability"),
+    )
 
 
 class GameConfig(BaseModel):
@@ -59,6 +64,10 @@ class GameConfig(BaseModel):
         description="Probability of quantum effects triggering"
     )
     search_depth: int = Field(default=3, ge=1, le=6)
+    search_time_ms: Optional[int] = Field(
+        default=None, ge=1,
+        description="Stop deepening the AI search once this budget is spent"
+    )
     player_white: str = "Player 1"
     player_black: str = "Player 2"
 
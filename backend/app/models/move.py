@@ -3,8 +3,11 @@ Quantum Chess Ultimate - Move Models
 Pydantic models for chess moves and move results.
 """
 
+from dataclasses import dataclass
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import Annotated, Optional
+
+Square = Annotated[str, Field(pattern=r"^[a-h][1-8]$")]
 
 
 class Move(BaseModel):
@@ -40,8 +43,38 @@ class MoveResult(BaseModel):
     message: str = ""
 
 
+@dataclass(slots=True)
+class MoveOutcome:
+    """
+    Result of executing a move, as produced by the game state manager.
+    Same fields as MoveResult without per-field validation; the move
+    route encodes it directly, with MoveResult documenting the shape.
+    """
+    success: bool
+    from_square: str
+    to_square: str
+    piece_moved: str
+    piece_captured: Optional[str] = None
+    is_check: bool = False
+    is_checkmate: bool = False
+    is_stalemate: bool = False
+    quantum_event: Optional[str] = None
+    quantum_probability: Optional[float] = None
+    superposition_created: bool = False
+    measurement_triggered: bool = False
+    message: str = ""
+
+
 class LegalMovesResponse(BaseModel):
     """Response containing legal moves for a position."""
     square: str
     legal_moves: list[str]
     quantum_moves: list[str] = []
+
+
+class SquaresRequest(BaseModel):
+    """A batch query over several squares."""
+    squares: list[Square] = Field(
+        ..., max_length=64,
+        description="Squares in algebraic notation (e.g., ['e2', 'g1'])"
+    )
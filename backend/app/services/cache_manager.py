@@ -2,64 +2,136 @@
 Quantum Chess Ultimate - Cache Manager
 
 In-memory caching for position evaluations and quantum measurements.
-Provides a Redis-compatible interface for future migration.
+The in-memory cache is synchronous; AsyncCacheAdapter provides the
+awaitable, Redis-style interface for callers written against one.
 """
 
+import asyncio
+import heapq
 import time
 import logging
-from typing import Any, Optional
+from typing import Any, Optional, Protocol
 
 logger = logging.getLogger(__name__)
 
 
+class CacheBackend(Protocol):
+    """Synchronous cache interface implemented by CacheManager."""
+
+    def get(self, key: str, sig: Any = None) -> Optional[Any]: ...
+    def set(self, key: str, value: Any, ttl: int | None = None,
+            sig: Any = None): ...
+    def delete(self, key: str): ...
+    def clear(self): ...
+
+
 class CacheManager:
     """
     In-memory cache with TTL support.
     Drop-in replaceable with Redis when needed.
+
+    Expiry times are also kept in a min-heap, so cleanup only visits
+    entries that have expired. Heap items for overwritten or deleted keys
+    are left in place and skipped when popped.
+
+    An entry may also carry a signature, such as a game's version or
+    position key. get() treats an entry whose signature differs from the
+    caller's as a miss, so bumping the signature invalidates every entry
+    derived from the old state without touching them.
     """
 
+    __slots__ = ("_cache", "_expiry", "_sweeper", "default_ttl", "hits", "misses")
+
     def __init__(self, default_ttl: int = 300):
-        self._cache: dict[str, dict] = {}
+        # key -> (value, expires_at, sig)
+        self._cache: dict[str, tuple[Any, float, Any]] = {}
+        # (expires_at, key), possibly stale
+        self._expiry: list[tuple[float, str]] = []
+        self._sweeper: Optional[asyncio.Task] = None
         self.default_ttl = default_ttl
         self.hits = 0
         self.misses = 0
 
-    async def get(self, key: str) -> Optional[Any]:
-        """Get value from cache. Returns None if expired or missing."""
+    def get(self, key: str, sig: Any = None) -> Optional[Any]:
+        """
+        Get value from cache. Returns None if expired or missing, or if sig
+        is given and the entry was stored under a different signature.
+        """
         entry = self._cache.get(key)
         if entry is None:
             self.misses += 1
             return None
 
-        if time.time() > entry["expires_at"]:
+        value, expires_at, entry_sig = entry
+        if time.time() > expires_at or (sig is not None and entry_sig != sig):
             del self._cache[key]
             self.misses += 1
             return None
 
         self.hits += 1
-        return entry["value"]
+        return value
 
-    async def set(self, key: str, value: Any, ttl: int | None = None):
-        """Set value in cache with TTL."""
+    def set(self, key: str, value: Any, ttl: int | None = None,
+            sig: Any = None):
+        """Set value in cache with TTL, optionally tagged with a signature."""
         expires_at = time.time() + (ttl or self.default_ttl)
-        self._cache[key] = {"value": value, "expires_at": expires_at}
+        self._cache[key] = (value, expires_at, sig)
+        expiry = self._expiry
+        heapq.heappush(expiry, (expires_at, key))
+        # Overwrites leave stale heap items behind; rebuild once they
+        # outnumber the live entries
+        if len(expiry) > 2 * len(self._cache) + 64:
+            expiry[:] = [(entry[1], k) for k, entry in self._cache.items()]
+            heapq.heapify(expiry)
 
-    async def delete(self, key: str):
+    def delete(self, key: str):
         """Delete a cache entry."""
         self._cache.pop(key, None)
 
-    async def clear(self):
+    def clear(self):
         """Clear all cache entries."""
         self._cache.clear()
+        self._expiry.clear()
         self.hits = 0
         self.misses = 0
 
-    async def cleanup(self):
+    def cleanup(self):
         """Remove expired entries."""
         now = time.time()
-        expired = [k for k, v in self._cache.items() if now > v["expires_at"]]
-        for key in expired:
-            del self._cache[key]
+        cache = self._cache
+        expiry = self._expiry
+        heappop = heapq.heappop
+        while expiry and expiry[0][0] < now:
+            expires_at, key = heappop(expiry)
+            entry = cache.get(key)
+            # Skip items for keys that were since overwritten or deleted
+            if entry is not None and entry[1] == expires_at:
+                del cache[key]
+
+    def start_sweeper(self):
+        """Start a background task that evicts entries as they expire."""
+        if self._sweeper is None or self._sweeper.done():
+            self._sweeper = asyncio.create_task(self._sweep())
+
+    async def stop_sweeper(self):
+        """Cancel the background sweeper, if running."""
+        sweeper, self._sweeper = self._sweeper, None
+        if sweeper is not None:
+            sweeper.cancel()
+            try:
+                await sweeper
+            except asyncio.CancelledError:
+                pass
+
+    async def _sweep(self):
+        while True:
+            self.cleanup()
+            # Sleep until the next expiry, waking at least once per default
+            # TTL to pick up shorter-lived entries added in the meantime
+            delay = self.default_ttl
+            if self._expiry:
+                delay = min(delay, self._expiry[0][0] - time.time())
+            await asyncio.sleep(max(delay, 0.0))
 
     def stats(self) -> dict:
         """Return cache statistics."""
@@ -70,3 +142,28 @@ class CacheManager:
             "misses": self.misses,
             "hit_rate": round(self.hits / total, 2) if total > 0 else 0.0,
         }
+
+
+class AsyncCacheAdapter:
+    """
+    Awaitable view of a synchronous cache, matching the interface of an
+    async Redis client so call sites can switch backends unchanged.
+    """
+
+    __slots__ = ("cache",)
+
+    def __init__(self, cache: CacheBackend):
+        self.cache = cache
+
+    async def get(self, key: str, sig: Any = None) -> Optional[Any]:
+        return self.cache.get(key, sig)
+
+    async def set(self, key: str, value: Any, ttl: int | None = None,
+                  sig: Any = None):
+        self.cache.set(key, value, ttl, sig)
+
+    async def delete(self, key: str):
+        self.cache.delete(key)
+
+    async def clear(self):
+        self.cache.clear()
@@ -7,8 +7,22 @@ Provides circuit statistics and depth reduction hints.
 
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Each superposition requires RY + measurement
+GATES_PER_SUPERPOSITION = 6  # X gates for encoding + RY + measure
+# Each entanglement requires CNOT gates
+GATES_PER_ENTANGLEMENT = 4  # CNOT + controlled phase gates
+QUBITS_PER_SUPERPOSITION = 5
+GATE_RUNTIME_MS = 0.1
+
+# Thresholds above which _get_suggestions flags a circuit
+MAX_QUBITS = 30
+MAX_DEPTH = 20
+MAX_GATES = 100
+
 
 class CircuitOptimizer:
     """
@@ -21,16 +35,11 @@ class CircuitOptimizer:
         """
         Analyze circuit complexity for a given quantum state.
         """
-        # Each superposition requires RY + measurement
-        gates_per_superposition = 6  # X gates for encoding + RY + measure
-        # Each entanglement requires CNOT gates
-        gates_per_entanglement = 4  # CNOT + controlled phase gates
-
-        total_gates = (superposition_count * gates_per_superposition +
-                       entanglement_count * gates_per_entanglement)
+        total_gates = (superposition_count * GATES_PER_SUPERPOSITION +
+                       entanglement_count * GATES_PER_ENTANGLEMENT)
 
         circuit_depth = max(1, superposition_count + entanglement_count * 2)
-        total_qubits = superposition_count * 5
+        total_qubits = superposition_count * QUBITS_PER_SUPERPOSITION
 
         return {
             "total_qubits": total_qubits,
@@ -38,27 +47,54 @@ class CircuitOptimizer:
             "gate_count": total_gates,
             "superposition_count": superposition_count,
             "entanglement_count": entanglement_count,
-            "estimated_runtime_ms": total_gates * 0.1,
+            "estimated_runtime_ms": total_gates * GATE_RUNTIME_MS,
             "optimization_suggestions": CircuitOptimizer._get_suggestions(
                 total_qubits, circuit_depth, total_gates
             ),
         }
 
+    @staticmethod
+    def analyze_many(superposition_counts: np.ndarray,
+                     entanglement_counts: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Vectorized analyze_circuit over many states at once.
+
+        Returns one array per metric, aligned with the inputs. Instead of
+        suggestion strings, the high_qubits, deep_circuit and many_gates
+        masks mark the states _get_suggestions would flag.
+        """
+        sup = np.asarray(superposition_counts, dtype=np.int64)
+        ent = np.asarray(entanglement_counts, dtype=np.int64)
+        total_gates = sup * GATES_PER_SUPERPOSITION + ent * GATES_PER_ENTANGLEMENT
+        circuit_depth = np.maximum(1, sup + ent * 2)
+        total_qubits = sup * QUBITS_PER_SUPERPOSITION
+        return {
+            "total_qubits": total_qubits,
+            "circuit_depth": circuit_depth,
+            "gate_count": total_gates,
+            "superposition_count": sup,
+            "entanglement_count": ent,
+            "estimated_runtime_ms": total_gates * GATE_RUNTIME_MS,
+            "high_qubits": total_qubits > MAX_QUBITS,
+            "deep_circuit": circuit_depth > MAX_DEPTH,
+            "many_gates": total_gates > MAX_GATES,
+        }
+
     @staticmethod
     def _get_suggestions(qubits: int, depth: int, gates: int) -> list[str]:
         """Generate optimization suggestions based on circuit metrics."""
         suggestions = []
-        if qubits > 30:
+        if qubits > MAX_QUBITS:
             suggestions.append(
                 "High qubit count — consider measuring some "
                 "superpositions to reduce state space"
             )
-        if depth > 20:
+        if depth > MAX_DEPTH:
             suggestions.append(
                 "Deep circuit — performance may degrade. "
                 "Consider reducing overlapping superpositions"
             )
-        if gates > 100:
+        if gates > MAX_GATES:
             suggestions.append(
                 "Many gates — consider batched measurement "
                 "to reset circuit complexity"
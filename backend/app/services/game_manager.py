@@ -5,13 +5,15 @@ High-level service coordinating game lifecycle.
 Manages multiple concurrent games with unique IDs.
 """
 
-import uuid
+import asyncio
 import logging
+import secrets
 from typing import Optional
 
+from app.core.evaluator import PositionEvaluator
 from app.core.game_state import GameStateManager
 from app.models.game import GameConfig, GameState, GameSummary, GameStatus
-from app.models.move import Move, MoveResult
+from app.models.move import Move, MoveOutcome
 from app.services.cache_manager import CacheManager
 
 logger = logging.getLogger(__name__)
@@ -26,16 +28,24 @@ class GameManager:
     def __init__(self, cache: Optional[CacheManager] = None):
         self.games: dict[str, GameStateManager] = {}
         self.cache = cache or CacheManager()
+        # Running best-move searches keyed by (game_id, version)
+        self._best_move_inflight: dict[tuple[str, int], asyncio.Future] = {}
         logger.info("GameManager initialized")
 
     def create_game(self, config: Optional[GameConfig] = None) -> GameState:
         """Create a new game and return its initial state."""
-        game_id = str(uuid.uuid4())[:8]
+        return self.new_game(config).get_state()
+
+    def new_game(self, config: Optional[GameConfig] = None) -> GameStateManager:
+        """Create a new game and return the game itself."""
+        game_id = secrets.token_hex(4)
+        while game_id in self.games:
+            game_id = secrets.token_hex(4)
         cfg = config or GameConfig()
         game = GameStateManager(game_id, cfg)
         self.games[game_id] = game
-        logger.info(f"Game created: {game_id}")
-        return game.get_state()
+        logger.info("Game created: %s", game_id)
+        return game
 
     def get_game(self, game_id: str) -> Optional[GameStateManager]:
         """Get a game instance by ID."""
@@ -46,7 +56,12 @@ class GameManager:
         game = self.games.get(game_id)
         return game.get_state() if game else None
 
-    def make_move(self, game_id: str, move: Move) -> Optional[MoveResult]:
+    def get_state_json(self, game_id: str) -> Optional[bytes]:
+        """Get game state by ID, pre-encoded as JSON."""
+        game = self.games.get(game_id)
+        return game.get_state_json() if game else None
+
+    def make_move(self, game_id: str, move: Move) -> Optional[MoveOutcome]:
         """Execute a move in a game."""
         game = self.games.get(game_id)
         if not game:
@@ -60,6 +75,14 @@ class GameManager:
             return None
         return game.get_legal_moves(square)
 
+    def get_legal_moves_batch(self, game_id: str,
+                              squares: list[str]) -> Optional[dict[str, list[str]]]:
+        """Get legal moves for several squares in a game."""
+        game = self.games.get(game_id)
+        if not game:
+            return None
+        return {square: game.get_legal_moves(square) for square in squares}
+
     def get_all_legal_moves(self, game_id: str) -> Optional[dict]:
         """Get all legal moves for the current player."""
         game = self.games.get(game_id)
@@ -67,30 +90,41 @@ class GameManager:
             return None
         return game.get_all_legal_moves_for_current_player()
 
+    def evaluate_position(self, game_id: str) -> Optional[dict]:
+        """
+        Evaluate a game's position for both colors. Results are cached
+        under the game's version, so any move or measurement invalidates
+        them.
+        """
+        game = self.games.get(game_id)
+        if not game:
+            return None
+        key = f"eval:{game_id}"
+        evals = self.cache.get(key, sig=game.version)
+        if evals is None:
+            engine = game.engine
+            evals = PositionEvaluator.evaluate_both(
+                board=engine.board,
+                superposition_squares=engine.superposition_squares,
+                entanglement_pairs=engine.entanglement_pairs,
+                positional=engine.positional_score,
+                arrays=engine.arrays,
+            )
+            self.cache.set(key, evals, sig=game.version)
+        return evals
+
     def delete_game(self, game_id: str) -> bool:
         """Delete a game."""
         if game_id in self.games:
             del self.games[game_id]
-            logger.info(f"Game deleted: {game_id}")
+            self.cache.delete(f"eval:{game_id}")
+            logger.info("Game deleted: %s", game_id)
             return True
         return False
 
     def list_games(self) -> list[GameSummary]:
         """List all active games."""
-        summaries = []
-        for game_id, game in self.games.items():
-            state = game.get_state()
-            summaries.append(GameSummary(
-                game_id=state.game_id,
-                mode=state.mode,
-                status=state.status,
-                turn=state.turn,
-                move_count=state.move_count,
-                player_white=game.config.player_white,
-                player_black=game.config.player_black,
-                created_at=state.created_at,
-            ))
-        return summaries
+        return [game.get_summary() for game in self.games.values()]
 
     def measure_square(self, game_id: str, square: str) -> Optional[dict]:
         """Measure a quantum square."""
@@ -113,6 +147,34 @@ class GameManager:
             return None
         return game.find_best_move()
 
+    async def find_best_move_shared(self, game_id: str) -> Optional[dict]:
+        """
+        Find best move without blocking the event loop.
+
+        Concurrent callers asking about the same position share a single
+        search. The search runs in a worker thread on a copy of the engine,
+        so moves made meanwhile cannot interleave with it.
+        """
+        game = self.games.get(game_id)
+        if not game:
+            return None
+
+        key = (game_id, game.version)
+        future = self._best_move_inflight.get(key)
+        if future is None:
+            # Position only, taken here so no move can land mid-copy
+            engine = game.engine.search_copy()
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(
+                None, engine.find_best_move, game.turn.value
+            )
+            self._best_move_inflight[key] = future
+            future.add_done_callback(
+                lambda _: self._best_move_inflight.pop(key, None)
+            )
+        # Shielded so one caller disconnecting does not cancel the others
+        return await asyncio.shield(future)
+
     def get_stats(self) -> dict:
         """Get manager statistics."""
         return {
@@ -16,9 +16,9 @@ from app.api.routes import quantum as quantum_routes
 from app.api.routes import analysis as analysis_routes
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
 async def client():
-    """Create test client with all services initialized."""
+    """Create test client with all services initialized, once per session."""
     # Manually initialize services (lifespan doesn't run in test transport)
     cache = CacheManager()
     gm = GameManager(cache=cache)
@@ -37,6 +37,33 @@ async def client():
         yield ac
 
 
+@pytest.fixture(autouse=True)
+def reset_services():
+    """Give every test empty services without rebuilding them."""
+    yield
+    gm = app.state.game_manager
+    gm.games.clear()
+    gm._best_move_inflight.clear()
+    app.state.cache_manager.clear()
+    app.state.ws_manager.active_connections.clear()
+
+
+class TestLifespan:
+    @pytest.mark.asyncio
+    async def test_lifespan_runs_cache_sweeper(self, client, monkeypatch):
+        from fastapi import FastAPI
+        from app.main import lifespan
+        # lifespan rebinds the route modules; put the shared client's back
+        for module in (game_routes, quantum_routes, analysis_routes):
+            monkeypatch.setattr(module, "_game_manager", module._game_manager)
+        scratch = FastAPI()
+        async with lifespan(scratch):
+            sweeper = scratch.state.cache_manager._sweeper
+            assert sweeper is not None and not sweeper.done()
+        assert scratch.state.cache_manager._sweeper is None
+        assert sweeper.cancelled()
+
+
 class TestRootEndpoints:
     @pytest.mark.asyncio
     async def test_root(self, client):
@@ -62,6 +89,16 @@ class TestGameAPI:
         assert "game_id" in data
         assert "state" in data
 
+    @pytest.mark.asyncio
+    async def test_create_response_matches_models(self, client):
+        from app.models.game import GameCreateResponse
+        create = await client.post("/api/game/new", json={})
+        data = create.json()
+        assert GameCreateResponse.model_validate(data).game_id == data["game_id"]
+        # The embedded state is the same payload GET serves
+        resp = await client.get(f"/api/game/{data['game_id']}")
+        assert data["state"] == resp.json()
+
     @pytest.mark.asyncio
     async def test_get_game(self, client):
         create = await client.post("/api/game/new", json={})
@@ -87,6 +124,20 @@ class TestGameAPI:
         data = resp.json()
         assert data["success"] is True
 
+    @pytest.mark.asyncio
+    async def test_move_response_matches_move_result(self, client):
+        from app.models.move import MoveResult
+        create = await client.post("/api/game/new", json={})
+        game_id = create.json()["game_id"]
+        resp = await client.post(
+            f"/api/game/{game_id}/move",
+            json={"from_square": "g1", "to_square": "f3"},
+        )
+        data = resp.json()
+        assert set(data) == set(MoveResult.model_fields)
+        assert data["piece_moved"] == "knight"
+        assert data["piece_captured"] is None
+
     @pytest.mark.asyncio
     async def test_get_legal_moves(self, client):
         create = await client.post("/api/game/new", json={})
@@ -97,6 +148,44 @@ class TestGameAPI:
         assert "e3" in data["legal_moves"]
         assert "e4" in data["legal_moves"]
 
+    @pytest.mark.asyncio
+    async def test_get_legal_moves_batch(self, client):
+        create = await client.post("/api/game/new", json={})
+        game_id = create.json()["game_id"]
+        resp = await client.post(
+            f"/api/game/{game_id}/legal-moves/batch",
+            json={"squares": ["e2", "g1", "e1"]},
+        )
+        assert resp.status_code == 200
+        moves = resp.json()["legal_moves"]
+        assert sorted(moves["e2"]) == ["e3", "e4"]
+        assert sorted(moves["g1"]) == ["f3", "h3"]
+        assert moves["e1"] == []
+
+    @pytest.mark.asyncio
+    async def test_get_all_legal_moves(self, client):
+        create = await client.post("/api/game/new", json={})
+        game_id = create.json()["game_id"]
+        resp = await client.get(f"/api/game/{game_id}/all-legal-moves")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["game_id"] == game_id
+        assert sorted(data["moves"]["e2"]) == ["e3", "e4"]
+        assert len(data["moves"]) == 10  # 8 pawns + 2 knights
+
+    @pytest.mark.asyncio
+    async def test_list_games_matches_summary_model(self, client):
+        from app.models.game import GameSummary
+        create = await client.post("/api/game/new", json={"mode": "classical"})
+        game_id = create.json()["game_id"]
+        resp = await client.get("/api/game/")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/json"
+        summaries = [GameSummary.model_validate(item) for item in resp.json()]
+        listed = next(s for s in summaries if s.game_id == game_id)
+        assert listed.mode.value == "classical"
+        assert listed.move_count == 0
+
     @pytest.mark.asyncio
     async def test_delete_game(self, client):
         create = await client.post("/api/game/new", json={})
@@ -126,6 +215,31 @@ class TestQuantumAPI:
         assert "total_qubits" in data
 
 
+    @pytest.mark.asyncio
+    async def test_measure_all_collapses_superpositions(self, client):
+        create = await client.post("/api/game/new", json={})
+        game_id = create.json()["game_id"]
+        engine = app.state.game_manager.get_game(game_id).engine
+        engine.create_superposition("g1", 1.0)
+        engine.create_superposition("b1", 1.0)
+        resp = await client.post(f"/api/quantum/{game_id}/measure", json={})
+        assert resp.status_code == 200
+        measured = resp.json()["measured"]
+        assert sorted(measured) == ["b1", "g1"]
+        assert not engine.superposition_squares
+
+    @pytest.mark.asyncio
+    async def test_concurrent_best_move_shares_search(self, client):
+        import asyncio
+        create = await client.post("/api/game/new", json={"search_depth": 1})
+        game_id = create.json()["game_id"]
+        url = f"/api/quantum/{game_id}/best-move"
+        first, second = await asyncio.gather(client.get(url), client.get(url))
+        assert first.status_code == second.status_code == 200
+        assert first.json() == second.json()
+        assert app.state.game_manager._best_move_inflight == {}
+
+
 class TestAnalysisAPI:
     @pytest.mark.asyncio
     async def test_analyze_position(self, client):
@@ -137,6 +251,25 @@ class TestAnalysisAPI:
         assert "white" in data
         assert "black" in data
 
+    @pytest.mark.asyncio
+    async def test_position_evaluation_cached_per_version(self, client):
+        create = await client.post("/api/game/new", json={"mode": "classical"})
+        game_id = create.json()["game_id"]
+        url = f"/api/analysis/{game_id}/position"
+        cache = app.state.cache_manager
+        first = (await client.post(url)).json()
+        assert (await client.post(url)).json() == first
+        assert cache.hits == 1
+        await client.post(
+            f"/api/game/{game_id}/move",
+            json={"from_square": "e2", "to_square": "e4"},
+        )
+        moved = (await client.post(url)).json()
+        assert moved["white"] != first["white"]
+        assert cache.hits == 1
+        await client.delete(f"/api/game/{game_id}")
+        assert cache.stats()["entries"] == 0
+
     @pytest.mark.asyncio
     async def test_get_history(self, client):
         create = await client.post("/api/game/new", json={})
@@ -144,3 +277,77 @@ class TestAnalysisAPI:
         resp = await client.get(f"/api/analysis/{game_id}/history")
         assert resp.status_code == 200
         assert resp.json()["move_count"] == 0
+
+    @pytest.mark.asyncio
+    async def test_history_etag_revalidation(self, client):
+        create = await client.post("/api/game/new", json={})
+        game_id = create.json()["game_id"]
+        url = f"/api/analysis/{game_id}/history"
+        first = await client.get(url)
+        etag = first.headers["etag"]
+
+        cached = await client.get(url, headers={"If-None-Match": etag})
+        assert cached.status_code == 304
+
+        await client.post(
+            f"/api/game/{game_id}/move",
+            json={"from_square": "e2", "to_square": "e4"},
+        )
+        fresh = await client.get(url, headers={"If-None-Match": etag})
+        assert fresh.status_code == 200
+        assert fresh.headers["etag"] != etag
+        assert fresh.json()["move_count"] == 1
+
+    @pytest.mark.asyncio
+    async def test_history_pagination(self, client):
+        create = await client.post("/api/game/new", json={"mode": "classical"})
+        game_id = create.json()["game_id"]
+        for from_sq, to_sq in [("e2", "e4"), ("e7", "e5"), ("g1", "f3")]:
+            await client.post(
+                f"/api/game/{game_id}/move",
+                json={"from_square": from_sq, "to_square": to_sq},
+            )
+        url = f"/api/analysis/{game_id}/history"
+        full = (await client.get(url)).json()
+        page = (await client.get(url, params={"offset": 1, "limit": 1})).json()
+        assert page["move_count"] == 3
+        assert page["moves"] == full["moves"][1:2]
+        assert page["moves"][0]["move_number"] == 2
+        tail = (await client.get(url, params={"offset": 2})).json()
+        assert [m["to"] for m in tail["moves"]] == ["f3"]
+        bad = await client.get(url, params={"limit": 0})
+        assert bad.status_code == 422
+        too_big = await client.get(url, params={"limit": 10_000})
+        assert too_big.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_history_pages_share_clamped_cache_keys(self, client):
+        create = await client.post("/api/game/new", json={"mode": "classical"})
+        game_id = create.json()["game_id"]
+        await client.post(
+            f"/api/game/{game_id}/move",
+            json={"from_square": "e2", "to_square": "e4"},
+        )
+        url = f"/api/analysis/{game_id}/history"
+        for offset in range(1, 50):
+            page = (await client.get(url, params={"offset": offset, "limit": 5})).json()
+            assert page["moves"] == []
+        await client.get(url)
+        await client.get(url, params={"limit": 5})
+        game = app.state.game_manager.get_game(game_id)
+        history_keys = [k for k in game._payload_cache if str(k).startswith("history:")]
+        assert sorted(history_keys) == ["history:0:1", "history:1:1"]
+
+    @pytest.mark.asyncio
+    async def test_get_probability_batch(self, client):
+        create = await client.post("/api/game/new", json={})
+        game_id = create.json()["game_id"]
+        resp = await client.post(
+            f"/api/analysis/{game_id}/probability/batch",
+            json={"squares": ["e2", "e4"]},
+        )
+        assert resp.status_code == 200
+        squares = resp.json()["squares"]
+        assert squares["e2"]["occupied"] is True
+        assert squares["e2"]["piece_type"] == "pawn"
+        assert squares["e4"]["occupied"] is False
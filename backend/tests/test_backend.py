@@ -43,6 +43,22 @@ class TestQuantumSimulator:
         for bits in results:
             assert bits[0] == 1
 
+    def test_measurement_bits_ordered_by_qubit(self):
+        from app.core.quantum_engine import QuantumSimulator
+        sim = QuantumSimulator(num_qubits=3)
+        sim.x(2)
+        assert sim.measure(shots=4) == [[0, 0, 1]] * 4
+
+    def test_measurement_distribution_follows_state_changes(self):
+        from app.core.quantum_engine import QuantumSimulator
+        import numpy as np
+        sim = QuantumSimulator(num_qubits=2)
+        assert sim.measure(shots=3) == [[0, 0]] * 3
+        sim.x(1)
+        assert sim.measure(shots=3) == [[0, 1]] * 3
+        sim.state = np.array([0, 1, 0, 0], dtype=complex)
+        assert sim.measure(shots=3) == [[1, 0]] * 3
+
     def test_h_gate_creates_superposition(self):
         from app.core.quantum_engine import QuantumSimulator
         import numpy as np
@@ -53,6 +69,68 @@ class TestQuantumSimulator:
         values = {r[0] for r in results}
         assert 0 in values or 1 in values  # At least some variation
 
+    def test_single_qubit_gates_match_kronecker_product(self):
+        from app.core.quantum_engine import QuantumSimulator
+        import numpy as np
+        rng = np.random.default_rng(0)
+        sim = QuantumSimulator(num_qubits=3)
+        state = rng.normal(size=8) + 1j * rng.normal(size=8)
+        sim.state = state / np.linalg.norm(state)
+        expected = sim.state.copy()
+        theta = 0.7
+        ry = np.array([[np.cos(theta / 2), -np.sin(theta / 2)],
+                       [np.sin(theta / 2), np.cos(theta / 2)]])
+        x = np.array([[0, 1], [1, 0]])
+        eye = np.eye(2)
+        # Qubit 0 is the least significant bit, i.e. the last Kronecker factor
+        sim.ry(1, theta)
+        expected = np.kron(np.kron(eye, ry), eye) @ expected
+        sim.x(2)
+        expected = np.kron(np.kron(x, eye), eye) @ expected
+        assert np.allclose(sim.state, expected)
+
+    def test_gates_update_state_in_place(self):
+        from app.core.quantum_engine import QuantumSimulator
+        import numpy as np
+        sim = QuantumSimulator(num_qubits=2)
+        state = sim.state
+        sim.h(0)
+        sim.ry(1, np.pi)
+        sim.x(0)
+        assert sim.state is state
+        # RY(pi) is X up to sign: (|0⟩ + |1⟩)/sqrt(2) on qubit 0, |1⟩ on qubit 1
+        assert np.allclose(np.abs(sim.state), np.array([0, 0, 1, 1]) / np.sqrt(2))
+
+    def test_controlled_gates(self):
+        from app.core.quantum_engine import QuantumSimulator
+        import numpy as np
+        sim = QuantumSimulator(num_qubits=2)
+        sim.h(0)
+        sim.cx(0, 1)
+        # Bell state (|00⟩ + |11⟩) / sqrt(2)
+        assert np.allclose(sim.state, np.array([1, 0, 0, 1]) / np.sqrt(2))
+        sim = QuantumSimulator(num_qubits=3)
+        sim.x(0)
+        sim.x(1)
+        sim.cswap(0, 1, 2)
+        # |011⟩ -> |101⟩ (qubit 0 is the least significant bit)
+        assert np.argmax(np.abs(sim.state)) == 0b101
+        sim.x(0)
+        sim.cswap(0, 1, 2)
+        assert np.argmax(np.abs(sim.state)) == 0b100
+
+    def test_measure_qubit_collapses_entangled_state(self):
+        from app.core.quantum_engine import QuantumSimulator
+        import numpy as np
+        sim = QuantumSimulator(num_qubits=3)
+        sim.h(0)
+        sim.cx(0, 2)
+        outcome = sim.measure_qubit(0)
+        # Qubit 2 was entangled with qubit 0 and collapses with it
+        index = 0b101 if outcome else 0
+        assert np.isclose(abs(sim.state[index]), 1.0)
+        assert np.isclose(np.linalg.norm(sim.state), 1.0)
+
 
 # ─── Enhanced Engine Tests ──────────────────────────────────────
 
@@ -106,6 +184,230 @@ class TestEnhancedQuantumChessEngine:
         assert engine.board["e4"]["type"] == "pawn"
         assert engine.board["e4"]["color"] == "white"
 
+    def test_is_legal_move_matches_generated_moves(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        from app.core.move_validator import SQUARE_TO_COORDS
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        for from_sq, to_sq in [("e2", "e4"), ("e7", "e5"), ("f1", "c4"), ("d8", "h4")]:
+            engine._apply_move(from_sq, to_sq)
+        for square in engine.board:
+            targets = set(engine.get_legal_moves_for_square(square))
+            for target in SQUARE_TO_COORDS:
+                assert engine.is_legal_move(square, target) == (target in targets)
+
+    def test_undo_move_restores_position(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        import copy
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        engine._apply_move("e2", "e4")
+        engine._apply_move("d7", "d5")
+        engine.create_superposition("e4", 0.6)
+        board = copy.deepcopy(engine.board)
+        arrays_key = engine.arrays.key()
+        state = (set(engine.superposition_squares), engine.zobrist,
+                 engine.positional_score)
+        live_board = engine.board
+        # A capture out of superposition, then a quiet move
+        for from_sq, to_sq in [("e4", "d5"), ("g1", "f3")]:
+            undo = engine._apply_move(from_sq, to_sq)
+            engine._undo_move(undo)
+            assert engine.board is live_board
+            assert engine.board == board
+            assert engine.arrays.key() == arrays_key
+            assert (set(engine.superposition_squares), engine.zobrist,
+                    engine.positional_score) == state
+
+    def test_move_generation_ignores_board_key_order(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        moves = engine.get_all_legal_moves("white")
+        shuffled = EnhancedQuantumChessEngine()
+        shuffled.initialize_board()
+        shuffled.board = dict(reversed(shuffled.board.items()))
+        assert shuffled.get_all_legal_moves("white") == moves
+
+    def test_check_detection(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        assert engine._is_in_check("white") is False
+        # Fool's mate
+        for from_sq, to_sq in [("f2", "f3"), ("e7", "e5"), ("g2", "g4"), ("d8", "h4")]:
+            engine._apply_move(from_sq, to_sq)
+        assert engine._is_in_check("white") is True
+        assert engine._is_in_check("black") is False
+
+    def test_check_from_pawns_and_blocked_sliders(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine, PAWN_ATTACKS
+        from app.core.evaluator import BoardArrays
+        assert set(PAWN_ATTACKS["white"]["e4"]) == {"d5", "f5"}
+        assert PAWN_ATTACKS["black"]["a1"] == ()
+
+        def piece(piece_type, color):
+            return {"type": piece_type, "color": color,
+                    "in_superposition": False, "probability": 1.0}
+
+        engine = EnhancedQuantumChessEngine()
+        engine.board = {
+            "e4": piece("king", "white"),
+            "e8": piece("king", "black"),
+            "e6": piece("rook", "black"),
+            "e5": piece("knight", "white"),
+            "d3": piece("pawn", "black"),
+        }
+        engine.arrays = BoardArrays.from_board(engine.board)
+        # The rook is screened by the knight and the pawn attacks downwards
+        assert engine._compute_in_check("white") is False
+        engine.board["d5"] = engine.board.pop("d3")
+        engine.arrays = BoardArrays.from_board(engine.board)
+        assert engine._compute_in_check("white") is True
+
+    def test_knight_and_king_target_tables(self):
+        from app.core.quantum_engine import (
+            EnhancedQuantumChessEngine, KING_TARGETS, KNIGHT_TARGETS,
+        )
+        assert set(KNIGHT_TARGETS["a1"]) == {"b3", "c2"}
+        assert len(KNIGHT_TARGETS["d4"]) == 8
+        assert set(KING_TARGETS["h8"]) == {"g8", "g7", "h7"}
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        assert sorted(engine.get_legal_moves_for_square("g1")) == ["f3", "h3"]
+        assert engine.get_legal_moves_for_square("e1") == []
+
+    def test_sliding_rays_stop_at_blockers(self):
+        from app.core.quantum_engine import (
+            BISHOP_RAYS, EnhancedQuantumChessEngine, QUEEN_RAYS,
+        )
+        assert BISHOP_RAYS["a1"][0] == ("b2", "c3", "d4", "e5", "f6", "g7", "h8")
+        assert sum(len(ray) for ray in QUEEN_RAYS["d4"]) == 27
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        engine._apply_move("d2", "d4")
+        engine._apply_move("e7", "e5")
+        # Up the d-file only as far as the queen's own pawn on d4
+        assert sorted(engine.get_legal_moves_for_square("d1")) == ["d2", "d3"]
+        engine._apply_move("c1", "g5")
+        # Through the vacated e7 onto the enemy queen, and no further
+        assert sorted(engine.get_legal_moves_for_square("g5")) == [
+            "c1", "d2", "d8", "e3", "e7", "f4", "f6", "h4", "h6",
+        ]
+
+    def test_move_ordering_mvv_lva(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        for from_sq, to_sq in [("e2", "e4"), ("d7", "d5"), ("d1", "h5"), ("d8", "f5")]:
+            engine._apply_move(from_sq, to_sq)
+        generated = engine.get_all_legal_moves("white")
+        moves = list(generated)
+        engine._order_moves(moves)
+        # Queen victim first (pawn attacker before queen attacker), then pawns
+        captures = ["e4-f5", "h5-f5", "e4-d5", "h5-h7", "h5-f7"]
+        assert moves[:5] == captures
+        # Quiet moves keep their generation order
+        assert moves[5:] == [m for m in generated if m not in captures]
+        engine._order_moves(moves, hash_move="g1-f3")
+        assert moves[0] == "g1-f3"
+        assert moves[1:6] == captures
+
+    def test_all_legal_moves_match_per_square_moves(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine, INDEX_TO_SQUARE
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        for from_sq, to_sq in [("e2", "e4"), ("d7", "d5"), ("d1", "h5"), ("g8", "f6")]:
+            engine._apply_move(from_sq, to_sq)
+        for color in ("white", "black"):
+            expected = [
+                f"{square}-{target}"
+                for square in INDEX_TO_SQUARE
+                if engine.board.get(square, {}).get("color") == color
+                for target in engine.get_legal_moves_for_square(square)
+            ]
+            assert engine.get_all_legal_moves(color) == expected
+
+    def test_move_squares_table(self):
+        from app.core.quantum_engine import MOVE_SQUARES
+        assert len(MOVE_SQUARES) == 64 * 63
+        assert MOVE_SQUARES["e2-e4"] == ("e2", "e4")
+        assert "e4-e4" not in MOVE_SQUARES
+
+    def test_transposition_table_reuses_search(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine, TT_EXACT
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        score, move = engine.quantum_minimax(2, color="white")
+        key = (engine.zobrist, "white", "white", None)
+        assert engine._transpositions[key] == (2, score, TT_EXACT, move)
+        # A shallower probe is answered from the table
+        assert engine.quantum_minimax(1, color="white") == (score, move)
+        # Superposition changes the evaluation, so it gets its own entry
+        engine.create_superposition("b1", 0.5)
+        engine.quantum_minimax(2, color="white")
+        assert (engine.zobrist, "white", "white", (("b1", 0.5),)) in engine._transpositions
+
+    def test_zobrist_hash_identifies_transpositions(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        start = engine.zobrist
+        moves = engine.get_all_legal_moves("white")
+        engine._apply_move("g1", "f3")
+        assert engine.zobrist != start
+        engine._apply_move("f3", "g1")
+        assert engine.zobrist == start
+        assert engine.get_all_legal_moves("white") == moves
+        engine._refresh_zobrist()
+        assert engine.zobrist == start
+
+    def test_legal_moves_cached_across_move_orders(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        first = engine._apply_move("g1", "f3")
+        second = engine._apply_move("b1", "c3")
+        moves = engine.get_all_legal_moves("black")
+        # Callers may reorder the list without touching the cached copy
+        moves.reverse()
+        engine._undo_move(second)
+        engine._undo_move(first)
+        engine._apply_move("b1", "c3")
+        engine._apply_move("g1", "f3")
+        cached = engine._legal_moves_cache[(engine.zobrist, "black")]
+        assert engine.get_all_legal_moves("black") == cached == moves[::-1]
+        assert len(engine._legal_moves_cache) == 1
+
+    def test_has_any_legal_move(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        from app.core.evaluator import BoardArrays
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        assert engine.has_any_legal_move("white") is True
+        # A lone black pawn blocked head-on
+        engine.board = {
+            "a5": {"type": "pawn", "color": "black",
+                   "in_superposition": False, "probability": 1.0},
+            "a4": {"type": "pawn", "color": "white",
+                   "in_superposition": False, "probability": 1.0},
+        }
+        engine.arrays = BoardArrays.from_board(engine.board)
+        engine._refresh_zobrist()
+        assert engine.has_any_legal_move("black") is False
+        assert engine.get_all_legal_moves("black") == []
+
+    def test_board_arrays_track_moves(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        from app.core.evaluator import BoardArrays
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        engine._apply_move("e2", "e4")
+        engine._apply_move("d7", "d5")
+        engine._apply_move("e4", "d5")
+        engine.create_superposition("d5")
+        assert engine.arrays.key() == BoardArrays.from_board(engine.board).key()
+
     def test_superposition_creation(self):
         from app.core.quantum_engine import EnhancedQuantumChessEngine
         engine = EnhancedQuantumChessEngine()
@@ -124,13 +426,131 @@ class TestEnhancedQuantumChessEngine:
         # After measurement, no longer in superposition
         assert "e2" not in engine.superposition_squares
 
+    def test_measurement_samples_presence_only(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        engine.create_superposition("d8", 1.0)
+        engine.create_superposition("g1", 0.0)
+        assert engine.square_states["d8"] == (0b101, 1, 1.0)
+        # Type and color survive measurement; presence follows probability
+        assert engine.measure_square("d8") == {
+            "type": "queen", "color": "black",
+            "in_superposition": False, "probability": 1.0,
+        }
+        assert engine.measure_square("g1") == {"type": "empty", "color": "white"}
+        assert "g1" not in engine.board
+        assert not engine.square_states
+
+    def test_measure_all_collapses_entangled_squares(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        import pytest
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        engine.create_entanglement("a2", "e7")
+        engine.create_entanglement("b1", "g8")
+        engine.create_superposition("d1", 0.5)
+        results = engine.measure_all()
+        assert set(results) == {"a2", "e7", "b1", "g8", "d1"}
+        assert not engine.superposition_squares
+        assert not engine.entanglement_pairs
+        assert engine.measurement_count == 5
+        score = engine.evaluate_position("white")
+        engine._refresh_eval_score()
+        assert score == pytest.approx(engine.evaluate_position("white"))
+        # Measuring one entangled square collapses its partner too
+        engine.create_entanglement("c2", "c7")
+        engine.measure_square("c2")
+        assert not engine.superposition_squares
+        assert not engine.entanglement_pairs
+
     def test_find_best_move(self):
         from app.core.quantum_engine import EnhancedQuantumChessEngine
-        engine = EnhancedQuantumChessEngine(depth=1)
+        engine = EnhancedQuantumChessEngine(depth=1, use_opening_book=False)
         engine.initialize_board()
         result = engine.find_best_move("white")
         assert "best_move" in result
         assert result["best_move"] is not None
+        assert "from_book" not in result
+
+    def test_find_best_move_plays_for_the_requested_color(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        engine = EnhancedQuantumChessEngine(depth=2, use_opening_book=False)
+        engine.initialize_board()
+        engine._apply_move("e2", "e4")
+        for depth in (1, 2):
+            engine.search_depth = depth
+            from_sq = engine.find_best_move("black")["best_move"].split("-")[0]
+            assert engine.board[from_sq]["color"] == "black"
+
+    def test_find_best_move_deepens_within_time_budget(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        engine = EnhancedQuantumChessEngine(depth=3, use_opening_book=False)
+        engine.initialize_board()
+        result = engine.find_best_move("white")
+        assert result["depth"] == 3
+        # Each shallower iteration left its best move in the table
+        key = (engine.zobrist, "white", "white", None)
+        assert engine._transpositions[key][0] == 3
+        # A spent budget stops after the first completed iteration
+        engine = EnhancedQuantumChessEngine(
+            depth=3, time_limit_ms=1, use_opening_book=False)
+        engine.initialize_board()
+        result = engine.find_best_move("white", time_ms=0)
+        assert result["depth"] == 1
+        assert result["best_move"] in engine.get_all_legal_moves("white")
+
+    def test_search_copy_shares_no_state(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        engine = EnhancedQuantumChessEngine(depth=2, use_opening_book=False)
+        engine.initialize_board()
+        engine.create_superposition("g1", 0.5)
+        engine.find_best_move("white")
+        clone = engine.search_copy()
+        assert clone.find_best_move("white") == engine.find_best_move("white")
+        # Searching or moving on the copy leaves the original untouched
+        clone = engine.search_copy()
+        assert not clone._transpositions and not clone._legal_moves_cache
+        clone._apply_move("e2", "e4")
+        clone.board["g1"]["probability"] = 0.0
+        clone.superposition_squares.discard("g1")
+        assert "e2" in engine.board and "e4" not in engine.board
+        assert engine.board["g1"]["probability"] == 0.5
+        assert engine.superposition_squares == {"g1"}
+        assert engine.arrays.piece_type[12] != 0 and clone.arrays.piece_type[12] == 0
+
+    def test_opening_book_answers_known_positions(self):
+        import json
+        from app.core.quantum_engine import (
+            MOVE_SQUARES, OPENING_BOOK_PATH, EnhancedQuantumChessEngine,
+            opening_book,
+        )
+        engine = EnhancedQuantumChessEngine(depth=3)
+        engine.initialize_board()
+        result = engine.find_best_move("white")
+        assert result["best_move"] == "e2-e4"
+        assert result["depth"] == 0 and result["from_book"] is True
+        engine._apply_move("e2", "e4")
+        assert engine.find_best_move("black")["best_move"] == "e7-e5"
+        # Off-book and superposed positions are searched
+        engine._apply_move("h7", "h6")
+        assert "from_book" not in engine.find_best_move("white")
+        engine.initialize_board()
+        engine.create_superposition("g1", 0.5)
+        assert "from_book" not in engine.find_best_move("white")
+
+        # Every book move is legal where the book plays it
+        book = opening_book()
+        assert len(book) > 50
+        with OPENING_BOOK_PATH.open() as f:
+            lines = json.load(f)["lines"]
+        for line in lines:
+            engine.initialize_board()
+            color = "white"
+            for move in line:
+                assert move in engine.get_all_legal_moves(color), (line, move)
+                engine._apply_move(*MOVE_SQUARES[move])
+                color = "black" if color == "white" else "white"
 
     def test_evaluate_position(self):
         from app.core.quantum_engine import EnhancedQuantumChessEngine
@@ -140,6 +560,74 @@ class TestEnhancedQuantumChessEngine:
         # Initial position should be roughly equal
         assert -5.0 <= score <= 5.0
 
+    def test_positional_bonus_table(self):
+        from app.core.quantum_engine import POSITIONAL_BONUS
+        import pytest
+        # Center control: (7 - distance from the board center) * 0.05
+        assert POSITIONAL_BONUS[("bishop", "white", "a1")] == pytest.approx(0.0)
+        assert POSITIONAL_BONUS[("bishop", "black", "d4")] == pytest.approx(0.3)
+        # Knights get an extra centrality term
+        assert POSITIONAL_BONUS[("knight", "white", "e5")] == pytest.approx(0.9)
+        # Pawn advancement counts from each side's own back rank
+        assert POSITIONAL_BONUS[("pawn", "white", "a7")] == pytest.approx(0.6 + 0.05)
+        assert POSITIONAL_BONUS[("pawn", "black", "a2")] == pytest.approx(0.6 + 0.05)
+
+    def test_piece_square_eval_signed_for_white(self):
+        from app.core.quantum_engine import PIECE_SQUARE_EVAL, POSITIONAL_BONUS
+        for square in ("d1", "d8", "e4"):
+            white = ("queen", "white", square)
+            black = ("queen", "black", square)
+            assert PIECE_SQUARE_EVAL[white] == 9 + POSITIONAL_BONUS[white]
+            assert PIECE_SQUARE_EVAL[black] == -(9 + POSITIONAL_BONUS[black])
+
+    def test_evaluate_position_weights_superposed_pieces(self):
+        from app.core.quantum_engine import (
+            EnhancedQuantumChessEngine, PIECE_VALUES, POSITIONAL_BONUS,
+        )
+        import pytest
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        engine._apply_move("e2", "e4")
+        engine.create_superposition("d1", 0.4)
+        expected = 0.0
+        for square, piece in engine.board.items():
+            bonus = POSITIONAL_BONUS[(piece["type"], piece["color"], square)]
+            value = PIECE_VALUES[piece["type"]]
+            if piece["in_superposition"]:
+                value *= piece["probability"] * 1.2
+            value += bonus
+            expected += value if piece["color"] == "white" else -value
+        assert engine.evaluate_position("white") == pytest.approx(expected)
+        assert engine.evaluate_position("black") == pytest.approx(-expected)
+
+    def test_evaluation_tracks_moves_incrementally(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        import pytest
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+
+        def assert_matches_full_rescan():
+            incremental = engine.evaluate_position("white")
+            engine._refresh_eval_score()
+            assert incremental == pytest.approx(engine.evaluate_position("white"))
+
+        # Capturing a superposed pawn removes its expected value
+        engine.create_superposition("d7", 0.3)
+        for from_sq, to_sq in [("e2", "e4"), ("e4", "e5"), ("e5", "e6")]:
+            engine._apply_move(from_sq, to_sq)
+        before = engine.evaluate_position("white")
+        capture = engine._apply_move("e6", "d7")
+        assert_matches_full_rescan()
+        engine._undo_move(capture)
+        assert engine.evaluate_position("white") == before
+        assert "d7" in engine.superposition_squares
+        engine._apply_move("e6", "d7")
+        assert_matches_full_rescan()
+        engine.promote("d7", "queen")
+        engine.create_superposition("d1", 0.5)
+        assert_matches_full_rescan()
+        assert engine.evaluate_position("white") != before
+
     def test_circuit_info(self):
         from app.core.quantum_engine import EnhancedQuantumChessEngine
         engine = EnhancedQuantumChessEngine()
@@ -185,6 +673,21 @@ class TestGameStateManager:
         result = game.make_move(Move(from_square="e2", to_square="e5"))
         assert result.success is False
 
+    def test_rejected_moves_keep_version(self):
+        from app.core.game_state import GameStateManager
+        from app.models.game import GameConfig, GameMode
+        from app.models.move import Move
+        for mode in (GameMode.QUANTUM, GameMode.CLASSICAL):
+            game = GameStateManager("test-reject", GameConfig(mode=mode))
+            payload = game.get_state_json()
+            version = game.version
+            for from_sq, to_sq in [("e2", "e5"), ("e7", "e5"), ("e4", "e5")]:
+                assert not game.make_move(Move(from_square=from_sq, to_square=to_sq)).success
+            assert game.version == version
+            assert game.get_state_json() is payload
+            assert game.make_move(Move(from_square="e2", to_square="e4")).success
+            assert game.version > version
+
     def test_wrong_turn_rejected(self):
         from app.core.game_state import GameStateManager
         from app.models.game import GameConfig
@@ -194,24 +697,147 @@ class TestGameStateManager:
         assert result.success is False
         assert "white" in result.message.lower()
 
+    def test_move_history_records(self):
+        from app.core.game_state import GameStateManager
+        from app.models.game import GameConfig, GameMode
+        from app.models.move import Move
+        game = GameStateManager("test-7", GameConfig(mode=GameMode.CLASSICAL))
+        game.make_move(Move(from_square="e2", to_square="e4"))
+        game.make_move(Move(from_square="d7", to_square="d5"))
+        game.make_move(Move(from_square="e4", to_square="d5"))
+        assert len(game.history) == 3
+        assert game.move_history[2] == {
+            "move_number": 3, "from": "e4", "to": "d5", "piece": "pawn",
+            "color": "white", "captured": "pawn", "quantum_event": None,
+        }
+
+    def test_pawn_promotion(self):
+        from app.core.game_state import GameStateManager
+        from app.models.game import GameConfig, GameMode
+        from app.models.move import Move
+        game = GameStateManager("test-6", GameConfig(mode=GameMode.CLASSICAL))
+        for from_sq, to_sq in [("b2", "b4"), ("a7", "a5"), ("b4", "a5"),
+                               ("h7", "h6"), ("a5", "a6"), ("h6", "h5"),
+                               ("a6", "b7"), ("h5", "h4")]:
+            assert game.make_move(Move(from_square=from_sq, to_square=to_sq)).success
+        game.make_move(Move(from_square="b7", to_square="a8", promotion="knight"))
+        assert game.engine.board["a8"]["type"] == "knight"
+        assert game.engine.board["a8"]["color"] == "white"
+
+    def test_state_model_cached_until_move(self):
+        from app.core.game_state import GameStateManager
+        from app.models.game import GameConfig
+        from app.models.move import Move
+        game = GameStateManager("test-8", GameConfig())
+        state = game.get_state()
+        assert game.get_state() is state
+        game.make_move(Move(from_square="e2", to_square="e4"))
+        assert game.get_state() is not state
+        assert game.get_state().turn.value == "black"
+
+    def test_state_position_copies_engine_pieces(self):
+        from app.core.game_state import GameStateManager
+        from app.models.game import GameConfig
+        game = GameStateManager("test-12", GameConfig(quantum_probability=0.0))
+        game.engine.create_superposition("g1", 0.5)
+        game._invalidate()
+        knight = game.get_state().position["g1"]
+        assert knight.type.value == "knight"
+        assert knight.in_superposition is True
+        assert knight.superposition_probability == 0.5
+        # The snapshot owns its pieces; later engine changes don't leak in
+        game.engine.board["g1"]["probability"] = 0.25
+        assert knight.superposition_probability == 0.5
+        assert "probability" not in knight.model_dump()
+
+    def test_summary_cached_until_move(self):
+        from app.core.game_state import GameStateManager
+        from app.models.game import GameConfig
+        from app.models.move import Move
+        game = GameStateManager("test-13", GameConfig())
+        summary = game.get_summary()
+        assert game.get_summary() is summary
+        game.make_move(Move(from_square="e2", to_square="e4"))
+        assert game.get_summary() is not summary
+        assert game.get_summary().move_count == 1
+        assert game.get_summary().turn.value == "black"
+
+    def test_classical_games_skip_quantum_events(self):
+        from app.core.game_state import GameStateManager
+        from app.models.game import GameConfig, GameMode
+        from app.models.move import Move
+        game = GameStateManager(
+            "test-10", GameConfig(mode=GameMode.CLASSICAL, quantum_probability=1.0)
+        )
+        assert game._quantum_moves is False
+        result = game.make_move(Move(from_square="e2", to_square="e4"))
+        assert result.success is True
+        assert result.superposition_created is False
+        assert not game.engine.superposition_squares
+        quantum = GameStateManager("test-11", GameConfig(mode=GameMode.QUANTUM))
+        assert quantum._quantum_moves is True
+        # make_move stays the class method, visible to patching and mocks
+        assert "make_move" not in vars(game)
+
+    def test_threefold_repetition_detected(self):
+        from app.core.game_state import GameStateManager
+        from app.models.game import GameConfig, GameMode, GameStatus
+        from app.models.move import Move
+        game = GameStateManager("test-9", GameConfig(mode=GameMode.CLASSICAL))
+        start = game.position_key
+        shuffle = [("g1", "f3"), ("g8", "f6"), ("f3", "g1"), ("f6", "g8")]
+        for from_sq, to_sq in shuffle:
+            game.make_move(Move(from_square=from_sq, to_square=to_sq))
+        assert game.position_key == start
+        assert not game.is_threefold_repetition
+        for from_sq, to_sq in shuffle:
+            assert game.status != GameStatus.DRAW
+            game.make_move(Move(from_square=from_sq, to_square=to_sq))
+        assert game.position_key == start
+        assert game.is_threefold_repetition
+        assert game.status == GameStatus.DRAW
+
+    def test_state_json_cached_until_move(self):
+        import json
+        from app.core.game_state import GameStateManager
+        from app.models.game import GameConfig
+        from app.models.move import Move
+        game = GameStateManager("test-5", GameConfig())
+        encoded = game.get_state_json()
+        assert game.get_state_json() is encoded
+        assert json.loads(encoded) == game.get_state().model_dump(mode="json")
+        game.make_move(Move(from_square="e2", to_square="e4"))
+        assert json.loads(game.get_state_json())["turn"] == "black"
+
+
+    def test_state_json_matches_model_dump(self):
+        import json
+        from app.core.game_state import GameStateManager
+        from app.models.game import GameConfig, GameState
+        from app.models.move import Move
+        game = GameStateManager("test-14", GameConfig(quantum_probability=0.0))
+        for from_sq, to_sq in [("e2", "e4"), ("d7", "d5"), ("e4", "d5")]:
+            game.make_move(Move(from_square=from_sq, to_square=to_sq))
+        game.engine.create_superposition("g1", 0.5)
+        game.engine.create_superposition("b8", 0.5)
+        game.engine.create_entanglement("g1", "b8")
+        game._invalidate()
+        encoded = json.loads(game.get_state_json())
+        assert list(encoded) == list(GameState.model_fields)
+        assert encoded == json.loads(game.get_state().model_dump_json())
 
 # ─── Move Validator Tests ──────────────────────────────────────
 
 class TestMoveValidator:
     """Tests for move validation utilities."""
 
-    def test_valid_squares(self):
-        from app.core.move_validator import MoveValidator
-        assert MoveValidator.is_valid_square("e4") is True
-        assert MoveValidator.is_valid_square("a1") is True
-        assert MoveValidator.is_valid_square("h8") is True
-
-    def test_invalid_squares(self):
+    @pytest.mark.parametrize("square,ok", [
+        ("e4", True), ("a1", True), ("h8", True),
+        ("i1", False), ("a9", False), ("", False), ("abc", False),
+    ])
+    def test_is_valid_square(self, square, ok):
         from app.core.move_validator import MoveValidator
-        assert MoveValidator.is_valid_square("i1") is False
-        assert MoveValidator.is_valid_square("a9") is False
-        assert MoveValidator.is_valid_square("") is False
-        assert MoveValidator.is_valid_square("abc") is False
+        assert MoveValidator.is_valid_square(square) is ok
 
     def test_move_format_validation(self):
         from app.core.move_validator import MoveValidator
@@ -220,14 +846,37 @@ class TestMoveValidator:
         invalid, msg = MoveValidator.validate_move_format("e2", "e2")
         assert invalid is False
 
-    def test_coordinate_conversion(self):
+    @pytest.mark.parametrize("square,coords", [
+        ("a1", (0, 0)), ("h8", (7, 7)), ("e2", (1, 4)),
+    ])
+    def test_coordinate_conversion(self, square, coords):
+        from app.core.move_validator import MoveValidator
+        assert MoveValidator.square_to_coords(square) == coords
+        assert MoveValidator.coords_to_square(*coords) == square
+
+    def test_square_geometry(self):
         from app.core.move_validator import MoveValidator
-        row, col = MoveValidator.square_to_coords("a1")
-        assert row == 0 and col == 0
-        row, col = MoveValidator.square_to_coords("h8")
-        assert row == 7 and col == 7
-        assert MoveValidator.coords_to_square(0, 0) == "a1"
-        assert MoveValidator.coords_to_square(7, 7) == "h8"
+        assert MoveValidator.is_same_color_square("a1", "h8") is True
+        assert MoveValidator.is_same_color_square("a1", "a2") is False
+        assert MoveValidator.manhattan_distance("a1", "h8") == 14
+        assert MoveValidator.chebyshev_distance("a1", "h8") == 7
+        assert MoveValidator.chebyshev_distance("e4", "f6") == 2
+
+    def test_square_index_conversion(self):
+        from app.core.move_validator import MoveValidator
+        assert MoveValidator.square_to_index("a1") == 0
+        assert MoveValidator.square_to_index("h1") == 7
+        assert MoveValidator.square_to_index("a2") == 8
+        assert MoveValidator.square_to_index("h8") == 63
+
+    def test_module_level_helpers(self):
+        from app.core.move_validator import (
+            MoveValidator, is_valid_square, validate_move_format,
+        )
+        assert is_valid_square("e4") is True
+        assert is_valid_square("z9") is False
+        assert validate_move_format("e2", "e4") == (True, "")
+        assert MoveValidator.is_valid_square is is_valid_square
 
 
 # ─── Evaluator Tests ───────────────────────────────────────────
@@ -263,6 +912,88 @@ class TestEvaluator:
         # White should be winning (positive score)
         assert result["combined_score"] > 0
 
+    def test_mobility_is_piece_count_difference(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        from app.core.evaluator import PositionEvaluator
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        del engine.board["d8"]
+        del engine.board["a8"]
+        result = PositionEvaluator.evaluate(
+            engine.board, engine.superposition_squares,
+            engine.entanglement_pairs, "black"
+        )
+        assert result["components"]["mobility"] == 0.2
+
+    def test_superposition_bitboard_roundtrip(self):
+        from app.core.evaluator import bitboard_indices, superposition_bitboard
+        bb = superposition_bitboard({"h8", "a1", "e4"})
+        assert bb == (1 << 63) | 1 | (1 << 28)
+        assert bitboard_indices(bb) == [0, 28, 63]
+        assert superposition_bitboard(set()) == 0
+
+    def test_evaluation_is_memoized(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        from app.core.evaluator import PositionEvaluator, _components_cached
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        args = (engine.board, engine.superposition_squares,
+                engine.entanglement_pairs, "white")
+        first = PositionEvaluator.evaluate(*args)
+        hits = _components_cached.cache_info().hits
+        assert PositionEvaluator.evaluate(*args) == first
+        assert _components_cached.cache_info().hits == hits + 1
+        # Mutating the board changes the key, so the result is recomputed
+        del engine.board["d8"]
+        assert PositionEvaluator.evaluate(*args) != first
+
+    def test_evaluate_both_matches_single_color(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        from app.core.evaluator import PositionEvaluator
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        del engine.board["a8"]
+        args = (engine.board, engine.superposition_squares,
+                engine.entanglement_pairs)
+        both = PositionEvaluator.evaluate_both(*args)
+        assert both["white"] == PositionEvaluator.evaluate(*args, "white")
+        assert both["black"] == PositionEvaluator.evaluate(*args, "black")
+        assert both["black"]["combined_score"] == -both["white"]["combined_score"]
+
+    def test_incremental_positional_matches_full_scan(self):
+        from app.core.quantum_engine import EnhancedQuantumChessEngine
+        from app.core.evaluator import PositionEvaluator
+        engine = EnhancedQuantumChessEngine()
+        engine.initialize_board()
+        for from_sq, to_sq in [("e2", "e4"), ("d7", "d5"), ("e4", "d5")]:
+            engine._apply_move(from_sq, to_sq)
+        args = (engine.board, engine.superposition_squares,
+                engine.entanglement_pairs)
+        assert PositionEvaluator.evaluate(
+            *args, positional=engine.positional_score
+        ) == PositionEvaluator.evaluate(*args)
+
+
+# ─── Circuit Optimizer Tests ───────────────────────────────────
+
+class TestCircuitOptimizer:
+    """Tests for circuit analysis."""
+
+    def test_analyze_many_matches_scalar_analysis(self):
+        import numpy as np
+        from app.services.circuit_optimizer import CircuitOptimizer
+        sup = np.array([0, 2, 7, 12])
+        ent = np.array([0, 1, 8, 20])
+        batch = CircuitOptimizer.analyze_many(sup, ent)
+        for i, (s, e) in enumerate(zip(sup.tolist(), ent.tolist())):
+            single = CircuitOptimizer.analyze_circuit(s, e)
+            for key in ("total_qubits", "circuit_depth", "gate_count",
+                        "estimated_runtime_ms"):
+                assert batch[key][i] == single[key]
+        assert batch["high_qubits"].tolist() == [False, False, True, True]
+        assert batch["deep_circuit"].tolist() == [False, False, True, True]
+        assert batch["many_gates"].tolist() == [False, False, False, True]
+
 
 # ─── Game Manager Tests ────────────────────────────────────────
 
@@ -277,6 +1008,40 @@ class TestGameManager:
         games = gm.list_games()
         assert len(games) == 1
 
+    def test_new_game_returns_registered_game(self):
+        from app.services.game_manager import GameManager
+        gm = GameManager()
+        game = gm.new_game()
+        assert gm.get_game(game.game_id) is game
+        # No state snapshot is built until one is asked for
+        assert game._state is None
+
+    def test_colliding_game_ids_are_redrawn(self, monkeypatch):
+        from app.services import game_manager
+        gm = game_manager.GameManager()
+        ids = iter(["deadbeef", "deadbeef", "cafef00d"])
+        monkeypatch.setattr(game_manager.secrets, "token_hex", lambda n: next(ids))
+        assert gm.create_game().game_id == "deadbeef"
+        # A colliding id is redrawn rather than replacing the live game
+        assert gm.create_game().game_id == "cafef00d"
+        assert len(gm.games) == 2
+
+    def test_list_games_skips_state_snapshots(self):
+        from app.services.game_manager import GameManager
+        from app.models.game import GameConfig, GameMode
+        from app.models.move import Move
+        gm = GameManager()
+        state = gm.create_game(GameConfig(mode=GameMode.CLASSICAL, player_white="Ada"))
+        gm.make_move(state.game_id, Move(from_square="e2", to_square="e4"))
+        [summary] = gm.list_games()
+        assert gm.get_game(state.game_id)._state is None
+        assert summary.game_id == state.game_id
+        assert summary.mode == GameMode.CLASSICAL
+        assert summary.turn == "black"
+        assert summary.move_count == 1
+        assert summary.player_white == "Ada"
+        assert summary.created_at == state.created_at
+
     def test_delete_game(self):
         from app.services.game_manager import GameManager
         gm = GameManager()
@@ -298,33 +1063,86 @@ class TestGameManager:
 class TestCacheManager:
     """Tests for the caching layer."""
 
-    @pytest.mark.asyncio
-    async def test_set_and_get(self):
+    @pytest.fixture
+    def cache(self):
+        from app.services.cache_manager import CacheManager
+        return CacheManager()
+
+    @pytest.mark.parametrize("ops,expected", [
+        ([("set", "key1", "value1")], "value1"),
+        ([], None),
+        ([("set", "key1", "value1"), ("delete", "key1")], None),
+        ([("set", "key1", "value1"), ("set", "key1", "value2")], "value2"),
+    ], ids=["set-get", "miss", "delete", "overwrite"])
+    def test_set_get_delete(self, cache, ops, expected):
+        for op, *args in ops:
+            getattr(cache, op)(*args)
+        assert cache.get("key1") == expected
+
+    def test_signature_mismatch_is_a_miss(self):
+        from app.core.game_state import GameStateManager
+        from app.models.game import GameConfig
+        from app.models.move import Move
         from app.services.cache_manager import CacheManager
         cache = CacheManager()
-        await cache.set("key1", "value1")
-        result = await cache.get("key1")
-        assert result == "value1"
+        game = GameStateManager("test-sig", GameConfig())
+        cache.set("eval", 0.25, sig=game.version)
+        assert cache.get("eval", sig=game.version) == 0.25
+        # Unsigned reads still see the entry
+        assert cache.get("eval") == 0.25
+        game.make_move(Move(from_square="e2", to_square="e4"))
+        assert cache.get("eval", sig=game.version) is None
+        assert cache.stats()["entries"] == 0
+
+    def test_cleanup_drops_only_expired_entries(self, monkeypatch):
+        from app.services import cache_manager
+        cache = cache_manager.CacheManager()
+        clock = [1000.0]
+        monkeypatch.setattr(cache_manager.time, "time", lambda: clock[0])
+        cache.set("stale", "old", ttl=1)
+        cache.set("fresh", "new", ttl=60)
+        cache.set("renewed", "a", ttl=1)
+        cache.set("renewed", "b", ttl=60)
+        clock[0] += 10
+        cache.cleanup()
+        assert cache.stats()["entries"] == 2
+        assert cache.get("fresh") == "new"
+        assert cache.get("renewed") == "b"
+        # Only the live heap items remain
+        assert sorted(key for _, key in cache._expiry) == ["fresh", "renewed"]
 
     @pytest.mark.asyncio
-    async def test_cache_miss(self):
+    async def test_sweeper_evicts_in_background(self):
+        import asyncio
         from app.services.cache_manager import CacheManager
         cache = CacheManager()
-        result = await cache.get("nonexistent")
-        assert result is None
+        cache.set("short", 1, ttl=0.01)
+        cache.start_sweeper()
+        await asyncio.sleep(0.05)
+        assert cache.stats()["entries"] == 0
+        await cache.stop_sweeper()
+        assert cache._sweeper is None
 
     @pytest.mark.asyncio
-    async def test_cache_delete(self):
-        from app.services.cache_manager import CacheManager
+    async def test_async_adapter_wraps_sync_cache(self):
+        from app.services.cache_manager import AsyncCacheAdapter, CacheManager
         cache = CacheManager()
-        await cache.set("key1", "value1")
-        await cache.delete("key1")
-        result = await cache.get("key1")
-        assert result is None
+        adapter = AsyncCacheAdapter(cache)
+        await adapter.set("key1", "value1")
+        assert cache.get("key1") == "value1"
+        assert await adapter.get("key1") == "value1"
+        await adapter.delete("key1")
+        assert await adapter.get("key1") is None
 
-    def test_cache_stats(self):
-        from app.services.cache_manager import CacheManager
+    def test_cache_has_no_instance_dict(self):
+        from app.services.cache_manager import AsyncCacheAdapter, CacheManager
         cache = CacheManager()
+        assert not hasattr(cache, "__dict__")
+        assert not hasattr(AsyncCacheAdapter(cache), "__dict__")
+        with pytest.raises(AttributeError):
+            cache.hit_count = 0
+
+    def test_cache_stats(self, cache):
         stats = cache.stats()
         assert stats["entries"] == 0
         assert stats["hit_rate"] == 0.0
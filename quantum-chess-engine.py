@@ -1,33 +1,194 @@
-from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister, execute, Aer
+from __future__ import annotations
+
+import math
 import numpy as np
-from typing import List, Tuple, Dict
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Optional, Tuple, Dict
+
+if TYPE_CHECKING:
+    from qiskit import QuantumCircuit, QuantumRegister
+
+# Search window bounds
+NEG_INF, POS_INF = -math.inf, math.inf
+
+# Qubits per square register and the size of its state vector
+QUBITS_PER_SQUARE = 5
+SQUARE_STATE_DIM = 2 ** QUBITS_PER_SQUARE
+# Amplitude dtype per precision setting; evaluation does not need double
+STATE_DTYPES = {"single": np.complex64, "double": np.complex128}
+# Bit i of a basis-state index is the value of qubit i
+_QUBIT_SHIFTS = np.arange(QUBITS_PER_SQUARE)
+# Qubit 4 of a square register marks superposition; 0-3 hold the piece
+SUPERPOSITION_QUBIT = 4
+
+
+def _build_move_permutation() -> np.ndarray:
+    """
+    Amplitude permutation of the four controlled-SWAPs in a move circuit.
+
+    On the joint register (start qubits 0-4, end qubits 5-9), every basis
+    state whose start superposition qubit is set has piece qubits i and
+    5 + i exchanged for i < 4. The permutation is its own inverse.
+    """
+    index = np.arange(SQUARE_STATE_DIM ** 2, dtype=np.int32)
+    start_bits = index & 0b1111
+    end_bits = (index >> QUBITS_PER_SQUARE) & 0b1111
+    swapped = (index & ~0b1111 & ~(0b1111 << QUBITS_PER_SQUARE)
+               | end_bits | start_bits << QUBITS_PER_SQUARE)
+    control = (index >> SUPERPOSITION_QUBIT) & 1
+    return np.where(control == 1, swapped, index).astype(np.int32)
+
+
+# All four controlled-SWAPs of a move as one gather over 1024 amplitudes
+MOVE_PERMUTATION = _build_move_permutation()
+
+# Positions whose generated move lists are kept, least recently used first out
+LEGAL_MOVES_CACHE_SIZE = 1 << 12
+# Move circuit templates kept per engine: every square pair, a few probabilities
+MOVE_CIRCUIT_CACHE_SIZE = 64 * 64 * 4
+# Positions whose principal variation move is kept for move ordering
+PV_TABLE_SIZE = 1 << 12
+
+# Piece codes, as read from qubits 0-2 (qubit 0 most significant)
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(1, 7)
+
+
+def _targets(steps: List[Tuple[int, int]]) -> Tuple[Tuple[int, ...], ...]:
+    """Squares one step away from each square (index row * 8 + col)."""
+    return tuple(
+        tuple((row + dr) * 8 + col + dc for dr, dc in steps
+              if 0 <= row + dr < 8 and 0 <= col + dc < 8)
+        for row in range(8) for col in range(8)
+    )
+
+
+def _rays(directions: List[Tuple[int, int]]) -> Tuple[Tuple[Tuple[int, ...], ...], ...]:
+    """Per square, the squares along each direction, nearest first."""
+    rays = []
+    for row in range(8):
+        for col in range(8):
+            square_rays = []
+            for dr, dc in directions:
+                ray = []
+                r, c = row + dr, col + dc
+                while 0 <= r < 8 and 0 <= c < 8:
+                    ray.append(r * 8 + c)
+                    r, c = r + dr, c + dc
+                if ray:
+                    square_rays.append(tuple(ray))
+            rays.append(tuple(square_rays))
+    return tuple(rays)
+
+
+KNIGHT_MOVES = _targets([(1, 2), (2, 1), (2, -1), (1, -2),
+                         (-1, -2), (-2, -1), (-2, 1), (-1, 2)])
+KING_MOVES = _targets([(1, 0), (1, 1), (0, 1), (-1, 1),
+                       (-1, 0), (-1, -1), (0, -1), (1, -1)])
+ROOK_RAYS = _rays([(1, 0), (0, 1), (-1, 0), (0, -1)])
+BISHOP_RAYS = _rays([(1, 1), (1, -1), (-1, 1), (-1, -1)])
+QUEEN_RAYS = tuple(r + b for r, b in zip(ROOK_RAYS, BISHOP_RAYS))
+SLIDER_RAYS = {BISHOP: BISHOP_RAYS, ROOK: ROOK_RAYS, QUEEN: QUEEN_RAYS}
+# Material per piece code (index 7 is unused), for Python loops and as an array
+_PIECE_VALUES = (0, 1, 3, 3, 5, 9, 100, 0)
+PIECE_VALUES = np.array(_PIECE_VALUES, dtype=np.float64)
+# Row of each square (index row * 8 + col)
+SQUARE_ROWS = np.arange(64) // 8
+
+# Indexed by color (0 white, advancing up the rows; 1 black)
+PAWN_DIRECTIONS = (1, -1)
+PAWN_START_ROWS = (1, 6)
+PAWN_CAPTURES = (_targets([(1, -1), (1, 1)]), _targets([(-1, -1), (-1, 1)]))
+# Piece codes along the first rank, a-file to h-file
+BACK_RANK = (ROOK, KNIGHT, BISHOP, QUEEN, KING, BISHOP, KNIGHT, ROOK)
+
+
+def _piece_basis_state(piece: int, color: int) -> int:
+    """Basis-state index of a square holding the piece (qubit 0 most significant)."""
+    return (piece >> 2 & 1) | (piece >> 1 & 1) << 1 | (piece & 1) << 2 | color << 3
 
 class QuantumChessEngine:
-    def __init__(self, depth: int = 4):
+    def __init__(self, depth: int = 4, precision: str = "single"):
         """
         Initialize the quantum chess engine.
         
         Args:
             depth: Maximum search depth for the quantum minimax algorithm
+            precision: "single" (complex64) or "double" (complex128)
+                amplitudes for the simulated state vectors
         """
+        if precision not in STATE_DTYPES:
+            raise ValueError(f"precision must be one of {sorted(STATE_DTYPES)}")
         self.search_depth = depth
-        self.simulator = Aer.get_backend('qasm_simulator')
+        self.precision = precision
         self.quantum_board = self._initialize_quantum_board()
+        self.state_vectors = self._initialize_state_vectors()
+        # (board state, side to move) -> generated moves
+        self._legal_moves_cache: OrderedDict = OrderedDict()
+        # (start, end, probability) -> move circuit template
+        self._move_circuit_cache: OrderedDict = OrderedDict()
+        # Move ordering: up to two quiet cutoff moves per remaining depth,
+        # and the best move found for each (board state, side to move)
+        self.killers: Dict[int, List] = {}
+        self.pv_table: OrderedDict = OrderedDict()
+        # Square -> basis state of the piece there while the search has a
+        # move applied; the split amplitudes of a move leave argmax tied
+        self._moved_pieces: Dict[int, int] = {}
         
-    def _initialize_quantum_board(self) -> Dict[Tuple[int, int], QuantumRegister]:
+    def _initialize_quantum_board(self) -> Dict[Tuple[int, int], Optional[QuantumRegister]]:
         """
-        Create quantum registers for each square on the board.
+        Map each square on the board to its quantum register.
+
+        Registers are only needed to build circuits, so they are created on
+        first use by _register; the simulation runs on state_vectors alone.
+        """
+        return {(row, col): None for row in range(8) for col in range(8)}
+
+    def _register(self, pos: Tuple[int, int]) -> QuantumRegister:
+        """
+        Quantum register of a square, created on first use.
         Each square needs multiple qubits to represent piece type, color, and superposition states.
         """
-        board = {}
-        for row in range(8):
-            for col in range(8):
-                # 3 qubits for piece type (allowing 8 different pieces)
-                # 1 qubit for color
-                # 1 qubit for superposition state
-                board[(row, col)] = QuantumRegister(5, name=f'square_{row}_{col}')
-        return board
+        register = self.quantum_board[pos]
+        if register is None:
+            try:
+                from qiskit import QuantumRegister
+            except ImportError as exc:
+                raise ImportError("qiskit is required to build move circuits") from exc
+            row, col = pos
+            # 3 qubits for piece type (allowing 8 different pieces)
+            # 1 qubit for color
+            # 1 qubit for superposition state
+            register = QuantumRegister(QUBITS_PER_SQUARE, name=f'square_{row}_{col}')
+            self.quantum_board[pos] = register
+        return register
+
+    def _initialize_state_vectors(self) -> np.ndarray:
+        """
+        Create the simulated state of every square register.
+
+        Row i holds the 32 amplitudes of the square at position
+        divmod(i, 8), in the same order as quantum_board. Squares start
+        in |00000>.
+        """
+        states = np.zeros((len(self.quantum_board), SQUARE_STATE_DIM),
+                          dtype=STATE_DTYPES[self.precision])
+        states[:, 0] = 1
+        return states
     
+    def setup_standard_position(self):
+        """Put every square in the basis state of the standard starting position."""
+        states = self.state_vectors
+        states[:] = 0
+        states[:, 0] = 1
+        for color, (back_row, pawn_row) in enumerate(((0, 1), (7, 6))):
+            for col, piece in enumerate(BACK_RANK):
+                for row, code in ((back_row, piece), (pawn_row, PAWN)):
+                    states[row * 8 + col, 0] = 0
+                    states[row * 8 + col, _piece_basis_state(code, color)] = 1
+        self.pv_table.clear()
+        self.killers.clear()
+        self._moved_pieces.clear()
+
     def create_move_circuit(self, start_pos: Tuple[int, int], end_pos: Tuple[int, int], 
                           superposition_prob: float = 0.5) -> QuantumCircuit:
         """
@@ -38,10 +199,20 @@ class QuantumChessEngine:
             end_pos: Ending position (row, col)
             superposition_prob: Probability of creating a superposition state
         """
+        # Registers are fixed per square, so the circuit only depends on the
+        # squares and probability; build it once and hand out copies
+        key = (start_pos, end_pos, superposition_prob)
+        cache = self._move_circuit_cache
+        template = cache.get(key)
+        if template is not None:
+            cache.move_to_end(key)
+            return template.copy()
+
         # Create quantum circuit for the move
+        start_register = self._register(start_pos)
+        end_register = self._register(end_pos)
+        from qiskit import QuantumCircuit
         qc = QuantumCircuit()
-        start_register = self.quantum_board[start_pos]
-        end_register = self.quantum_board[end_pos]
         qc.add_register(start_register)
         qc.add_register(end_register)
         
@@ -53,7 +224,42 @@ class QuantumChessEngine:
         for i in range(4):  # First 4 qubits contain piece information
             qc.cswap(start_register[4], start_register[i], end_register[i])
         
-        return qc
+        cache[key] = qc
+        if len(cache) > MOVE_CIRCUIT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return qc.copy()
+
+    def simulate_move(self, start_pos: Tuple[int, int], end_pos: Tuple[int, int],
+                      superposition_prob: float = 0.5) -> np.ndarray:
+        """
+        Simulate a move circuit on the two squares' current state vectors.
+
+        Applies the same ry and controlled-SWAPs as create_move_circuit, with
+        the four swaps fused into a single MOVE_PERMUTATION gather.
+
+        Args:
+            start_pos: Starting position (row, col)
+            end_pos: Ending position (row, col)
+            superposition_prob: Probability of creating a superposition state
+
+        Returns:
+            1024 amplitudes of the joint register, indexed
+            end_state * 32 + start_state
+        """
+        start = self.state_vectors[start_pos[0] * 8 + start_pos[1]]
+        end = self.state_vectors[end_pos[0] * 8 + end_pos[1]]
+        joint = np.kron(end, start).reshape(SQUARE_STATE_DIM, 2, SQUARE_STATE_DIM // 2)
+
+        # ry(2 * arccos(sqrt(p))) on the start superposition qubit, whose
+        # cos and sin of half the angle are sqrt(p) and sqrt(1 - p). Python
+        # floats, so single-precision amplitudes are not promoted
+        c, s = math.sqrt(superposition_prob), math.sqrt(1 - superposition_prob)
+        off, on = joint[:, 0], joint[:, 1]
+        stay = c * off - s * on
+        joint[:, 1] = s * off + c * on
+        joint[:, 0] = stay
+
+        return joint.reshape(-1)[MOVE_PERMUTATION]
     
     def evaluate_position(self, measurements: Dict[Tuple[int, int], List[int]]) -> float:
         """
@@ -66,23 +272,15 @@ class QuantumChessEngine:
             Float value representing position strength
         """
         score = 0.0
-        piece_values = {
-            0b000: 0,    # Empty
-            0b001: 1,    # Pawn
-            0b010: 3,    # Knight
-            0b011: 3,    # Bishop
-            0b100: 5,    # Rook
-            0b101: 9,    # Queen
-            0b110: 100   # King
-        }
+        piece_values = _PIECE_VALUES
         
         for pos, measurement in measurements.items():
-            piece_type = int(''.join(map(str, measurement[:3])), 2)
+            piece_type = measurement[0] << 2 | measurement[1] << 1 | measurement[2]
             color = measurement[3]  # 0 for white, 1 for black
             is_superposition = measurement[4]
             
             # Calculate base piece value
-            value = piece_values.get(piece_type, 0)
+            value = piece_values[piece_type]
             if color == 1:  # If black piece
                 value = -value
                 
@@ -92,17 +290,20 @@ class QuantumChessEngine:
                 
             # Position-based adjustments
             row, col = pos
-            if piece_type == 0b001:  # Pawn
+            if piece_type == PAWN:
                 value += 0.1 * (row if color == 0 else 7 - row)  # Advance pawns
                 
             score += value
             
         return score
     
-    def quantum_minimax(self, depth: int, alpha: float = float('-inf'), 
-                       beta: float = float('inf'), maximizing: bool = True) -> Tuple[float, List[QuantumCircuit]]:
+    def quantum_minimax(self, depth: int, alpha: float = NEG_INF, 
+                       beta: float = POS_INF, maximizing: bool = True) -> Tuple[float, List[Tuple[Tuple[int, int], Tuple[int, int]]]]:
         """
         Quantum-aware minimax algorithm with alpha-beta pruning.
+
+        Moves are searched as (start_pos, end_pos) pairs applied to the
+        simulated state vectors; circuits are only built for the result.
         
         Args:
             depth: Current search depth
@@ -114,93 +315,272 @@ class QuantumChessEngine:
             Tuple of (position evaluation, best move sequence)
         """
         if depth == 0:
-            # Measure the quantum state and evaluate
-            measurements = self._measure_board()
-            return self.evaluate_position(measurements), []
+            # Measure the quantum state and evaluate, as arrays throughout
+            return self._evaluate_bits(self._measure_bits()), []
             
         best_moves = []
-        value = float('-inf') if maximizing else float('inf')
+        value = NEG_INF if maximizing else POS_INF
+        key = (self._codes_key(*self._piece_codes()), maximizing)
         
-        for move in self._generate_legal_moves(maximizing):
-            # Apply move
-            self._apply_move(move)
+        moves = self._order_moves(self._generate_legal_moves(maximizing), key, depth)
+        for move in moves:
+            undo = self._apply_move(*move)
             
             # Recursive evaluation
             eval_score, move_sequence = self.quantum_minimax(
                 depth - 1, alpha, beta, not maximizing)
             
-            # Undo move
-            self._undo_move(move)
+            self._undo_move(undo)
             
             if maximizing:
                 if eval_score > value:
                     value = eval_score
                     best_moves = [move] + move_sequence
-                alpha = max(alpha, value)
+                if value > alpha:
+                    alpha = value
             else:
                 if eval_score < value:
                     value = eval_score
                     best_moves = [move] + move_sequence
-                beta = min(beta, value)
+                if value < beta:
+                    beta = value
                 
             if beta <= alpha:
+                killers = self.killers.setdefault(depth, [])
+                if move not in killers:
+                    killers.insert(0, move)
+                    del killers[2:]
                 break
                 
+        if best_moves:
+            pv_table = self.pv_table
+            pv_table[key] = best_moves[0]
+            pv_table.move_to_end(key)
+            if len(pv_table) > PV_TABLE_SIZE:
+                pv_table.popitem(last=False)
         return value, best_moves
+
+    def _apply_move(self, start_pos: Tuple[int, int], end_pos: Tuple[int, int],
+                    superposition_prob: float = 0.5) -> Tuple:
+        """
+        Play a move on the state vectors, as create_move_circuit would.
+
+        Each of the two square registers keeps the marginal distribution
+        of the simulated joint state, which is all that per-square
+        measurement samples from. The piece is recorded as moved, so
+        _piece_codes sees it on end_pos. Returns the record _undo_move needs.
+        """
+        start = start_pos[0] * 8 + start_pos[1]
+        end = end_pos[0] * 8 + end_pos[1]
+        states = self.state_vectors
+        moved = self._moved_pieces
+        undo = (start, end, states[start].copy(), states[end].copy(),
+                moved.get(start), moved.get(end))
+        piece = moved.get(start)
+        if piece is None:
+            piece = int(np.abs(states[start]).argmax())
+        moved[start] = 0
+        moved[end] = piece
+        probs = np.abs(self.simulate_move(start_pos, end_pos, superposition_prob)) ** 2
+        # Joint index is end_state * 32 + start_state
+        probs = probs.reshape(SQUARE_STATE_DIM, SQUARE_STATE_DIM)
+        states[start] = np.sqrt(probs.sum(axis=0))
+        states[end] = np.sqrt(probs.sum(axis=1))
+        return undo
+
+    def _undo_move(self, undo: Tuple):
+        """Take back a move using the record returned by _apply_move."""
+        start, end, start_state, end_state, start_piece, end_piece = undo
+        self.state_vectors[start] = start_state
+        self.state_vectors[end] = end_state
+        moved = self._moved_pieces
+        for square, piece in ((start, start_piece), (end, end_piece)):
+            if piece is None:
+                moved.pop(square, None)
+            else:
+                moved[square] = piece
+
+    def _order_moves(self, moves: Tuple, key: Tuple, depth: int) -> List:
+        """
+        Order moves so alpha-beta cuts early: the stored principal variation
+        move first, then killer moves at this depth, then captures by most
+        valuable victim and least valuable attacker.
+        """
+        pv_move = self.pv_table.get(key)
+        killers = self.killers.get(depth, ())
+        types = self._piece_codes()[0].tolist()
+        values = PIECE_VALUES.tolist()
+
+        def priority(move):
+            (start_row, start_col), (end_row, end_col) = move
+            victim = values[types[end_row * 8 + end_col]]
+            attacker = values[types[start_row * 8 + start_col]]
+            return (move == pv_move, move in killers,
+                    victim, -attacker if victim else 0)
+
+        return sorted(moves, key=priority, reverse=True)
     
-    def find_best_move(self) -> QuantumCircuit:
+    def find_best_move(self) -> Optional[QuantumCircuit]:
         """
         Find the best move in the current position using quantum minimax.
         
         Returns:
-            QuantumCircuit representing the best move
+            QuantumCircuit representing the best move, or None without
+            legal moves
         """
-        _, move_sequence = self.quantum_minimax(self.search_depth)
-        return move_sequence[0] if move_sequence else None
+        # Iterative deepening: each shallower search seeds pv_table and
+        # killers, so the deeper one tries its best candidates first
+        move_sequence = []
+        for depth in range(1, self.search_depth + 1):
+            _, move_sequence = self.quantum_minimax(depth)
+        if not move_sequence:
+            return None
+        return self.create_move_circuit(*move_sequence[0])
     
     def _measure_board(self) -> Dict[Tuple[int, int], List[int]]:
         """
         Measure the quantum state of the entire board.
+
+        Samples one basis state per square directly from the cached state
+        vectors, all 64 squares in one NumPy pass.
         
         Returns:
             Dictionary mapping positions to measured qubit values
+            (element i is the value of qubit i)
         """
-        measurements = {}
-        for pos, qreg in self.quantum_board.items():
-            # Create measurement circuit
-            qc = QuantumCircuit(qreg, ClassicalRegister(5))
-            qc.measure_all()
-            
-            # Execute measurement
-            result = execute(qc, self.simulator, shots=1).result()
-            measurements[pos] = list(map(int, next(iter(result.get_counts()))))
-            
-        return measurements
+        return dict(zip(self.quantum_board, self._measure_bits().tolist()))
+
+    def _measure_bits(self) -> np.ndarray:
+        """
+        Measure every square register at once.
+
+        Returns:
+            (64, 5) array of measured qubit values, one row per square in
+            quantum_board order
+        """
+        probs = np.abs(self.state_vectors) ** 2
+        cdf = probs.cumsum(axis=1)
+        draws = np.random.rand(len(cdf), 1) * cdf[:, -1:]
+        outcomes = (cdf > draws).argmax(axis=1)
+        return (outcomes[:, None] >> _QUBIT_SHIFTS) & 1
+
+    @staticmethod
+    def _evaluate_bits(bits: np.ndarray) -> float:
+        """
+        evaluate_position over a full (64, 5) measurement array, scoring
+        all squares in one vectorized pass.
+        """
+        piece_types = bits[:, 0] << 2 | bits[:, 1] << 1 | bits[:, 2]
+        black = bits[:, 3] == 1
+        values = PIECE_VALUES[piece_types]
+        values = np.where(black, -values, values)
+        # Superposition pieces are more valuable
+        values = np.where(bits[:, 4] == 1, values * 1.5, values)
+        # Advance pawns
+        advance = np.where(black, 7 - SQUARE_ROWS, SQUARE_ROWS)
+        values += np.where(piece_types == 0b001, 0.1 * advance, 0.0)
+        return float(values.sum())
     
-    def _generate_legal_moves(self, for_white: bool) -> List[QuantumCircuit]:
+    def _generate_legal_moves(self, for_white: bool) -> Tuple[Tuple[Tuple[int, int], Tuple[int, int]], ...]:
         """
         Generate all legal moves in the current position.
+
+        Results are cached per piece placement and side, so transpositions
+        reached again during search reuse the list. Move circuits are built
+        by the caller, only for moves it actually expands.
         
         Args:
             for_white: Whether to generate moves for white pieces
             
         Returns:
-            List of quantum circuits representing legal moves
-        """
-        # Implementation would check quantum state possibilities
-        # and generate appropriate move circuits
-        # This is a simplified placeholder
-        moves = []
-        for start_row in range(8):
-            for start_col in range(8):
-                for end_row in range(8):
-                    for end_col in range(8):
-                        if self._is_legal_move((start_row, start_col), 
-                                            (end_row, end_col), for_white):
-                            moves.append(self.create_move_circuit(
-                                (start_row, start_col), (end_row, end_col)))
+            Tuple of (start_pos, end_pos) pairs for the legal moves
+        """
+        types, colors = self._piece_codes()
+        key = (self._codes_key(types, colors), for_white)
+        cache = self._legal_moves_cache
+        moves = cache.get(key)
+        if moves is not None:
+            cache.move_to_end(key)
+            return moves
+
+        # Walk only the side's pieces, using the precomputed move tables
+        color = 0 if for_white else 1
+        own = np.flatnonzero((types != 0) & (colors == color)).tolist()
+        types, colors = types.tolist(), colors.tolist()
+        candidates = []
+        for square in own:
+            piece = types[square]
+            if piece == PAWN:
+                targets = self._pawn_targets(square, color, types, colors)
+            elif piece == KNIGHT:
+                targets = [t for t in KNIGHT_MOVES[square]
+                           if not types[t] or colors[t] != color]
+            elif piece == KING:
+                targets = [t for t in KING_MOVES[square]
+                           if not types[t] or colors[t] != color]
+            else:
+                targets = []
+                for ray in SLIDER_RAYS[piece][square]:
+                    for t in ray:
+                        if not types[t]:
+                            targets.append(t)
+                            continue
+                        if colors[t] != color:
+                            targets.append(t)
+                        break
+            start_pos = divmod(square, 8)
+            candidates.extend((start_pos, divmod(t, 8)) for t in targets)
+
+        # _is_legal_move adds the quantum rules on top of piece movement
+        moves = tuple(
+            (start_pos, end_pos) for start_pos, end_pos in candidates
+            if self._is_legal_move(start_pos, end_pos, for_white)
+        )
+        cache[key] = moves
+        if len(cache) > LEGAL_MOVES_CACHE_SIZE:
+            cache.popitem(last=False)
         return moves
     
+    def _piece_codes(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Piece code and color per square (index row * 8 + col), read from
+        each register's most likely basis state, or the piece the search
+        moved there. Empty squares have code 0.
+        """
+        likely = np.abs(self.state_vectors).argmax(axis=1)
+        if self._moved_pieces:
+            likely[list(self._moved_pieces)] = list(self._moved_pieces.values())
+        types = (likely & 1) << 2 | ((likely >> 1) & 1) << 1 | (likely >> 2) & 1
+        colors = (likely >> 3) & 1
+        return types, colors
+
+    @staticmethod
+    def _codes_key(types: np.ndarray, colors: np.ndarray) -> bytes:
+        """
+        64-byte key of a board's piece codes (type | color << 3 per square),
+        for caches of results that depend only on the pieces.
+        """
+        return (types | colors << 3).astype(np.uint8).tobytes()
+
+    @staticmethod
+    def _pawn_targets(square: int, color: int, types: List[int],
+                      colors: List[int]) -> List[int]:
+        """Pushes and captures for a pawn of the given color."""
+        targets = []
+        row, col = divmod(square, 8)
+        step = PAWN_DIRECTIONS[color]
+        if 0 <= row + step < 8:
+            one = square + step * 8
+            if not types[one]:
+                targets.append(one)
+                two = one + step * 8
+                if row == PAWN_START_ROWS[color] and not types[two]:
+                    targets.append(two)
+        for t in PAWN_CAPTURES[color][square]:
+            if types[t] and colors[t] != color:
+                targets.append(t)
+        return targets
+
     def _is_legal_move(self, start_pos: Tuple[int, int], end_pos: Tuple[int, int], 
                       for_white: bool) -> bool:
         """
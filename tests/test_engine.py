@@ -4,3 +4,171 @@ def test_engine_initialization():
     engine = QuantumChessEngine(depth=2)
     assert engine.search_depth == 2
     assert engine.quantum_board is not None
+
+def test_engine_runs_without_building_registers():
+    engine = QuantumChessEngine(depth=2)
+    engine._evaluate_bits(engine._measure_bits())
+    engine._generate_legal_moves(True)
+    # Simulation and move generation never touch Qiskit
+    assert set(engine.quantum_board.values()) == {None}
+
+def test_measure_board_samples_state_vectors():
+    engine = QuantumChessEngine(depth=2)
+    engine.state_vectors[9] = 0
+    engine.state_vectors[9, 0b10011] = 1
+    measurements = engine._measure_board()
+    assert len(measurements) == 64
+    assert measurements[(1, 1)] == [1, 1, 0, 0, 1]
+    assert measurements[(0, 0)] == [0, 0, 0, 0, 0]
+
+def test_simulate_move_swaps_piece_when_control_set():
+    engine = QuantumChessEngine(depth=2)
+    engine.state_vectors[8] = 0
+    engine.state_vectors[8, 0b00011] = 1
+    # Probability 0 of staying put: the piece fully moves to the end square
+    joint = engine.simulate_move((1, 0), (2, 0), superposition_prob=0.0)
+    assert abs(joint[0b00011 * 32 + 0b10000]) == 1
+    # Otherwise it splits between both squares
+    joint = engine.simulate_move((1, 0), (2, 0), superposition_prob=0.25)
+    assert abs(abs(joint[0b00011]) ** 2 - 0.25) < 1e-6
+
+def test_legal_moves_cached_per_board_state():
+    engine = QuantumChessEngine(depth=2)
+    engine.state_vectors[1] = 0
+    engine.state_vectors[1, 0b00010] = 1  # white knight b1
+    moves = engine._generate_legal_moves(True)
+    assert moves and engine._generate_legal_moves(True) is moves
+    # Amplitude changes that keep the pieces share the entry
+    engine.state_vectors[1, 0b10010] = 0.1
+    assert engine._generate_legal_moves(True) is moves
+    engine.state_vectors[0] = 0
+    engine.state_vectors[0, 1] = 1
+    assert engine._generate_legal_moves(True) is not moves
+    assert all(len(key[0]) == 64 for key in engine._legal_moves_cache)
+
+def test_generated_moves_follow_piece_tables():
+    engine = QuantumChessEngine(depth=2)
+
+    def place(row, col, basis_state):
+        engine.state_vectors[row * 8 + col] = 0
+        engine.state_vectors[row * 8 + col, basis_state] = 1
+
+    place(0, 1, 0b00010)  # white knight b1
+    place(1, 4, 0b00100)  # white pawn e2
+    place(2, 3, 0b01100)  # black pawn d3
+    moves = set(engine._generate_legal_moves(True))
+    assert moves == {
+        ((0, 1), (2, 0)), ((0, 1), (2, 2)), ((0, 1), (1, 3)),
+        ((1, 4), (2, 4)), ((1, 4), (3, 4)), ((1, 4), (2, 3)),
+    }
+    assert set(engine._generate_legal_moves(False)) == {
+        ((2, 3), (1, 3)), ((2, 3), (1, 4)),
+    }
+
+def test_vectorized_evaluation_matches_evaluate_position():
+    import numpy as np
+    engine = QuantumChessEngine(depth=2)
+    bits = np.random.default_rng(0).integers(0, 2, size=(64, 5))
+    measurements = dict(zip(engine.quantum_board, bits.tolist()))
+    assert abs(engine._evaluate_bits(bits) - engine.evaluate_position(measurements)) < 1e-9
+
+def test_single_precision_state_keeps_norm():
+    import numpy as np
+    engine = QuantumChessEngine(depth=2)
+    assert engine.state_vectors.dtype == np.complex64
+    engine.state_vectors[8] = 0
+    engine.state_vectors[8, 0b00011] = 1
+    joint = engine.simulate_move((1, 0), (2, 0), superposition_prob=0.3)
+    assert joint.dtype == np.complex64
+    assert abs((np.abs(joint) ** 2).sum() - 1) < 1e-4
+    assert QuantumChessEngine(depth=2, precision="double").state_vectors.dtype == np.complex128
+
+def test_move_circuits_built_once_per_move():
+    import pytest
+    pytest.importorskip("qiskit")
+    engine = QuantumChessEngine(depth=2)
+    first = engine.create_move_circuit((1, 4), (3, 4), 0.5)
+    second = engine.create_move_circuit((1, 4), (3, 4), 0.5)
+    # Callers get independent copies of one cached template
+    assert first is not second
+    assert len(engine._move_circuit_cache) == 1
+    engine.create_move_circuit((1, 4), (3, 4), 0.25)
+    assert len(engine._move_circuit_cache) == 2
+    # Nearby probabilities get their own rotation, not a cached neighbour's
+    close = engine.create_move_circuit((1, 4), (3, 4), 0.50004)
+    assert len(engine._move_circuit_cache) == 3
+    assert close.data[0].operation.params != first.data[0].operation.params
+
+def test_move_ordering_tries_pv_killers_then_captures():
+    engine = QuantumChessEngine(depth=2)
+
+    def place(row, col, basis_state):
+        engine.state_vectors[row * 8 + col] = 0
+        engine.state_vectors[row * 8 + col, basis_state] = 1
+
+    place(0, 1, 0b00010)  # white knight b1
+    place(1, 4, 0b00100)  # white pawn e2
+    place(2, 3, 0b01101)  # black queen d3
+    place(2, 2, 0b01100)  # black pawn c3
+    moves = engine._generate_legal_moves(True)
+    key = (engine._codes_key(*engine._piece_codes()), True)
+    ordered = engine._order_moves(moves, key, 2)
+    # Pawn takes queen beats knight takes pawn; quiet moves come last
+    assert ordered[:2] == [((1, 4), (2, 3)), ((0, 1), (2, 2))]
+
+    engine.killers[2] = [((0, 1), (2, 0))]
+    engine.pv_table[key] = ((1, 4), (3, 4))
+    ordered = engine._order_moves(moves, key, 2)
+    assert ordered[:3] == [((1, 4), (3, 4)), ((0, 1), (2, 0)), ((1, 4), (2, 3))]
+
+def test_apply_and_undo_move_restore_state():
+    import numpy as np
+    engine = QuantumChessEngine(depth=2)
+    engine.setup_standard_position()
+    before = engine.state_vectors.copy()
+    undo = engine._apply_move((1, 4), (3, 4))
+    # The pawn's amplitude is now split between e2 and e4, norms kept
+    assert not np.array_equal(engine.state_vectors, before)
+    assert np.allclose(np.linalg.norm(engine.state_vectors, axis=1), 1, atol=1e-6)
+    engine._undo_move(undo)
+    assert np.array_equal(engine.state_vectors, before)
+
+def test_applied_move_changes_piece_codes():
+    import numpy as np
+    engine = QuantumChessEngine(depth=2)
+    engine.setup_standard_position()
+    types, colors = engine._piece_codes()
+    first = engine._apply_move((1, 4), (3, 4))
+    second = engine._apply_move((6, 3), (4, 3))
+    moved_types, _ = engine._piece_codes()
+    # Both pawns are read on their target squares, not tied at home
+    assert moved_types[12] == 0 and moved_types[28] == 1
+    assert moved_types[51] == 0 and moved_types[35] == 1
+    engine._undo_move(second)
+    engine._undo_move(first)
+    restored_types, restored_colors = engine._piece_codes()
+    assert np.array_equal(restored_types, types)
+    assert np.array_equal(restored_colors, colors)
+    assert engine._moved_pieces == {}
+
+def test_search_bounds_pv_table(monkeypatch):
+    import numpy as np
+    import quantum_chess_engine
+    monkeypatch.setattr(quantum_chess_engine, "PV_TABLE_SIZE", 4)
+    engine = QuantumChessEngine(depth=2)
+    engine.setup_standard_position()
+    before = engine.state_vectors.copy()
+    _, sequence = engine.quantum_minimax(2)
+    assert sequence[0] in engine._generate_legal_moves(True)
+    assert np.array_equal(engine.state_vectors, before)
+    assert 0 < len(engine.pv_table) <= 4
+    assert all(len(key[0]) == 64 for key in engine.pv_table)
+
+def test_find_best_move_from_initial_position():
+    import pytest
+    pytest.importorskip("qiskit")
+    engine = QuantumChessEngine(depth=2)
+    engine.setup_standard_position()
+    circuit = engine.find_best_move()
+    assert circuit is not None
+    assert len(circuit.data) == 5  # ry plus four controlled-SWAPs